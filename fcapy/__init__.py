@@ -19,5 +19,6 @@ PACKAGE_DESCRIPTION = {
     'numpy': "The package Uses C++ and vectorized matrix multiplication to speed up IntervalPS execution",
     'bitsets': "The package greatly optimizes BinTables execution",
     'networkx': "The package to convert POSets to Graphs and to visualize them as graphs",
+    'scipy': "The package is used to create a sparse FormalContext based on scipy.sparse matrix",
 }
 LIB_INSTALLED = check_installed_packages(PACKAGE_DESCRIPTION)
@@ -9,13 +9,18 @@ from fcapy.mvcontext.mvcontext import MVContext
 from fcapy.lattice.formal_concept import FormalConcept
 from fcapy.lattice.pattern_concept import PatternConcept
 from fcapy.utils import utils
+from fcapy import LIB_INSTALLED
+import heapq
+import json
 import random
-from copy import deepcopy
 import math
+import multiprocessing
+import os
+import time
 
 
 def close_by_one(context: MVContext, output_as_concepts=True, iterate_extents=None,
-                 initial_combinations=None, iter_elements_to_check=None):
+                 initial_combinations=None, iter_elements_to_check=None, n_jobs=1):
     """Return a list of concepts generated by CloseByOne (CbO) algorithm
 
     Parameters
@@ -33,6 +38,11 @@ def close_by_one(context: MVContext, output_as_concepts=True, iterate_extents=No
         Default value is empty list []
     iter_elements_to_check: `list` of `int`
         A list of attributes/objects indexes (depends on ``iterate_extents``) to run CbO algorithm on
+    n_jobs: `int`
+        A number of processes to run CbO in (-1 means the number of CPUs). Default value is 1.
+        The search tree is split into independent branches at its first levels.
+        The branches are processed by a pool of forked processes which share the context read-only.
+        The output does not depend on ``n_jobs``
 
     Returns
     -------
@@ -73,60 +83,547 @@ def close_by_one(context: MVContext, output_as_concepts=True, iterate_extents=No
 
     itersets_i_dict = {}
     sidesets_i = []
-    combinations_to_check = [[]] if initial_combinations is None else initial_combinations
-
-    while len(combinations_to_check) > 0:
-        comb_i = combinations_to_check.pop(0)
-        sideset_i = sideset_fnc(comb_i)
-        iterset_i = tuple(iterset_fnc(sideset_i))
-        iterset_i_new = sorted(set(iterset_i)-set(comb_i))
-
-        is_not_lexicographic = len(comb_i) > 0 and any([g_i < comb_i[-1] for g_i in iterset_i_new])
-        is_duplicate = iterset_i in itersets_i_dict
-        if any([is_not_lexicographic, is_duplicate]):
+    # The stack of combinations to check. The next combination to check is the last one
+    combinations_to_check = [[]] if initial_combinations is None else list(initial_combinations)[::-1]
+
+    n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+    if n_jobs < 1:
+        raise ValueError(f"close_by_one error. Only n_jobs>=1 or -1 are supported ({n_jobs} given)")
+    # Unfold the leftmost branches until there are enough independent subtrees to process in parallel
+    n_branches_min = math.inf if n_jobs == 1 else n_jobs * 4
+    while 0 < len(combinations_to_check) < n_branches_min:
+        comb_i = combinations_to_check.pop()
+        closure = _close_by_one_step(comb_i, iterset_fnc, sideset_fnc, iter_elements_to_check)
+        if closure is None or closure[0] in itersets_i_dict:
             continue
+        iterset_i, sideset_i, new_combs = closure
 
         itersets_i_dict[iterset_i] = len(sidesets_i)
         sidesets_i.append(sideset_i)
+        combinations_to_check.extend(new_combs[::-1])
 
-        iterset_i = list(iterset_i)
-
-        new_combs = []
-        for g_i in iter_elements_to_check:
-            if g_i not in iterset_i \
-                    and (len(comb_i) == 0 or g_i > comb_i[-1]):
-                new_combs.append(iterset_i+[g_i])
-        combinations_to_check = new_combs + combinations_to_check
+    if len(combinations_to_check) > 0:
+        for itersets_i_branch, sidesets_i_branch in _close_by_one_branches(
+                context, combinations_to_check[::-1], iterate_extents, iter_elements_to_check, n_jobs):
+            for iterset_i, sideset_i in zip(itersets_i_branch, sidesets_i_branch):
+                if iterset_i in itersets_i_dict:
+                    continue
+                itersets_i_dict[iterset_i] = len(sidesets_i)
+                sidesets_i.append(sideset_i)
 
-    itersets_i = list({idx: x_i for x_i, idx in itersets_i_dict.items()}.values())
+    itersets_i = list(itersets_i_dict)
 
     extents_i, intents_i = itersets_i, sidesets_i
     if not iterate_extents:
         extents_i, intents_i = intents_i, extents_i
 
     if output_as_concepts:
-        object_names = context.object_names
-        attribute_names = context.attribute_names
-        context_hash = context.hash_fixed()
-
-        concepts = []
-        for concept_data in zip(extents_i, intents_i):
-            extent_i, intent_i = concept_data
-            extent = [object_names[g_i] for g_i in extent_i]
-            if type(context) == FormalContext:
-                intent = [attribute_names[m_i] for m_i in intent_i]
-                concept = FormalConcept(extent_i, extent, intent_i, intent, context_hash=context_hash)
+        return _construct_concepts(context, extents_i, intents_i)
+
+    data = {'extents_i': extents_i, 'intents_i': intents_i}
+    return data
+
+
+def _close_by_one_step(comb_i, iterset_fnc, sideset_fnc, iter_elements_to_check):
+    """Close the combination ``comb_i`` and return (iterset_i, sideset_i, new_combs) or None if it is not canonical"""
+    sideset_i = sideset_fnc(comb_i)
+    iterset_i = tuple(iterset_fnc(sideset_i))
+    iterset_i_new = sorted(set(iterset_i) - set(comb_i))
+
+    is_not_lexicographic = len(comb_i) > 0 and any([g_i < comb_i[-1] for g_i in iterset_i_new])
+    if is_not_lexicographic:
+        return None
+
+    iterset_i_set = set(iterset_i)
+    new_combs = [list(iterset_i) + [g_i] for g_i in iter_elements_to_check
+                 if g_i not in iterset_i_set and (len(comb_i) == 0 or g_i > comb_i[-1])]
+    return iterset_i, sideset_i, new_combs
+
+
+# The context to run CbO branches on. Set in each worker process by _init_close_by_one_worker
+_WORKER_CONTEXT = None
+
+
+def _init_close_by_one_worker(context):
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = context
+
+
+def _close_by_one_worker(args):
+    """Run CbO on the branch of the search tree starting from a single combination (in a worker process)"""
+    comb_i, iterate_extents, iter_elements_to_check = args
+    data = close_by_one(_WORKER_CONTEXT, output_as_concepts=False, iterate_extents=iterate_extents,
+                        initial_combinations=[comb_i], iter_elements_to_check=iter_elements_to_check)
+    itersets_i, sidesets_i = data['extents_i'], data['intents_i']
+    if not iterate_extents:
+        itersets_i, sidesets_i = sidesets_i, itersets_i
+    return itersets_i, sidesets_i
+
+
+def _close_by_one_branches(context, combinations, iterate_extents, iter_elements_to_check, n_jobs):
+    """Run CbO on the branches starting from ``combinations`` in a pool of ``n_jobs`` processes
+
+    Return the pairs (itersets_i, sidesets_i) in the order of ``combinations``.
+    The context is inherited by the forked processes (or pickled once per process if 'fork' is not available)
+    """
+    start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+    tasks = [(comb_i, iterate_extents, iter_elements_to_check) for comb_i in combinations]
+    with multiprocessing.get_context(start_method).Pool(
+            min(n_jobs, len(tasks)), initializer=_init_close_by_one_worker, initargs=(context,)) as pool:
+        return pool.map(_close_by_one_worker, tasks, chunksize=1)
+
+
+def _construct_concepts(context: MVContext, extents_i, intents_i):
+    """Construct `FormalConcept` (or `PatternConcept`) objects from the given ``extents_i`` and ``intents_i``"""
+    context_hash = context.hash_fixed()
+    return [_construct_concept(context, extent_i, intent_i, context_hash)
+            for extent_i, intent_i in zip(extents_i, intents_i)]
+
+
+def _construct_concept(context: MVContext, extent_i, intent_i, context_hash):
+    """Construct a `FormalConcept` (or `PatternConcept`) object from the given ``extent_i`` and ``intent_i``"""
+    extent = [context.object_names[g_i] for g_i in extent_i]
+    if type(context) == FormalContext:
+        intent = [context.attribute_names[m_i] for m_i in intent_i]
+        return FormalConcept(extent_i, extent, intent_i, intent, context_hash=context_hash)
+
+    intent = {context.pattern_structures[ps_i].name: description for ps_i, description in intent_i.items()}
+    return PatternConcept(extent_i, extent, intent_i, intent, context.pattern_types, context_hash=context_hash)
+
+
+def iter_concepts(context: MVContext, iterate_extents=None, max_concepts=None, min_support=None, time_budget=None):
+    """Iterate the concepts of the ``context`` in the order of CloseByOne (CbO) algorithm
+
+    Unlike ``close_by_one`` function, the concepts are yielded as soon as they are found
+    and are not kept in memory. The canonicity test of CbO guarantees that each concept is yielded only once.
+
+    Parameters
+    ----------
+    context: `FormalContext` or `MVContext`
+        A context to iterate the concepts of
+    iterate_extents: `bool`
+        A flag whether to run CbO by iterating through subsets of objects (if set True) or of attributes (if set False)
+        By default it sets to False for `FormalContext` (so ``min_support`` can prune the search) and True otherwise
+    max_concepts: `int`
+        A maximal number of concepts to yield. Default value is None (no limit)
+    min_support: `int`
+        A minimal number of objects in the extent of a concept to yield. Default value is None (no limit).
+        If ``iterate_extents`` is False, the descendants of the unsupported concepts are not computed
+    time_budget: `float`
+        A number of seconds after which to stop the iteration. Default value is None (no limit)
+
+    Yields
+    ------
+    concept: `FormalConcept` or `PatternConcept`
+        A concept of class `FormalConcept` (if given context is of type `FormalContext`)
+        or `PatternConcept` (if given context is of type `MVContext`)
+
+    """
+    if iterate_extents is None:
+        iterate_extents = type(context) != FormalContext
+    if iterate_extents is False:
+        assert type(context) == FormalContext, "Can set iterate_extents=False only if FormalContext is given"
+
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+    context_hash = context.hash_fixed()
+
+    iterset_fnc, sideset_fnc = context.extension_i, context.intention_i
+    if not iterate_extents:
+        iterset_fnc, sideset_fnc = sideset_fnc, iterset_fnc
+    iter_elements_to_check = list(range(context.n_objects if iterate_extents else context.n_attributes))
+
+    n_concepts = 0
+    combinations_to_check = [[]]
+    while len(combinations_to_check) > 0:
+        if max_concepts is not None and n_concepts >= max_concepts:
+            return
+        if deadline is not None and time.monotonic() >= deadline:
+            return
+
+        comb_i = combinations_to_check.pop()
+        closure = _close_by_one_step(comb_i, iterset_fnc, sideset_fnc, iter_elements_to_check)
+        if closure is None:
+            continue
+        iterset_i, sideset_i, new_combs = closure
+
+        extent_i, intent_i = (iterset_i, sideset_i) if iterate_extents else (sideset_i, iterset_i)
+        if min_support is not None and len(extent_i) < min_support:
+            # The extents of the descendants are smaller if we iterate over attributes
+            if not iterate_extents:
+                continue
+        else:
+            n_concepts += 1
+            yield _construct_concept(context, extent_i, intent_i, context_hash)
+        combinations_to_check.extend(new_combs[::-1])
+
+
+def _get_elements_masks(context: FormalContext, iterate_extents):
+    """Return the bit masks of the descriptions of all the objects (if ``iterate_extents``) or of all the attributes
+
+    That is the masks of intents of single objects or the masks of extents of single attributes
+    """
+    n_elements = context.n_objects if iterate_extents else context.n_attributes
+    batch_fnc = context.intention_i_batch if iterate_extents else context.extension_i_batch
+    if LIB_INSTALLED['numpy']:
+        words = batch_fnc([[el_i] for el_i in range(n_elements)], packed=True)
+        return [int.from_bytes(row_words.tobytes(), 'little') for row_words in words]
+    return [utils.indexes_to_mask(sideset_i) for sideset_i in batch_fnc([[el_i] for el_i in range(n_elements)])]
+
+
+def _fast_close_by_one_masks(sideset_masks, n_iters, n_sides, min_sideset_size=0):
+    """Run FCbO on the bit masks of the elements descriptions and return the lists of sidesets and itersets masks
+
+    The branches with sidesets of less than ``min_sideset_size`` elements are pruned
+    (see the notation in ``close_by_one`` function)
+    """
+    iterset_full = (1 << n_iters) - 1
+
+    def close_sideset(sideset, iterset):
+        """Extend ``iterset`` by all the elements which descriptions contain the ``sideset``"""
+        for el_i, el_mask in enumerate(sideset_masks):
+            if not (iterset >> el_i) & 1 and sideset & el_mask == sideset:
+                iterset |= 1 << el_i
+        return iterset
+
+    sideset_top = (1 << n_sides) - 1
+    itersets, sidesets = [], []
+    # stack of (sideset, iterset, the first element to add, itersets of failed canonicity tests)
+    stack = [(sideset_top, close_sideset(sideset_top, 0), 0, [0] * n_iters)]
+    while len(stack) > 0:
+        sideset, iterset, el_start, failed_itersets = stack.pop()
+        sidesets.append(sideset)
+        itersets.append(iterset)
+        if iterset == iterset_full or el_start >= n_iters:
+            continue
+
+        failed_itersets = list(failed_itersets)
+        children = []
+        for el_i in range(el_start, n_iters):
+            if (iterset >> el_i) & 1:
+                continue
+            lower_mask = (1 << el_i) - 1
+            if failed_itersets[el_i] & lower_mask & ~iterset:
+                # the closure is a superset of the failed one. So it fails the canonicity test as well
+                continue
+
+            sideset_new = sideset & sideset_masks[el_i]
+            if min_sideset_size and bin(sideset_new).count('1') < min_sideset_size:
+                # the sidesets of the descendants are even smaller
+                continue
+            iterset_new = close_sideset(sideset_new, iterset | (1 << el_i))
+            if iterset_new & lower_mask == iterset & lower_mask:
+                children.append((sideset_new, iterset_new, el_i + 1))
             else:
-                intent = {context.pattern_structures[ps_i].name: description for ps_i, description in intent_i.items()}
-                concept = PatternConcept(extent_i, extent, intent_i, intent, context.pattern_types,
-                                         context_hash=context_hash)
-            concepts.append(concept)
-        return concepts
+                failed_itersets[el_i] = iterset_new
+
+        stack.extend([child + (failed_itersets,) for child in reversed(children)])
+
+    return sidesets, itersets
+
+
+def fast_close_by_one(context: FormalContext, output_as_concepts=True, iterate_extents=False):
+    """Return a list of concepts generated by Fast Close-by-One (FCbO) algorithm
+
+    FCbO is the version of CbO which keeps extents and intents as bit masks (python `int`).
+    If a new concept fails the canonicity test, its intent (extent) is passed down to the descendants.
+    Thus the descendants skip the closures which are sure to fail the test
+    (see "Outrata J., Vychodil V. Fast algorithm for computing fixpoints of Galois connections
+    induced by object-attribute relational data", 2012)
+
+    Parameters
+    ----------
+    context: `FormalContext`
+        A context to build a set of concepts on
+    output_as_concepts: `bool`
+        A flag whether to return a list of concepts as a list of `FormalConcept` objects (if set True)
+        or as a dictionary with concepts extents and intents
+    iterate_extents: `bool`
+        A flag whether to run FCbO by iterating through subsets of objects (if set True) or of attributes (if set False)
+
+    Returns
+    -------
+    ``data`` or ``concepts`` depends on ``output_as_concepts`` attribute
+    data: `dict`
+        A dictionary which contains a set of concepts extents and concepts intents
+    concepts: `list` of `FormalConcept`
+        A list of concepts of class `FormalConcept`
+
+    """
+    assert type(context) == FormalContext, 'fast_close_by_one: Only FormalContext is supported'
+
+    # <iterset> and <sideset> have the same meaning as in ``close_by_one`` function
+    n_iters = context.n_objects if iterate_extents else context.n_attributes
+    n_sides = context.n_attributes if iterate_extents else context.n_objects
+    sideset_masks = _get_elements_masks(context, iterate_extents)
+    sidesets, itersets = _fast_close_by_one_masks(sideset_masks, n_iters, n_sides)
+
+    extents_i = [utils.mask_to_indexes(sideset) for sideset in sidesets]
+    intents_i = [utils.mask_to_indexes(iterset) for iterset in itersets]
+    if iterate_extents:
+        extents_i, intents_i = intents_i, extents_i
+
+    if output_as_concepts:
+        return _construct_concepts(context, extents_i, intents_i)
 
     data = {'extents_i': extents_i, 'intents_i': intents_i}
     return data
 
 
+def iceberg_concepts(context: FormalContext, min_support, output_as_concepts=True):
+    """Return a list of frequent concepts (the iceberg lattice) generated by FCbO algorithm with support pruning
+
+    FCbO iterates through subsets of attributes, so the extents only shrink down the search tree.
+    Thus the whole branch is pruned once the support of its extent drops below ``min_support``.
+    The top and the bottom concepts are always returned to keep the output a lattice
+    (see "Stumme G. et al. Computing iceberg concept lattices with Titanic", 2002)
+
+    Parameters
+    ----------
+    context: `FormalContext`
+        A context to build a set of concepts on
+    min_support: `int` or `float`
+        A minimal number of objects in the extent of a concept (if given `int`)
+        or a minimal share of objects in the extent of a concept (if given `float` in [0, 1])
+    output_as_concepts: `bool`
+        A flag whether to return a list of concepts as a list of `FormalConcept` objects (if set True)
+        or as a dictionary with concepts extents and intents
+
+    Returns
+    -------
+    ``data`` or ``concepts`` depends on ``output_as_concepts`` attribute
+    data: `dict`
+        A dictionary which contains a set of concepts extents and concepts intents
+    concepts: `list` of `FormalConcept`
+        A list of concepts of class `FormalConcept`
+
+    """
+    assert type(context) == FormalContext, 'iceberg_concepts: Only FormalContext is supported'
+    if isinstance(min_support, float):
+        if not 0 <= min_support <= 1:
+            raise ValueError(f'iceberg_concepts error. Float min_support should be in [0, 1] ({min_support} given)')
+        min_support = math.ceil(min_support * context.n_objects)
+    if min_support < 0:
+        raise ValueError(f'iceberg_concepts error. min_support should be non-negative ({min_support} given)')
+
+    sideset_masks = _get_elements_masks(context, iterate_extents=False)
+    extents, intents = _fast_close_by_one_masks(sideset_masks, context.n_attributes, context.n_objects,
+                                                min_sideset_size=min_support)
+    extents_i = [utils.mask_to_indexes(extent) for extent in extents]
+    intents_i = [utils.mask_to_indexes(intent) for intent in intents]
+
+    # the bottom concept is pruned unless it is the top one as well
+    bottom_intent_i = list(range(context.n_attributes))
+    bottom_extent_i = list(context.extension_i(bottom_intent_i))
+    if len(bottom_extent_i) < min_support and intents_i[0] != bottom_intent_i:
+        extents_i.append(bottom_extent_i)
+        intents_i.append(bottom_intent_i)
+
+    if output_as_concepts:
+        return _construct_concepts(context, extents_i, intents_i)
+
+    data = {'extents_i': extents_i, 'intents_i': intents_i}
+    return data
+
+
+def in_close(context: FormalContext, output_as_concepts=True, iterate_extents=False):
+    """Return a list of concepts generated by In-Close2 algorithm
+
+    In-Close2 is the version of CbO which computes the intent of a concept incrementally:
+    the attributes which do not change the extent are added to the (partial) intent right away,
+    and the canonicity of a new extent is tested against the partial intent without computing the full closure.
+    The extents are intersected with the columns of the context packed into bit masks (python `int`)
+    (see "Andrews S. In-Close2, a high performance formal concept miner", 2011)
+
+    Parameters
+    ----------
+    context: `FormalContext`
+        A context to build a set of concepts on
+    output_as_concepts: `bool`
+        A flag whether to return a list of concepts as a list of `FormalConcept` objects (if set True)
+        or as a dictionary with concepts extents and intents
+    iterate_extents: `bool`
+        A flag whether to run In-Close by iterating through subsets of objects (if set True)
+        or of attributes (if set False)
+
+    Returns
+    -------
+    ``data`` or ``concepts`` depends on ``output_as_concepts`` attribute
+    data: `dict`
+        A dictionary which contains a set of concepts extents and concepts intents
+    concepts: `list` of `FormalConcept`
+        A list of concepts of class `FormalConcept`
+
+    """
+    assert type(context) == FormalContext, 'in_close: Only FormalContext is supported'
+
+    # <iterset> and <sideset> have the same meaning as in ``close_by_one`` function
+    n_iters = context.n_objects if iterate_extents else context.n_attributes
+    n_sides = context.n_attributes if iterate_extents else context.n_objects
+    sideset_masks = _get_elements_masks(context, iterate_extents)
+
+    def is_canonical(sideset, iterset, el_j):
+        """Check if no element before ``el_j`` (outside of ``iterset``) contains the ``sideset`` in its description"""
+        for el_i in range(el_j):
+            if not (iterset >> el_i) & 1 and sideset & sideset_masks[el_i] == sideset:
+                return False
+        return True
+
+    itersets, sidesets = [], []
+    # stack of (sideset, partial iterset, the first element to add)
+    stack = [((1 << n_sides) - 1, 0, 0)]
+    while len(stack) > 0:
+        sideset, iterset, el_start = stack.pop()
+
+        children = []
+        for el_j in range(el_start, n_iters):
+            if (iterset >> el_j) & 1:
+                continue
+            sideset_new = sideset & sideset_masks[el_j]
+            if sideset_new == sideset:
+                # the element does not change the sideset. So it belongs to the closed iterset
+                iterset |= 1 << el_j
+            elif is_canonical(sideset_new, iterset, el_j):
+                children.append((sideset_new, el_j))
+
+        sidesets.append(sideset)
+        itersets.append(iterset)
+        # the children inherit the iterset which is closed by now
+        stack.extend([(sideset_new, iterset | (1 << el_j), el_j + 1) for sideset_new, el_j in reversed(children)])
+
+    extents_i = [utils.mask_to_indexes(sideset) for sideset in sidesets]
+    intents_i = [utils.mask_to_indexes(iterset) for iterset in itersets]
+    if iterate_extents:
+        extents_i, intents_i = intents_i, extents_i
+
+    if output_as_concepts:
+        return _construct_concepts(context, extents_i, intents_i)
+
+    data = {'extents_i': extents_i, 'intents_i': intents_i}
+    return data
+
+
+def iter_next_closure(context: FormalContext, checkpoint_path=None, checkpoint_every=1000, resume=False):
+    """Iterate the concepts of the ``context`` in the lectic order of intents by Ganter's NextClosure algorithm
+
+    NextClosure needs only the current intent to compute the next one. So the state of the algorithm can be saved
+    into a checkpoint file every ``checkpoint_every`` concepts and the iteration can be resumed from this file later.
+    The checkpoint is written once the consumer asks for the next concept, so it covers only the consumed concepts
+    (see "Ganter B. Two basic algorithms in concept analysis", 1984)
+
+    Parameters
+    ----------
+    context: `FormalContext`
+        A context to iterate the concepts of
+    checkpoint_path: `str`
+        A path to a json file to save the checkpoints to (and to resume from). Default value is None (no checkpoints)
+    checkpoint_every: `int`
+        A number of concepts to yield between two checkpoints
+    resume: `bool`
+        A flag whether to resume the iteration from the checkpoint file at ``checkpoint_path`` (if it exists)
+
+    Yields
+    ------
+    concept: `FormalConcept`
+        A concept of the ``context`` (in the lectic order of intents)
+
+    """
+    assert type(context) == FormalContext, 'iter_next_closure: Only FormalContext is supported'
+    if checkpoint_every < 1:
+        raise ValueError(f'iter_next_closure error. checkpoint_every should be positive ({checkpoint_every} given)')
+
+    n_attributes = context.n_attributes
+    context_hash = context.hash_fixed()
+    extent_masks = _get_elements_masks(context, iterate_extents=False)
+    extent_full, intent_full = (1 << context.n_objects) - 1, (1 << n_attributes) - 1
+
+    def close_intent(intent):
+        """Return the extent and the closed intent of the ``intent``"""
+        extent = extent_full
+        for m_i in utils.mask_to_indexes(intent):
+            extent &= extent_masks[m_i]
+        intent = 0
+        for m_i, m_mask in enumerate(extent_masks):
+            if extent & m_mask == extent:
+                intent |= 1 << m_i
+        return extent, intent
+
+    def get_next_closure(intent):
+        """Return the lectically next closed intent after the ``intent`` (and its extent) or None"""
+        for m_i in reversed(range(n_attributes)):
+            if (intent >> m_i) & 1:
+                continue
+            lower_mask = (1 << m_i) - 1
+            extent_new, intent_new = close_intent((intent & lower_mask) | (1 << m_i))
+            if intent_new & lower_mask == intent & lower_mask:
+                return extent_new, intent_new
+        return None
+
+    def save_checkpoint(intent, n_concepts):
+        intent_i = utils.mask_to_indexes(intent) if intent is not None else None
+        checkpoint = {'context_hash': context_hash, 'intent_i': intent_i, 'n_concepts': n_concepts}
+        path_tmp = checkpoint_path + '.tmp'
+        with open(path_tmp, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(path_tmp, checkpoint_path)
+
+    n_concepts = 0
+    closure = close_intent(0)
+    if resume and checkpoint_path is not None and os.path.exists(checkpoint_path):
+        with open(checkpoint_path, 'r') as f:
+            checkpoint = json.load(f)
+        if checkpoint['context_hash'] != context_hash:
+            raise ValueError('iter_next_closure error. The checkpoint is made for another context')
+        n_concepts = checkpoint['n_concepts']
+        if checkpoint['intent_i'] is None:
+            return
+        closure = get_next_closure(utils.indexes_to_mask(checkpoint['intent_i']))
+
+    while closure is not None:
+        extent, intent = closure
+        yield _construct_concept(context, utils.mask_to_indexes(extent), utils.mask_to_indexes(intent), context_hash)
+        n_concepts += 1
+
+        closure = get_next_closure(intent) if intent != intent_full else None
+        if checkpoint_path is not None and (closure is None or n_concepts % checkpoint_every == 0):
+            save_checkpoint(intent if closure is not None else None, n_concepts)
+
+
+def next_closure(context: FormalContext, output_as_concepts=True, checkpoint_path=None, checkpoint_every=1000,
+                 resume=False):
+    """Return a list of concepts generated by NextClosure algorithm (in the lectic order of intents)
+
+    Parameters
+    ----------
+    context: `FormalContext`
+        A context to build a set of concepts on
+    output_as_concepts: `bool`
+        A flag whether to return a list of concepts as a list of `FormalConcept` objects (if set True)
+        or as a dictionary with concepts extents and intents
+    checkpoint_path: `str`
+        A path to a json file to save the checkpoints to (see ``iter_next_closure``)
+    checkpoint_every: `int`
+        A number of concepts to construct between two checkpoints
+    resume: `bool`
+        A flag whether to resume the construction from the checkpoint file at ``checkpoint_path``.
+        Only the concepts constructed after the checkpoint are returned
+
+    Returns
+    -------
+    ``data`` or ``concepts`` depends on ``output_as_concepts`` attribute
+    data: `dict`
+        A dictionary which contains a set of concepts extents and concepts intents
+    concepts: `list` of `FormalConcept`
+        A list of concepts of class `FormalConcept`
+
+    """
+    concepts = list(iter_next_closure(context, checkpoint_path, checkpoint_every, resume))
+    if output_as_concepts:
+        return concepts
+
+    data = {'extents_i': [list(c.extent_i) for c in concepts], 'intents_i': [list(c.intent_i) for c in concepts]}
+    return data
+
+
 def sofia_binary(context: MVContext, L_max=100, iterate_attributes=True, measure='LStab',
                  projection_sorting=None, proj_to_start=None, use_tqdm=False):
     """Return a lattice of the most interesting concepts generated by SOFIA algorithm. Optimized for `FormalContext`
@@ -166,6 +663,7 @@ def sofia_binary(context: MVContext, L_max=100, iterate_attributes=True, measure
 
     from fcapy.algorithms import lattice_construction as lca
     from fcapy.lattice import ConceptLattice
+    from fcapy.lattice import concept_measures as cms
 
     max_projection = context.n_attributes if iterate_attributes else context.n_objects
     projections_order = list(range(max_projection))
@@ -198,80 +696,224 @@ def sofia_binary(context: MVContext, L_max=100, iterate_attributes=True, measure
             "It should be either a measure_name: str"
             "or a pair of (measure_name: str, measure_func: c_i, lattice, context -> float)")
 
+    def project_context(projection_num):
+        # FormalContext is projected by a zero-copy view on its data
+        projection = projections_order[:projection_num]
+        if type(context) == FormalContext:
+            return context.view(attribute_indexes=projection) if iterate_attributes \
+                else context.view(object_indexes=projection)
+        return context[:, projection] if iterate_attributes else context[projection]
+
     proj_to_start = int(math.log2(L_max)) if proj_to_start is None else proj_to_start
-    if iterate_attributes:
-        ctx_projected = context[:, projections_order[:proj_to_start]]
-    else:
-        ctx_projected = context[projections_order[:proj_to_start]]
+    ctx_projected = project_context(proj_to_start)
     concepts = close_by_one(ctx_projected, output_as_concepts=True, iterate_extents=not iterate_attributes)
     subconcepts_dict = lca.complete_comparison(concepts)
     lattice = ConceptLattice(concepts, subconcepts_dict=subconcepts_dict)
 
-    # itersets - iteration sets - set of attributes or objects (depends on iterate_attributes)
-    itersets = [c.intent_i if iterate_attributes else c.extent_i for c in lattice.concepts]
+    # Stability bounds of a concept depend only on the sizes of its extent and the extents of its children.
+    # So they are recomputed only for the concepts whose children have changed
+    # and the concepts to prune are popped from a heap of measure values
+    is_incremental = measure_name in {'LStab', 'UStab'} \
+        and all([m in {'LStab', 'UStab', 'stability_bounds'} for m in measure])
+    measures_heap = _SofiaMeasuresHeap(measure_name)
 
     for projection_num in utils.safe_tqdm(range(proj_to_start+1, max_projection + 1),
                                           desc='SOFIA: Iterate projections', disable=not use_tqdm):
-        if iterate_attributes:
-            ctx_projected = context[:, projections_order[:projection_num]]
-        else:
-            ctx_projected = context[projections_order[:projection_num]]
-
-        new_concepts = close_by_one(
-            ctx_projected, output_as_concepts=True,
-            iterate_extents=not iterate_attributes,
-            initial_combinations=deepcopy(itersets),
-            iter_elements_to_check=[projection_num-1]
-        )
+        ctx_projected = project_context(projection_num)
+        ctx_projected_hash = ctx_projected.hash_fixed()
+        concepts_to_update, concepts_to_add = _sofia_projection_delta(
+            lattice, ctx_projected, projection_num-1, iterate_attributes, ctx_projected_hash)
 
         # make the concepts comparable
-        ctx_projected_hash = ctx_projected.hash_fixed()
         for c in lattice.concepts:
             c._context_hash = ctx_projected_hash
 
-        # concepts that were changed during projection iteration
-        concepts_delta = set(new_concepts) - set(lattice.concepts)
-        # find concepts which were just 'expanded' to the new projection:
-        # their "iterset" is changed but "sideset" is the same (see the notation described in close_by_one)
-        old_sidesets = {c.extent_i if iterate_attributes else c.intent_i: c_i
-                        for c_i, c in enumerate(lattice.concepts)}
-        concepts_delta_same_sidesets = {
-            c for c in concepts_delta
-            if (c.extent_i if iterate_attributes else c.intent_i) in old_sidesets}
-        for c in concepts_delta_same_sidesets:
-            sideset = c.extent_i if iterate_attributes else c.intent_i
-            c_i = old_sidesets[sideset]
-            lattice._update_element(lattice[c_i], c)
-
-        top_concept_i, bottom_concept_i = ConceptLattice.get_top_bottom_concepts_i(lattice.concepts)
-
-        # find completely new concepts created while projection iteration
-        # sort concepts to ensure there will be no moment with multiple top or bottom concepts
-        concepts_to_add = lattice.sort_concepts(concepts_delta - concepts_delta_same_sidesets)
-        if len(concepts_to_add) >= 2 and concepts_to_add[-1] < lattice.concepts[bottom_concept_i]:
-            concepts_to_add = [concepts_to_add[-1]] + concepts_to_add[:-1]
-        for c_i, c in enumerate(concepts_to_add):
+        grown_concepts_i = set()
+        for c_i, c in concepts_to_update:
+            c_old = lattice[c_i]
+            lattice._update_element(c_old, c)
+            c.measures.update(c_old.measures)
+            measures_heap.replace(c_old, c)
+            if len(c.extent_i) != len(c_old.extent_i):
+                grown_concepts_i.add(c_i)
+        for c in concepts_to_add:
             lattice.add_concept(c)
 
-        if len(lattice.concepts) > L_max:
+        if is_incremental:
+            for c_i in grown_concepts_i:
+                if any([d_i not in grown_concepts_i for d_i in lattice.direct_sub_elements(c_i)]):
+                    measures_heap.discard(lattice[c_i])
+            for c in concepts_to_add:
+                c_i = lattice.index(c)
+                for c_changed_i in [c_i] + list(lattice.direct_super_elements(c_i)):
+                    measures_heap.discard(lattice[c_changed_i])
+
+        if len(lattice.concepts) <= L_max:
+            continue
+
+        if not is_incremental:
             for m in measure:
                 lattice.calc_concepts_measures(m, ctx_projected)
 
-
             metrics = [c.measures[measure_name] for c_i, c in enumerate(lattice.concepts)]
             metrics_lim = sorted(metrics)[-L_max-1]
             concepts_to_remove = [i for i in range(len(lattice.concepts)) if metrics[i] <= metrics_lim][::-1]
             concepts_to_remove = [i for i in concepts_to_remove
                                   if i not in [lattice.top_concept_i, lattice.bottom_concept_i]]
-            for c_i in concepts_to_remove:
-                lattice.remove_concept(c_i)
+            lattice.remove_concept(concepts_to_remove)
+            continue
 
+        for c_i, c in enumerate(lattice.concepts):
+            if c not in measures_heap:
+                lb, ub = cms.stability_bounds(c_i, lattice)
+                c.measures['LStab'], c.measures['UStab'] = lb, ub
+                measures_heap.push(c)
+
+        extreme_concepts = [lattice.top_concept, lattice.bottom_concept]
+        concepts_to_remove = measures_heap.pop_smallest(len(lattice.concepts) - L_max)
+        concepts_to_remove_i = []
+        for c in concepts_to_remove:
+            if any([c is c_extreme for c_extreme in extreme_concepts]):
+                measures_heap.push(c)
+            else:
+                concepts_to_remove_i.append(lattice.index(c))
 
+        # the parents of the removed concepts get new children
+        for c_i in concepts_to_remove_i:
+            for parent_i in lattice.direct_super_elements(c_i):
+                measures_heap.discard(lattice[parent_i])
+        lattice.remove_concept(concepts_to_remove_i)
 
-        itersets = [c.intent_i if iterate_attributes else c.extent_i for c in lattice.concepts]
     return lattice
 
 
+class _SofiaMeasuresHeap:
+    """A min-heap of concepts keyed by the values of measure ``measure_name`` with lazy deletion
+
+    A concept is either in the heap (its measure value is up-to-date) or not (the value should be recomputed).
+    The outdated heap entries are skipped while popping and are dropped when the heap gets too big
+    """
+    def __init__(self, measure_name):
+        self._measure_name = measure_name
+        self._heap = []
+        self._entries = {}  # id(concept) -> the counter of its valid heap entry
+        self._counter = 0
+
+    def __contains__(self, concept):
+        return id(concept) in self._entries
+
+    def push(self, concept):
+        self._counter += 1
+        self._entries[id(concept)] = self._counter
+        heapq.heappush(self._heap, (concept.measures[self._measure_name], self._counter, concept))
+
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [entry for entry in self._heap if self._is_valid(entry)]
+            heapq.heapify(self._heap)
+
+    def discard(self, concept):
+        self._entries.pop(id(concept), None)
+
+    def replace(self, old_concept, new_concept):
+        """Replace ``old_concept`` by ``new_concept`` with the same measure value"""
+        if old_concept in self:
+            self.discard(old_concept)
+            self.push(new_concept)
+
+    def pop_smallest(self, n):
+        """Pop ``n`` concepts with the smallest measure values and all the concepts with the same value as the last one"""
+        popped = []
+        while self._heap:
+            entry = self._heap[0]
+            if not self._is_valid(entry):
+                heapq.heappop(self._heap)
+                continue
+            if len(popped) >= n and entry[0] > popped[-1][0]:
+                break
+            popped.append(heapq.heappop(self._heap))
+            self.discard(entry[2])
+        return [entry[2] for entry in popped]
+
+    def _is_valid(self, entry):
+        return self._entries.get(id(entry[2])) == entry[1]
+
+
+def _sofia_projection_delta(lattice, ctx_projected: MVContext, new_element_i, iterate_attributes, context_hash=None):
+    """Compute the changes of the ``lattice`` brought by the new attribute (or object) ``new_element_i``
+
+    The concepts which sidesets are described by the new element get it into their itersets
+    (see the notation described in close_by_one).
+    The sidesets of the other concepts intersected with the description of the new element give the new concepts.
+    The intersections and the checks are done with bit masks for `FormalContext`.
+    The hash of ``ctx_projected`` can be passed by ``context_hash`` when it is already computed
+
+    Returns
+    -------
+    concepts_to_update: `list` of (`int`, `FormalConcept` or `PatternConcept`)
+        The indexes of the concepts with the new element in their itersets and the updated concepts
+    concepts_to_add: `list` of `FormalConcept` or `PatternConcept`
+        The new concepts. The first one is the new bottom (top) concept if there is one.
+        So the concepts can be added to the lattice one by one
+
+    """
+    context_hash = ctx_projected.hash_fixed() if context_hash is None else context_hash
+
+    def get_sideset(c):
+        return c.extent_i if iterate_attributes else c.intent_i
+
+    def construct_concept(iterset_i, sideset_i):
+        extent_i, intent_i = (sideset_i, iterset_i) if iterate_attributes else (iterset_i, sideset_i)
+        return _construct_concept(ctx_projected, extent_i, intent_i, context_hash)
+
+    # the concept which sideset is the biggest is processed first
+    # since its intersection with the new element description gives the new bottom (top) concept
+    extreme_concept_i = lattice.bottom_concept_i if iterate_attributes else lattice.top_concept_i
+    concepts_order = [extreme_concept_i] + [c_i for c_i in range(len(lattice.concepts)) if c_i != extreme_concept_i]
+
+    concepts_to_update, new_sidesets = [], {}
+    if type(ctx_projected) == FormalContext:
+        description_fnc = ctx_projected.extension_i if iterate_attributes else ctx_projected.intention_i
+        closure_fnc = ctx_projected.intention_i if iterate_attributes else ctx_projected.extension_i
+        new_description = utils.indexes_to_mask(description_fnc([new_element_i]))
+        sidesets = [utils.indexes_to_mask(get_sideset(c)) for c in lattice.concepts]
+        closures = {}
+
+        for c_i in concepts_order:
+            c, sideset = lattice.concepts[c_i], sidesets[c_i]
+            iterset_i = (c.intent_i if iterate_attributes else c.extent_i) + (new_element_i,)
+            if sideset & new_description == sideset:
+                concepts_to_update.append((c_i, construct_concept(iterset_i, get_sideset(c))))
+                continue
+
+            sideset_new = sideset & new_description
+            if sideset_new in new_sidesets:
+                continue
+            if sideset_new not in closures:
+                closures[sideset_new] = closure_fnc(utils.mask_to_indexes(sideset_new))
+            # the closure should not add anything but the new element. Otherwise, the concept comes
+            # from another (possibly pruned) concept of the previous projection
+            if len(closures[sideset_new]) == len(iterset_i):
+                new_sidesets[sideset_new] = construct_concept(iterset_i, utils.mask_to_indexes(sideset_new))
+        return concepts_to_update, list(new_sidesets.values())
+
+    # MVContext. Only the objects can be iterated
+    concepts_to_extend = []
+    for c_i in concepts_order:
+        c = lattice.concepts[c_i]
+        if len(ctx_projected.extension_i(c.intent_i, base_objects_i=[new_element_i])) > 0:
+            concepts_to_update.append((c_i, construct_concept(c.extent_i + (new_element_i,), c.intent_i)))
+        else:
+            concepts_to_extend.append(c)
+
+    for c in concepts_to_extend:
+        intent_i = ctx_projected.intention_i(list(c.extent_i) + [new_element_i])
+        extent_i = ctx_projected.extension_i(intent_i)
+        extent_key = tuple(sorted(extent_i))
+        if len(extent_i) == len(c.extent_i) + 1 and extent_key not in new_sidesets:
+            new_sidesets[extent_key] = construct_concept(extent_i, intent_i)
+    return concepts_to_update, list(new_sidesets.values())
+
+
 def sofia_general(context: MVContext, L_max=100, measure='LStab', proj_to_start=None, use_tqdm=False):
     """Return a lattice of the most interesting concepts generated by SOFIA algorithm. Can work with any `MVContext`
 
@@ -378,9 +1020,9 @@ def random_forest_concepts(context: MVContext, rf_params=None, rf_class=None):
 
     object_names = context.object_names
     context_hash = context.hash_fixed()
-    for extent_i in extents_i:
+    intents_i = context.intention_i_batch(extents_i)
+    for extent_i, intent_i in zip(extents_i, intents_i):
         extent = [object_names[g_i] for g_i in extent_i]
-        intent_i = context.intention_i(extent_i)
         if type(context) == FormalContext:
             intent = [context.attribute_names[m_i] for m_i in intent_i]
             concept = FormalConcept(extent_i, extent, intent_i, intent, context_hash=context_hash)
@@ -397,6 +1039,10 @@ def lindig_algorithm(context: FormalContext, iterate_extents=None):
     """Get Concept Lattice from Formal Context using Lindig algorithm
     (https://www.researchgate.net/publication/2812391_Fast_Concept_Analysis)
 
+    The extents and intents are kept as bit masks (python `int`) and the concepts are indexed by their extent masks.
+    So the upper neighbours of a concept are computed by bitwise operations
+    and `FormalConcept` objects are constructed only once for each new concept
+
     Parameters
     ----------
     context: `FormalContext`
@@ -412,73 +1058,65 @@ def lindig_algorithm(context: FormalContext, iterate_extents=None):
 
     """
     from fcapy.lattice import ConceptLattice
-    
+
     if iterate_extents is None:
         iterate_extents = context.n_objects < context.n_attributes
-        
-    n_objects = context.n_objects
-    n_attributes = context.n_attributes
-    intention_i = context.intention_i
-    extension_i = context.extension_i
-    object_names = context.object_names
-    attribute_names = context.attribute_names
-    if not iterate_extents:
-        n_objects, n_attributes = n_attributes, n_objects
-        intention_i, extension_i = extension_i, intention_i
-        object_names, attribute_names = attribute_names, object_names
-    context_hash = context.hash_fixed()
-    
-    
-    def direct_super_elements(concept):
-        extent = set(concept.extent_i)
-        reps = set(range(n_objects)) - extent
-        neighbors = []
-        for g in set(reps):
-            extent.add(g)
-            M = intention_i(list(extent))
-            G = extension_i(M)
-            extent.remove(g)
-            if len(reps & set(G)) == 1:
-                neighbors.append(FormalConcept(G, [object_names[i] for i in G], 
-                                               M, [attribute_names[i] for i in M],
-                                               context_hash = context_hash))
+
+    # <iterset> and <sideset> have the same meaning as in ``close_by_one`` function
+    n_iters = context.n_objects if iterate_extents else context.n_attributes
+    n_sides = context.n_attributes if iterate_extents else context.n_objects
+    # the descriptions of the iterset elements and the "descriptions" of the sideset elements
+    iter_descriptions = _get_elements_masks(context, iterate_extents)
+    side_descriptions = _get_elements_masks(context, not iterate_extents)
+    iterset_full = (1 << n_iters) - 1
+
+    def close_sideset(sideset):
+        """Return the iterset described by the ``sideset``"""
+        iterset = iterset_full
+        for side_i in utils.mask_to_indexes(sideset):
+            iterset &= side_descriptions[side_i]
+        return iterset
+
+    def upper_neighbours(iterset, sideset):
+        """Return the pairs (iterset, sideset) of the upper neighbours of the concept (``iterset``, ``sideset``)"""
+        neighbours = []
+        candidates = iterset_full & ~iterset
+        for el_i in utils.mask_to_indexes(candidates):
+            sideset_new = sideset & iter_descriptions[el_i]
+            iterset_new = close_sideset(sideset_new)
+            if candidates & iterset_new == 1 << el_i:
+                neighbours.append((iterset_new, sideset_new))
             else:
-                reps.remove(g)
-        return neighbors
-    
-    M = list(range(n_attributes))
-    G = extension_i(M)
-    c = FormalConcept(G, [object_names[i] for i in G], 
-                      M, [attribute_names[i] for i in M],
-                      context_hash = context_hash)
-    
-    concepts = [c]
-    queue = {c}
-    subconcepts_dict = {}
-    superconcepts_dict = {}
-    
-    index = {c : 0}
-    
-    while len(queue) != 0:
-        c = queue.pop()
-        c_id = index[c]
-        for x in direct_super_elements(c):
-            if x not in index:
-                queue.add(x)
-                index[x] = len(concepts)
-                concepts.append(x)
-            x_id = index[x] 
-            
-            subconcepts_dict.setdefault(x_id, []).append(c_id)
-            superconcepts_dict.setdefault(c_id, []).append(x_id)
-
-            
+                candidates &= ~(1 << el_i)
+        return neighbours
+
+    sideset = (1 << n_sides) - 1
+    itersets, sidesets = [close_sideset(sideset)], [sideset]
+    index = {itersets[0]: 0}
+    subconcepts_dict, superconcepts_dict = {0: set()}, {0: set()}
+
+    stack = [0]
+    while len(stack) != 0:
+        c_i = stack.pop()
+        for iterset_new, sideset_new in upper_neighbours(itersets[c_i], sidesets[c_i]):
+            if iterset_new not in index:
+                index[iterset_new] = len(itersets)
+                itersets.append(iterset_new)
+                sidesets.append(sideset_new)
+                subconcepts_dict[index[iterset_new]], superconcepts_dict[index[iterset_new]] = set(), set()
+                stack.append(index[iterset_new])
+            x_i = index[iterset_new]
+
+            subconcepts_dict[x_i].add(c_i)
+            superconcepts_dict[c_i].add(x_i)
+
+    extents, intents = itersets, sidesets
     if not iterate_extents:
-        concepts = [FormalConcept(concepts[i].intent_i, concepts[i].intent,
-                                  concepts[i].extent_i, concepts[i].extent, 
-                                  context_hash = context_hash) 
-                    for i in range(len(concepts))]
+        extents, intents = intents, extents
         subconcepts_dict, superconcepts_dict = superconcepts_dict, subconcepts_dict
+    extents_i = [utils.mask_to_indexes(extent) for extent in extents]
+    intents_i = [utils.mask_to_indexes(intent) for intent in intents]
+    concepts = _construct_concepts(context, extents_i, intents_i)
 
     lattice = ConceptLattice(concepts, subconcepts_dict=subconcepts_dict, superconcepts_dict=superconcepts_dict)
-    return lattice
\ No newline at end of file
+    return lattice
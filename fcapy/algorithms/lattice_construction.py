@@ -8,7 +8,13 @@ and there is no other concept between these two.
 
 """
 from copy import deepcopy
+import multiprocessing
+import os
 from fcapy.utils import utils
+from fcapy import LIB_INSTALLED
+if LIB_INSTALLED['numpy']:
+    import numpy as np
+    from multiprocessing import shared_memory
 
 
 def complete_comparison(concepts, is_concepts_sorted=False, n_jobs=1, use_tqdm=False):
@@ -21,7 +27,7 @@ def complete_comparison(concepts, is_concepts_sorted=False, n_jobs=1, use_tqdm=F
     is_concepts_sorted: `bool`
         A flag whether the set of concepts is topologically sorted or it should be sorted inside the function
     n_jobs: `int`
-        A number of parallel jobs to run. WARNING: It is more efficient to run just one job for some reason
+        A number of parallel processes to run (see ``construct_lattice_parallel`` function)
     use_tqdm: `bool`
         A flag whether to visualize the progress of the algorithm with tqdm bar or not
 
@@ -32,6 +38,9 @@ def complete_comparison(concepts, is_concepts_sorted=False, n_jobs=1, use_tqdm=F
         (of type {`parent_concept_index`: `child_concept_index`})
 
     """
+    if n_jobs != 1 and LIB_INSTALLED['numpy']:
+        return construct_lattice_parallel(concepts, n_jobs=n_jobs)
+
     def get_subconcepts(a_i, a, concepts):
         subconcepts = set()
         for b_i, b in enumerate(concepts):
@@ -420,7 +429,7 @@ def construct_lattice_by_spanning_tree(concepts, is_concepts_sorted=False, n_job
     is_concepts_sorted: `bool`
         A flag whether the set of concepts is topologically sorted or it should be sorted inside the function
     n_jobs: `int`
-        A number of parallel jobs to run. WARNING: It is more efficient to run just one job for some reason
+        A number of parallel processes to run (see ``construct_lattice_parallel`` function)
     use_tqdm: `bool`
         A flag whether to visualize the progress of the algorithm with `tqdm` bar or not
 
@@ -431,6 +440,9 @@ def construct_lattice_by_spanning_tree(concepts, is_concepts_sorted=False, n_job
         (of type {`parent_concept_index`: `child_concept_index`})
 
     """
+    if n_jobs != 1 and LIB_INSTALLED['numpy']:
+        return construct_lattice_parallel(concepts, n_jobs=n_jobs)
+
     from fcapy.lattice import ConceptLattice
     subconcepts_st_dict, superconcepts_st_dict = \
         construct_spanning_tree(concepts, is_concepts_sorted=is_concepts_sorted)
@@ -444,6 +456,166 @@ def construct_lattice_by_spanning_tree(concepts, is_concepts_sorted=False, n_job
     return subconcepts_dict
 
 
+def construct_lattice_by_ipred(concepts, is_concepts_sorted=False, use_tqdm=False):
+    """Return a dict with subconcepts relation on given ``concepts``. Uses iPred algorithm on the extents bit masks
+
+    The concepts are visited from the smallest extents to the biggest ones.
+    The lower covers of a concept are found among the intersections of its extent with the extents
+    of the concepts with no upper covers found so far (the "border").
+    All the set operations are done with the extents packed into bit masks (python `int`)
+    (see "Baixeries J., Szathmary L., Valtchev P., Godin R. Yet a faster algorithm
+    for building the Hasse diagram of a concept lattice", 2009)
+
+    Parameters
+    ----------
+    concepts: `list` of `FormalConcept` or `PatternConcept`
+        A list of concepts to compare. The extents of the concepts should be closed under intersection
+        (as it is the case for the set of all the concepts of a context)
+    is_concepts_sorted: `bool`
+        A flag whether the set of concepts is topologically sorted or it should be sorted inside the function
+    use_tqdm: `bool`
+        A flag whether to visualize the progress of the algorithm with `tqdm` bar or not
+
+    Returns
+    -------
+    subconcepts_dict: `dict`
+        A dict of indexes with subconcept relation on the given concepts
+        (of type {`parent_concept_index`: `child_concept_index`})
+
+    """
+    extents = [utils.indexes_to_mask(c.extent_i) for c in concepts]
+    extent_index = {extent: c_i for c_i, extent in enumerate(extents)}
+    if len(extent_index) != len(extents):
+        raise ValueError('construct_lattice_by_ipred error. Some concepts have the same extents')
+
+    if is_concepts_sorted:
+        concepts_order = range(len(concepts) - 1, -1, -1)
+    else:
+        concepts_order = sorted(range(len(concepts)), key=lambda c_i: len(concepts[c_i].extent_i))
+
+    subconcepts_dict = {c_i: set() for c_i in range(len(concepts))}
+    faces = [0] * len(concepts)
+    border = set()
+    for c_i in utils.safe_tqdm(concepts_order, total=len(concepts),
+                               disable=not use_tqdm, desc='iPred covering relation construction'):
+        extent = extents[c_i]
+        for candidate in {extent & extents[border_i] for border_i in border}:
+            candidate_i = extent_index.get(candidate)
+            if candidate_i is None:
+                raise ValueError('construct_lattice_by_ipred error. '
+                                 'The extents of the concepts are not closed under intersection')
+
+            if faces[candidate_i] & extent == 0:
+                subconcepts_dict[c_i].add(candidate_i)
+                faces[candidate_i] |= extent & ~candidate
+                border.discard(candidate_i)
+        border.add(c_i)
+
+    return subconcepts_dict
+
+
+def construct_lattice_parallel(concepts, n_jobs=-1, n_chunks=None):
+    """Return a dict with subconcepts relation on given ``concepts``. Compares the concepts in a pool of processes
+
+    The extents of the concepts are packed into a matrix of `numpy.uint64` words put into shared memory.
+    The range of concepts is split into chunks which are processed by ``n_jobs`` worker processes.
+    For each concept a worker selects all its subconcepts by bitwise operations on the whole matrix,
+    and then takes the biggest remaining subconcept as a direct one and drops all of its subconcepts (until none left)
+
+    Parameters
+    ----------
+    concepts: `list` of `FormalConcept` or `PatternConcept`
+        A list of concepts to compare
+    n_jobs: `int`
+        A number of processes to run (-1 means the number of CPUs)
+    n_chunks: `int`
+        A number of chunks to split the concepts into. Defaults to 4 * ``n_jobs``
+
+    Returns
+    -------
+    subconcepts_dict: `dict`
+        A dict of indexes with subconcept relation on the given concepts
+        (of type {`parent_concept_index`: `child_concept_index`})
+
+    """
+    assert LIB_INSTALLED['numpy'], 'construct_lattice_parallel error. Numpy package should be installed'
+    n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+    if n_jobs < 1:
+        raise ValueError(f"construct_lattice_parallel error. Only n_jobs>=1 or -1 are supported ({n_jobs} given)")
+    n_chunks = n_jobs * 4 if n_chunks is None else n_chunks
+    if len(concepts) == 0:
+        return {}
+
+    n_objects = max([max(c.extent_i) + 1 for c in concepts if len(c.extent_i) > 0], default=0)
+    n_words = max((n_objects + 63) // 64, 1)
+    shape = (len(concepts), n_words)
+    supports = np.array([len(c.extent_i) for c in concepts], dtype=np.int64)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(shape[0] * shape[1] * 8, 1))
+    try:
+        extents = np.ndarray(shape, dtype=np.uint64, buffer=shm.buf)
+        for c_i, c in enumerate(concepts):
+            mask = utils.indexes_to_mask(c.extent_i)
+            extents[c_i] = np.frombuffer(mask.to_bytes(n_words * 8, 'little'), dtype=np.uint64)
+        del extents
+
+        bounds = np.linspace(0, len(concepts), min(n_chunks, len(concepts)) + 1).astype(int)
+        chunks = [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if start < stop]
+        if n_jobs == 1:
+            _init_cover_worker(shm.name, shape, supports)
+            subconcepts_dicts = [_cover_worker(chunk) for chunk in chunks]
+            _close_cover_worker()
+        else:
+            start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+            with multiprocessing.get_context(start_method).Pool(
+                    min(n_jobs, len(chunks)), initializer=_init_cover_worker,
+                    initargs=(shm.name, shape, supports)) as pool:
+                subconcepts_dicts = pool.map(_cover_worker, chunks, chunksize=1)
+    finally:
+        shm.close()
+        shm.unlink()
+
+    subconcepts_dict = {}
+    for subconcepts_dict_chunk in subconcepts_dicts:
+        subconcepts_dict.update(subconcepts_dict_chunk)
+    return subconcepts_dict
+
+
+# The shared memory with packed extents matrix and the supports of concepts. Set in each worker process
+_COVER_WORKER_DATA = {}
+
+
+def _init_cover_worker(shm_name, shape, supports):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _COVER_WORKER_DATA.update(
+        shm=shm, extents=np.ndarray(shape, dtype=np.uint64, buffer=shm.buf), supports=supports)
+
+
+def _close_cover_worker():
+    extents, shm = _COVER_WORKER_DATA.pop('extents'), _COVER_WORKER_DATA.pop('shm')
+    del extents
+    shm.close()
+
+
+def _cover_worker(chunk):
+    """Compute the direct subconcepts of the concepts in range ``chunk`` (in a worker process)"""
+    extents, supports = _COVER_WORKER_DATA['extents'], _COVER_WORKER_DATA['supports']
+    subconcepts_dict = {}
+    for c_i in range(*chunk):
+        is_subconcept = ~(extents & ~extents[c_i]).any(axis=1) & (supports < supports[c_i])
+        subconcepts_i = np.flatnonzero(is_subconcept)
+        subconcepts_i = subconcepts_i[np.argsort(-supports[subconcepts_i], kind='stable')]
+
+        direct_subconcepts_i = set()
+        while len(subconcepts_i) > 0:
+            # nothing left contains the biggest subconcept. So it is a direct one
+            subconcept_i, subconcepts_i = subconcepts_i[0], subconcepts_i[1:]
+            direct_subconcepts_i.add(int(subconcept_i))
+            subconcepts_i = subconcepts_i[(extents[subconcepts_i] & ~extents[subconcept_i]).any(axis=1)]
+        subconcepts_dict[c_i] = direct_subconcepts_i
+    return subconcepts_dict
+
+
 def add_concept(new_concept, concepts, subconcepts_dict, superconcepts_dict,
                 top_concept_i=None, bottom_concept_i=None,
                 inplace=True):
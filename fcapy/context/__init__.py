@@ -6,18 +6,22 @@ Classes
 -------
 formal_context.FormalContext
 bintable.BinTable
+bintable.BinTableNumpy
+bintable.BinTableSparse
+bintable.BinTableView
 
 Modules
 -------
   formal_context:
     Implements Formal Context class
   bintable:
-    Implements BinTable class
+    Implements BinTable class, its packed numpy version BinTableNumpy, sparse version BinTableSparse
+    and zero-copy view BinTableView
   converters:
     Contains function to read/write a FormalContext object from/to a file
 
 """
 
 from .formal_context import FormalContext
-from .bintable import BinTable
-from .converters import read_cxt, read_json, read_csv, from_pandas
+from .bintable import BinTable, BinTableNumpy, BinTableSparse, BinTableView
+from .converters import read_cxt, read_json, read_csv, read_bin, from_pandas
@@ -1,14 +1,21 @@
 """
 This module offers a class BinTable to work with binary table efficiently.
+And its versions with packed (BinTableNumpy) and sparse (BinTableSparse) data storage.
+Class BinTableView is a zero-copy view on some rows and columns of any BinTable.
 
 """
 from collections.abc import Iterable
 from numbers import Integral
-from fcapy.utils.utils import slice_list
+import zlib
+from fcapy.utils.utils import slice_list, combine_digests
 
 from fcapy import LIB_INSTALLED
 if LIB_INSTALLED['bitsets']:
     import bitsets
+if LIB_INSTALLED['numpy']:
+    import numpy as np
+if LIB_INSTALLED['scipy']:
+    import scipy.sparse
 
 
 class BinTable:
@@ -27,8 +34,25 @@ class BinTable:
         Return the maximal set of columns in which all rows (``row_indexes``) are True
     arrow_down(self, column_indexes, base_rows=None)
         Return the maximal set of rows in which all columns (``column_indexes``) are True
+    arrow_up_batch(self, list_of_row_indexes, packed=False)
+        Return the result of ``arrow_up`` for each set of rows from ``list_of_row_indexes``
+    arrow_down_batch(self, list_of_column_indexes, packed=False)
+        Return the result of ``arrow_down`` for each set of columns from ``list_of_column_indexes``
+    to_numpy(self, packed=False)
+        Return the data of the table as boolean `numpy.ndarray` (or as rows packed into `numpy.uint64` words)
+    hash_fixed(self)
+        Return the hash value of the BinTable which does not differ between sessions
+    append_rows(self, rows)
+        Append new ``rows`` to the bottom of the table
+    append_columns(self, columns)
+        Append new ``columns`` to the right of the table
 
     """
+    # cached adler32 digests (checksum, length) of the rows of the table and of the whole table.
+    # The digests are "open" i.e. computed without the closing bracket. So they can be extended by new elements
+    _row_digests = None
+    _digest_open = None
+
     def __init__(self, data=None):
         """Initialize the BinTable
 
@@ -47,6 +71,7 @@ class BinTable:
 
     @data.setter
     def data(self, value: list):
+        self._reset_digests()
         if value is None or value == []:
             self._data = []
             self._height = 0
@@ -79,7 +104,7 @@ class BinTable:
             self._column_members = bitsets.bitset('Columns', range(width)) if width > 0 else None
             if height > 0 and width > 0:
                 if is_bitset:
-                    self._data_rows = value
+                    self._data_rows = list(value)
                     self._data_columns = [self._row_members([idx for idx, row in enumerate(value) if j in row])
                                           for j in range(width)]
                 else:
@@ -90,7 +115,7 @@ class BinTable:
                 self._data_columns = value
             self._data = self._data_rows
         else:
-            self._data = value
+            self._data = list(value)
         self._height = height
         self._width = width
 
@@ -159,6 +184,7 @@ class BinTable:
                 return slc.stop-slc.start if isinstance(slc, slice) else len(slc)
             data._height = calc_slice_size(row_slice)
             data._width = calc_slice_size(column_slice)
+            self._inherit_row_digests(data, row_slice, column_slice)
 
         return data
 
@@ -179,18 +205,203 @@ class BinTable:
 
     def to_list(self):
         """Return BinTable data as a `list` of `list`"""
-        if LIB_INSTALLED['bitsets']:
+        if LIB_INSTALLED['bitsets'] and self._width > 0:
             list_data = [list(row.bools()) for row in self._data]
         else:
             list_data = self._data
 
         return list_data
 
+    def to_numpy(self, packed=False):
+        """Return BinTable data as a two dimensional `numpy.ndarray` of `bool`
+
+        Parameters
+        ----------
+        packed: `bool`
+            A flag whether to return the rows packed into little-endian `numpy.uint64` words
+            (of shape ``height`` x ceil(``width``/64)) instead of the boolean array
+
+        """
+        assert LIB_INSTALLED['numpy'], 'BinTable.to_numpy: Package "numpy" should be installed'
+        flags = np.array(self.to_list(), dtype=bool).reshape(self.shape)
+        return pack_bits(flags) if packed else flags
+
     def __eq__(self, other):
+        if type(self) != type(other):
+            # the tables keep their data in different formats
+            return self.shape == other.shape and self.to_list() == other.to_list()
         return self._data == other.data
 
     def __hash__(self):
-        return hash(tuple([tuple(row) for row in self._data]))
+        return hash((self.shape, self.hash_fixed()))
+
+    def hash_fixed(self):
+        """Hash value of the BinTable which does not differ between sessions
+
+        The value is the adler32 checksum of the string ``str(self.to_list())``.
+        It is combined from the checksums of the rows which are computed only once and are cached in the table
+        """
+        return self._get_digest()[0]
+
+    def _get_digest(self):
+        """Return the pair (adler32 checksum, length) of the string ``str(self.to_list())``"""
+        if self._digest_open is None:
+            self._digest_open = self._extend_digest(digest_bytes(b'['), 0, self._get_row_digests())
+        return combine_digests(self._digest_open, digest_bytes(b']'))
+
+    @staticmethod
+    def _extend_digest(digest_open, n_rows, row_digests):
+        """Extend the open digest of a table with ``n_rows`` rows by the open digests ``row_digests`` of new rows
+
+        An open digest is a digest of the string without its closing bracket (i.e. ``str(data)[:-1]``).
+        So it can be extended with new elements of the list
+        """
+        digests = [digest_open]
+        for row_i, row_digest in enumerate(row_digests, start=n_rows):
+            if row_i > 0:
+                digests.append(digest_bytes(b', '))
+            digests.extend([row_digest, digest_bytes(b']')])
+        return combine_digests(*digests)
+
+    def _get_row_digests(self):
+        """Return the list of pairs (adler32 checksum, length) of the strings ``str(row)[:-1]`` for every row"""
+        if self._row_digests is None:
+            self._row_digests = [digest_bytes(row_bytes[:-1]) for row_bytes in self._iter_rows_bytes()]
+        return self._row_digests
+
+    def _iter_rows_bytes(self, start=0):
+        """Iterate over the rows of the table (starting from the row ``start``) encoded into bytes as ``str(row)``"""
+        is_bitset = LIB_INSTALLED['bitsets'] and self._width > 0
+        for row_i in range(start, self._height):
+            row = self._data[row_i].bools() if is_bitset else self._data[row_i]
+            yield str(list(row)).encode()
+
+    def _reset_digests(self):
+        """Drop the cached digests. Should be called every time the data of the table is changed"""
+        self._row_digests, self._digest_open = None, None
+
+    def _inherit_row_digests(self, table, row_slice, column_slice):
+        """Pass cached digests of ``row_slice`` rows to the ``table`` sliced from this one if it keeps all the columns"""
+        if self._row_digests is None:
+            return
+        columns = range(self._width)
+        columns_sliced = columns[column_slice] if isinstance(column_slice, slice) else column_slice
+        if list(columns_sliced) == list(columns):
+            table._row_digests = slice_list(self._row_digests, row_slice)
+
+    def append_rows(self, rows):
+        """Append new ``rows`` to the bottom of the table
+
+        The indexes of the existing rows and columns stay valid.
+        The cached digests of the table are updated with the digests of the new rows only.
+        If bitsets package is installed, the bitset class of rows and the bitsets of all the columns
+        are rebuilt on every call. Use `BinTableNumpy` or `BinTableSparse` to append the rows in amortized time
+
+        Parameters
+        ----------
+        rows: `list` of `list` of `bool` or `numpy.ndarray` of `bool`
+            New rows of the table. Each row should be of length ``width`` (unless the table is empty)
+
+        """
+        height_old = self._height
+        row_digests, digest_open = self._row_digests, self._digest_open
+        self._append_rows_data(rows)
+
+        self._row_digests, self._digest_open = None, None
+        if row_digests is not None:
+            new_row_digests = [digest_bytes(row_bytes[:-1]) for row_bytes in self._iter_rows_bytes(height_old)]
+            row_digests.extend(new_row_digests)
+            self._row_digests = row_digests
+            if digest_open is not None:
+                self._digest_open = self._extend_digest(digest_open, height_old, new_row_digests)
+
+    def append_columns(self, columns):
+        """Append new ``columns`` to the right of the table
+
+        The indexes of the existing rows and columns stay valid.
+        The cached digests of the rows are extended with the digests of the new cells only.
+        If bitsets package is installed, the bitset class of columns and the bitsets of all the rows
+        are rebuilt on every call. Use `BinTableNumpy` or `BinTableSparse` to append the columns in amortized time
+
+        Parameters
+        ----------
+        columns: `list` of `list` of `bool` or `numpy.ndarray` of `bool`
+            The values of the new columns given row by row (i.e. a table of shape ``height`` x n_new_columns)
+
+        """
+        width_old = self._width
+        row_digests = self._row_digests
+        self._append_columns_data(columns)
+
+        self._row_digests, self._digest_open = None, None
+        if row_digests is not None and self._width > width_old:
+            separator = b', ' if width_old > 0 else b''
+            new_cells_bytes = [separator + b', '.join([b'True' if v else b'False' for v in row]) for row in columns]
+            self._row_digests = [combine_digests(row_digest, digest_bytes(cells_bytes))
+                                 for row_digest, cells_bytes in zip(row_digests, new_cells_bytes)]
+        elif row_digests is not None:
+            self._row_digests = row_digests
+
+    def _append_rows_data(self, rows):
+        """Add new ``rows`` to the stored data (the digests are updated by ``append_rows``)"""
+        rows = rows.tolist() if hasattr(rows, 'tolist') else [list(row) for row in rows]
+        if self._height == 0 and self._width == 0:
+            self.data = rows
+            return
+
+        for row in rows:
+            assert len(row) == self._width, 'BinTable.append_rows: All rows should have the same length as the table'
+            assert all(type(v) == bool for v in row), 'BinTable.append_rows: Rows should consist only of boolean values'
+        if len(rows) == 0:
+            return
+
+        if self._height == 0 or self._width == 0:
+            self.data = [[] for _ in range(self._height)] + rows if self._width == 0 else rows
+            return
+
+        if LIB_INSTALLED['bitsets']:
+            row_members = bitsets.bitset('Rows', range(self._height + len(rows)))
+            columns_ints = [int(column) for column in self._data_columns]
+            for row_i, row in enumerate(rows, start=self._height):
+                for column_i, v in enumerate(row):
+                    if v:
+                        columns_ints[column_i] |= 1 << row_i
+            self._data_rows.extend([self._column_members.frombools(row) for row in rows])
+            self._data_columns = [row_members.fromint(column_int) for column_int in columns_ints]
+            self._row_members = row_members
+            self._data = self._data_rows
+        else:
+            self._data.extend(rows)
+        self._height += len(rows)
+
+    def _append_columns_data(self, columns):
+        """Add new ``columns`` (given row by row) to the stored data (the digests are updated by ``append_columns``)"""
+        columns = columns.tolist() if hasattr(columns, 'tolist') else [list(row) for row in columns]
+        assert len(columns) == self._height,\
+            'BinTable.append_columns: The number of rows in "columns" should match the height of the table'
+        n_new = len(columns[0]) if len(columns) > 0 else 0
+        for row in columns:
+            assert len(row) == n_new, 'BinTable.append_columns: All rows of "columns" should have the same length'
+            assert all(type(v) == bool for v in row),\
+                'BinTable.append_columns: "columns" should consist only of boolean values'
+        if n_new == 0:
+            return
+
+        if self._width == 0:
+            self.data = columns
+        elif LIB_INSTALLED['bitsets']:
+            column_members = bitsets.bitset('Columns', range(self._width + n_new))
+            self._data_rows = [
+                column_members.fromint(int(row) | sum(1 << j for j, v in enumerate(new_row, self._width) if v))
+                for row, new_row in zip(self._data_rows, columns)
+            ]
+            self._data_columns.extend([self._row_members.frombools(column) for column in zip(*columns)])
+            self._column_members = column_members
+            self._data = self._data_rows
+            self._width += n_new
+        else:
+            self._data = [row + new_row for row, new_row in zip(self._data, columns)]
+            self._width += n_new
 
     def all(self, axis=None):
         """Return whether all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2) are True"""
@@ -333,3 +544,952 @@ class BinTable:
                     break
 
         return rows
+
+    def arrow_up_batch(self, list_of_row_indexes, packed=False):
+        """Return the maximal sets of columns in which all rows of each set from ``list_of_row_indexes`` are True
+
+        Parameters
+        ----------
+        list_of_row_indexes: `list` of `list` of `int`
+            Sets of indexes of rows to compute ``arrow_up`` for
+        packed: `bool`
+            A flag whether to return the bit-matrix packed into `numpy.uint64` words
+            (of shape len(``list_of_row_indexes``) x ceil(``width``/64)) instead of the list of columns indexes
+
+        Returns
+        -------
+        columns_batch: `list` of `list` of `int` or `numpy.ndarray` of `numpy.uint64`
+            Indexes of columns for each set of rows (or the packed bit-matrix if ``packed`` is True)
+
+        """
+        columns_batch = [list(self.arrow_up(row_indexes)) for row_indexes in list_of_row_indexes]
+        if packed:
+            columns_batch = pack_indexes_batch(columns_batch, self._width)
+        return columns_batch
+
+    def arrow_down_batch(self, list_of_column_indexes, packed=False):
+        """Return the maximal sets of rows in which all columns of each set from ``list_of_column_indexes`` are True
+
+        Parameters
+        ----------
+        list_of_column_indexes: `list` of `list` of `int`
+            Sets of indexes of columns to compute ``arrow_down`` for
+        packed: `bool`
+            A flag whether to return the bit-matrix packed into `numpy.uint64` words
+            (of shape len(``list_of_column_indexes``) x ceil(``height``/64)) instead of the list of rows indexes
+
+        Returns
+        -------
+        rows_batch: `list` of `list` of `int` or `numpy.ndarray` of `numpy.uint64`
+            Indexes of rows for each set of columns (or the packed bit-matrix if ``packed`` is True)
+
+        """
+        rows_batch = [list(self.arrow_down(column_indexes)) for column_indexes in list_of_column_indexes]
+        if packed:
+            rows_batch = pack_indexes_batch(rows_batch, self._height)
+        return rows_batch
+
+
+class BinTableNumpy(BinTable):
+    """
+    A BinTable which keeps its rows and columns packed into `numpy.uint64` words
+
+    Each row of the table is packed into ceil(``width``/64) words (and each column into ceil(``height``/64) words).
+    Thus the closure of k rows (``arrow_up``) is a single ``numpy.bitwise_and.reduce`` over a 2D array of words
+    and the supports of rows and columns (``sum``) are the popcounts of these words.
+
+    Methods
+    -------
+    all(self, axis=None)
+        Return whether all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2) are True
+    any(self, axis=None)
+        Return whether any element (``axis`` =0), row in columns (``axis`` =1), column in rows (``axis`` =2) is True
+    sum(self, axis=None)
+        Return sum of all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2)
+    arrow_up(self, row_indexes, base_columns=None)
+        Return the maximal set of columns in which all rows (``row_indexes``) are True
+    arrow_down(self, column_indexes, base_rows=None)
+        Return the maximal set of rows in which all columns (``column_indexes``) are True
+    arrow_up_batch(self, list_of_row_indexes, packed=False)
+        Return the result of ``arrow_up`` for each set of rows from ``list_of_row_indexes``
+    arrow_down_batch(self, list_of_column_indexes, packed=False)
+        Return the result of ``arrow_down`` for each set of columns from ``list_of_column_indexes``
+    to_numpy(self, packed=False)
+        Return the data of the table as boolean `numpy.ndarray` (or as rows packed into `numpy.uint64` words)
+    hash_fixed(self)
+        Return the hash value of the BinTable which does not differ between sessions
+    append_rows(self, rows)
+        Append new ``rows`` to the bottom of the table
+    append_columns(self, columns)
+        Append new ``columns`` to the right of the table
+
+    """
+    WORD_SIZE = 64
+    BATCH_SIZE = 2**22
+
+    # buffers with spare capacity for appended rows and columns (``_data`` and ``_data_columns`` are their views)
+    _rows_buffer = None
+    _columns_buffer = None
+    # cached supports of rows and columns (i.e. ``sum(axis=1)`` and ``sum(axis=0)``)
+    _row_supports = None
+    _column_supports = None
+
+    def __init__(self, data=None):
+        """Initialize the BinTableNumpy
+
+        Parameters
+        ----------
+        data: `list` of `list` of `bool` or `numpy.ndarray` of `bool`
+            Data for the BinTable to store
+
+        """
+        assert LIB_INSTALLED['numpy'], 'BinTableNumpy.__init__: Package "numpy" should be installed'
+        super(BinTableNumpy, self).__init__(data)
+
+    @property
+    def data(self):
+        """Data for the BinTable to store (rows of the table packed into `numpy.uint64` words)"""
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._reset_digests()
+        if value is None or len(value) == 0:
+            value = np.zeros((0, 0), dtype=bool)
+
+        if isinstance(value, list):
+            assert len({len(row) for row in value}) == 1, \
+                'BinTableNumpy.data.setter: All rows of the "value" should have the same length'
+        value = to_bool_array(value, 0)
+        assert value.ndim == 2, 'BinTableNumpy.data.setter: "value" should be a two dimensional array'
+        assert value.dtype == bool, 'BinTableNumpy.data.setter: "Value" should consist only of boolean number'
+
+        self._height, self._width = value.shape
+        self._data = pack_bits(value)
+        self._data_columns = pack_bits(value.T)
+        self._rows_buffer, self._columns_buffer = None, None
+        self._row_supports, self._column_supports = None, None
+
+    @classmethod
+    def from_packed(cls, rows_words, columns_words, shape):
+        """Construct the BinTableNumpy from already packed rows and columns words without copying them
+
+        Parameters
+        ----------
+        rows_words: `numpy.ndarray` of `numpy.uint64`
+            Rows of the table packed into words, of shape ``height`` x ceil(``width``/64)
+        columns_words: `numpy.ndarray` of `numpy.uint64`
+            Columns of the table packed into words, of shape ``width`` x ceil(``height``/64)
+        shape: `tuple` of `int`
+            The shape (``height``, ``width``) of the table
+
+        Returns
+        -------
+        bintable: `BinTableNumpy`
+            The table which stores the given arrays (e.g. `numpy.memmap` arrays) as is
+
+        """
+        height, width = shape
+        assert rows_words.shape == (height, -(-width // cls.WORD_SIZE)),\
+            'BinTableNumpy.from_packed: The shape of "rows_words" does not match the "shape" of the table'
+        assert columns_words.shape == (width, -(-height // cls.WORD_SIZE)),\
+            'BinTableNumpy.from_packed: The shape of "columns_words" does not match the "shape" of the table'
+
+        bintable = cls.__new__(cls)
+        bintable._height, bintable._width = height, width
+        bintable._data, bintable._data_columns = rows_words, columns_words
+        return bintable
+
+    @classmethod
+    def from_packed_rows(cls, rows_words, width):
+        """Construct the BinTableNumpy from packed ``rows_words`` of a table with ``width`` columns
+
+        The packed columns are computed by blocks of rows. So the table is never fully unpacked into memory.
+
+        """
+        height = len(rows_words)
+        columns_words = np.zeros((width, -(-height // cls.WORD_SIZE)), dtype='<u8')
+        block_size = cls.WORD_SIZE * max(1, cls.BATCH_SIZE // max(1, cls.WORD_SIZE * width))
+        for start in range(0, height, block_size):
+            block = unpack_bits(rows_words[start:start + block_size], width)
+            word_start = start // cls.WORD_SIZE
+            block_words = pack_bits(block.T)
+            columns_words[:, word_start:word_start + block_words.shape[1]] = block_words
+        return cls.from_packed(rows_words, columns_words, (height, width))
+
+    def _unpack(self, row_indexes=slice(None)):
+        """Return the rows ``row_indexes`` of the table as a two dimensional `numpy.ndarray` of `bool`"""
+        return unpack_bits(self._data[row_indexes], self._width)
+
+    def _append_rows_data(self, rows):
+        """Add new ``rows`` to the packed buffers (their capacity is doubled when exceeded)"""
+        rows = to_bool_array(rows, self._width)
+        if self._height == 0 and self._width == 0:
+            self.data = rows
+            return
+
+        assert rows.ndim == 2 and rows.shape[1] == self._width,\
+            'BinTableNumpy.append_rows: All rows should have the same length as the table'
+        assert rows.dtype == bool, 'BinTableNumpy.append_rows: Rows should consist only of boolean values'
+
+        self._rows_buffer, self._columns_buffer = self._append_words(
+            self._data, self._rows_buffer, self._data_columns, self._columns_buffer, self._height, self._width, rows)
+        if self._row_supports is not None:
+            self._row_supports = np.concatenate([self._row_supports, rows.sum(axis=1)])
+        if self._column_supports is not None:
+            self._column_supports += rows.sum(axis=0)
+        self._height += len(rows)
+        self._set_views()
+
+    def _append_columns_data(self, columns):
+        """Add new ``columns`` (given row by row) to the packed buffers (their capacity is doubled when exceeded)"""
+        columns = to_bool_array(columns, 0)
+        assert columns.ndim == 2 and columns.shape[0] == self._height,\
+            'BinTableNumpy.append_columns: The number of rows in "columns" should match the height of the table'
+        assert columns.dtype == bool, 'BinTableNumpy.append_columns: "columns" should consist only of boolean values'
+
+        self._columns_buffer, self._rows_buffer = self._append_words(
+            self._data_columns, self._columns_buffer, self._data, self._rows_buffer, self._width, self._height,
+            columns.T)
+        if self._column_supports is not None:
+            self._column_supports = np.concatenate([self._column_supports, columns.sum(axis=0)])
+        if self._row_supports is not None:
+            self._row_supports += columns.sum(axis=1)
+        self._width += columns.shape[1]
+        self._set_views()
+
+    @classmethod
+    def _append_words(cls, major_words, major_buffer, minor_words, minor_buffer, n_major, n_minor, block):
+        """Append the ``block`` of new rows (or columns) to the packed majors and set their bits in the packed minors
+
+        Only the last ceil(len(``block``)/64)+1 words of every minor (column or row) are repacked.
+        The buffers which are not allocated yet (or are too small) are reallocated with a doubled capacity
+        """
+        n_new, n_minor_words = len(block), -(-n_minor // cls.WORD_SIZE)
+        major_buffer = cls._reserve(major_buffer, major_words, (n_major + n_new, n_minor_words))
+        major_buffer[n_major:n_major + n_new, :n_minor_words] = pack_bits(block)
+
+        minor_buffer = cls._reserve(minor_buffer, minor_words, (n_minor, -(-(n_major + n_new) // cls.WORD_SIZE)))
+        start = n_major - n_major % cls.WORD_SIZE
+        tail_words = pack_bits(unpack_bits(major_buffer[start:n_major + n_new, :n_minor_words], n_minor).T)
+        word_start = start // cls.WORD_SIZE
+        minor_buffer[:n_minor, word_start:word_start + tail_words.shape[1]] = tail_words
+        return major_buffer, minor_buffer
+
+    @staticmethod
+    def _reserve(buffer, words, shape):
+        """Return the ``buffer`` if it fits the ``shape``. Otherwise return a new buffer of doubled size with ``words``
+
+        The ``buffer`` is None when the ``words`` are not owned by the table (e.g. they are memory-mapped)
+        """
+        if buffer is not None and buffer.shape[0] >= shape[0] and buffer.shape[1] >= shape[1]:
+            return buffer
+
+        capacity = buffer.shape if buffer is not None else words.shape
+        capacity = tuple(cap if size <= cap else max(size, 2 * cap) for size, cap in zip(shape, capacity))
+        new_buffer = np.zeros(capacity, dtype='<u8')
+        new_buffer[:words.shape[0], :words.shape[1]] = words
+        return new_buffer
+
+    def _set_views(self):
+        """Set the packed rows and columns as the views on the filled parts of the buffers"""
+        self._data = self._rows_buffer[:self._height, :-(-self._width // self.WORD_SIZE)]
+        self._data_columns = self._columns_buffer[:self._width, :-(-self._height // self.WORD_SIZE)]
+
+    def __getitem__(self, item):
+        row_slice, column_slice = item if isinstance(item, tuple) else (item, slice(None, None))
+
+        is_row_slice_number = isinstance(row_slice, Integral)
+        is_column_slice_number = isinstance(column_slice, Integral)
+        if is_row_slice_number and is_column_slice_number:
+            row_i, column_i = row_slice % self._height, column_slice % self._width
+            word = self._data[row_i, column_i // self.WORD_SIZE]
+            data = bool((int(word) >> (column_i % self.WORD_SIZE)) & 1)
+
+        elif is_row_slice_number:
+            # therefore column_slice is slice or Iterable
+            data = slice_list(self._unpack(row_slice).tolist(), column_slice)
+
+        elif is_column_slice_number:
+            # therefore row_slice is slice or Iterable
+            data = unpack_bits(self._data_columns[column_slice], self._height).tolist()
+            data = slice_list(data, row_slice)
+
+        else:
+            # therefore both row_slice and column_slice are slice or Iterable
+            row_slice = row_slice if isinstance(row_slice, slice) else to_index_array(row_slice)
+            column_slice = column_slice if isinstance(column_slice, slice) else to_index_array(column_slice)
+            data = BinTableNumpy(self._unpack(row_slice)[:, column_slice])
+            self._inherit_row_digests(data, row_slice, column_slice)
+
+        return data
+
+    def to_list(self):
+        """Return BinTable data as a `list` of `list`"""
+        return self._unpack().tolist()
+
+    def to_numpy(self, packed=False):
+        """Return BinTable data as a two dimensional `numpy.ndarray` of `bool` (or of packed `numpy.uint64` words)"""
+        return np.array(self._data, dtype='<u8') if packed else self._unpack()
+
+    def __eq__(self, other):
+        if type(self) != type(other):
+            return super(BinTableNumpy, self).__eq__(other)
+        return self.shape == other.shape and np.array_equal(self._data, other.data)
+
+    def __hash__(self):
+        return super(BinTableNumpy, self).__hash__()
+
+    def _iter_rows_bytes(self, start=0):
+        """Iterate over the rows of the table (starting from the row ``start``) encoded into bytes as ``str(row)``"""
+        return iter_rows_bytes(self._unpack, self._height, self._width, start)
+
+    def all(self, axis=None):
+        """Return whether all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2) are True"""
+        if axis is None:
+            flag_all = self.sum() == self._height * self._width
+        elif axis in {0, 1}:
+            size = self._height if axis == 0 else self._width
+            flag_all = [s == size for s in self.sum(axis)]
+        else:
+            raise ValueError(f"BinTable.all error. `axis` value can only be None, 0 or 1 (got {axis})")
+        return flag_all
+
+    def any(self, axis=None):
+        """Return whether any element (``axis`` =0), row in columns (``axis`` =1), column in rows (``axis`` =2) is True"""
+        if axis is None:
+            flag_any = self.sum() > 0
+        elif axis in {0, 1}:
+            flag_any = [s > 0 for s in self.sum(axis)]
+        else:
+            raise ValueError(f"BinTable.all error. `axis` value can only be None, 0 or 1 (got {axis})")
+        return flag_any
+
+    def sum(self, axis=None):
+        """Return sum of all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2)"""
+        if axis is None:
+            s = int(popcount(self._data).sum())
+        elif axis == 0:
+            if self._column_supports is None:
+                self._column_supports = popcount(self._data_columns).sum(axis=1).astype(np.int64)
+            s = self._column_supports.tolist()
+        elif axis == 1:
+            if self._row_supports is None:
+                self._row_supports = popcount(self._data).sum(axis=1).astype(np.int64)
+            s = self._row_supports.tolist()
+        else:
+            raise ValueError(f"BinTable.all error. `axis` value can only be None, 0 or 1 (got {axis})")
+        return s
+
+    def arrow_up(self, row_indexes, base_columns=None):
+        """Return the maximal set of columns in which all rows (``row_indexes``) are True"""
+        return self._arrow(self._data, self._width, row_indexes, base_columns)
+
+    def arrow_down(self, column_indexes, base_rows=None):
+        """Return the maximal set of rows in which all columns (``column_indexes``) are True"""
+        return self._arrow(self._data_columns, self._height, column_indexes, base_rows)
+
+    @staticmethod
+    def _arrow(words, n_bits, indexes, base_indexes):
+        """Intersect the packed ``words`` selected by ``indexes`` (and by ``base_indexes``) in a single pass"""
+        indexes = to_index_array(indexes)
+        if len(indexes) > 0:
+            mask = np.bitwise_and.reduce(words[indexes], axis=0)
+            if base_indexes is not None:
+                mask &= pack_indexes(base_indexes, n_bits)
+        elif base_indexes is not None:
+            mask = pack_indexes(base_indexes, n_bits)
+        else:
+            return list(range(n_bits))
+        return np.flatnonzero(unpack_bits(mask, n_bits)).tolist()
+
+    def arrow_up_batch(self, list_of_row_indexes, packed=False):
+        """Return the maximal sets of columns in which all rows of each set from ``list_of_row_indexes`` are True"""
+        return self._arrow_batch(self._data_columns, self._height, list_of_row_indexes, packed)
+
+    def arrow_down_batch(self, list_of_column_indexes, packed=False):
+        """Return the maximal sets of rows in which all columns of each set from ``list_of_column_indexes`` are True"""
+        return self._arrow_batch(self._data, self._width, list_of_column_indexes, packed)
+
+    @classmethod
+    def _arrow_batch(cls, words, n_bits, list_of_indexes, packed):
+        """Select the ``words`` which include each of the sets of ``list_of_indexes`` in one vectorized pass
+
+        A word w includes a query q iff (q & ~w) == 0. The queries are processed in chunks
+        so that the intermediate 3D array has at most ``BATCH_SIZE`` words.
+        """
+        queries = pack_indexes_batch(list_of_indexes, n_bits)
+        inverted = ~words
+        flags = np.empty((len(queries), len(words)), dtype=bool)
+
+        chunk_size = max(1, cls.BATCH_SIZE // max(1, inverted.size))
+        for start in range(0, len(queries), chunk_size):
+            chunk = queries[start:start + chunk_size, np.newaxis, :]
+            flags[start:start + chunk_size] = ~np.any(chunk & inverted, axis=2)
+
+        if packed:
+            return pack_bits(flags)
+        return [np.flatnonzero(flags_row).tolist() for flags_row in flags]
+
+
+def to_index_array(indexes):
+    """Convert any iterable of indexes (`list`, `set`, `range`, `numpy.ndarray`, ...) into `numpy.ndarray`"""
+    if isinstance(indexes, np.ndarray):
+        return indexes.astype(np.int64, copy=False)
+    return np.fromiter(indexes, dtype=np.int64)
+
+
+def to_bool_array(values, n_columns):
+    """Convert ``values`` into `numpy.ndarray`. Empty ``values`` are turned into a boolean array with ``n_columns``"""
+    values = np.asarray(values)
+    if values.size == 0:
+        values = np.zeros(values.shape if values.ndim == 2 else (len(values), n_columns), dtype=bool)
+    return values
+
+
+def pack_bits(bool_array):
+    """Pack the last axis of boolean ``bool_array`` into little-endian `numpy.uint64` words"""
+    n_words = -(-bool_array.shape[-1] // BinTableNumpy.WORD_SIZE)
+    packed = np.packbits(bool_array, axis=-1, bitorder='little')
+    words = np.zeros(bool_array.shape[:-1] + (n_words * 8,), dtype=np.uint8)
+    words[..., :packed.shape[-1]] = packed
+    return words.view('<u8')
+
+
+def unpack_bits(words, n_bits):
+    """Unpack the last axis of little-endian `numpy.uint64` ``words`` into first ``n_bits`` boolean values"""
+    words = np.ascontiguousarray(words, dtype='<u8')
+    return np.unpackbits(words.view(np.uint8), axis=-1, count=n_bits, bitorder='little').astype(bool)
+
+
+def pack_indexes(indexes, n_bits):
+    """Pack the set of ``indexes`` (from [0, ``n_bits``-1]) into little-endian `numpy.uint64` words"""
+    flags = np.zeros(n_bits, dtype=bool)
+    flags[to_index_array(indexes)] = True
+    return pack_bits(flags)
+
+
+def pack_indexes_batch(list_of_indexes, n_bits):
+    """Pack each set of indexes from ``list_of_indexes`` into a row of little-endian `numpy.uint64` words"""
+    assert LIB_INSTALLED['numpy'], 'pack_indexes_batch: Package "numpy" should be installed'
+    list_of_indexes = [to_index_array(indexes) for indexes in list_of_indexes]
+    flags = np.zeros((len(list_of_indexes), n_bits), dtype=bool)
+    if len(list_of_indexes) > 0:
+        sizes = [len(indexes) for indexes in list_of_indexes]
+        flags[np.repeat(np.arange(len(list_of_indexes)), sizes), np.concatenate(list_of_indexes)] = True
+    return pack_bits(flags)
+
+
+def digest_bytes(data):
+    """Return the pair of adler32 checksum and the length of bytes ``data``"""
+    return zlib.adler32(data), len(data)
+
+
+def iter_rows_bytes(unpack, height, width, start=0):
+    """Iterate over the rows of the table (starting from the row ``start``) encoded into bytes as ``str(row)``
+
+    The rows are unpacked by ``unpack`` function in blocks of rows. Every cell of the block is turned into
+    a fixed-size token (``b'True, '`` padded with zero byte or ``b'False, '``) so each row is encoded
+    by a single bytes conversion.
+    """
+    block_size = max(1, BinTableNumpy.BATCH_SIZE // max(1, width))
+    for block_start in range(start, height, block_size):
+        tokens = np.where(unpack(slice(block_start, block_start + block_size)), b'True, ', b'False, ')
+        for row_tokens in tokens:
+            yield b'[' + row_tokens.tobytes().replace(b'\x00', b'')[:-2] + b']'
+
+
+def popcount(words):
+    """Count the number of True bits in each of the ``words``"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words)
+    words = np.ascontiguousarray(words, dtype='<u8')
+    bits = np.unpackbits(words.view(np.uint8), axis=-1)
+    return bits.reshape(words.shape + (-1,)).sum(axis=-1)
+
+
+class BinTableSparse(BinTable):
+    """
+    A BinTable which keeps only the True cells of the table: in CSR (rows) and CSC (columns) index arrays
+
+    The memory consumption of the table is proportional to the number of True cells rather than to
+    ``height`` * ``width``. So it is well suited for contexts of low density (e.g. one-hot encoded data).
+    The arrows operations are computed as intersections of sorted index arrays.
+
+    Methods
+    -------
+    all(self, axis=None)
+        Return whether all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2) are True
+    any(self, axis=None)
+        Return whether any element (``axis`` =0), row in columns (``axis`` =1), column in rows (``axis`` =2) is True
+    sum(self, axis=None)
+        Return sum of all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2)
+    arrow_up(self, row_indexes, base_columns=None)
+        Return the maximal set of columns in which all rows (``row_indexes``) are True
+    arrow_down(self, column_indexes, base_rows=None)
+        Return the maximal set of rows in which all columns (``column_indexes``) are True
+    arrow_up_batch(self, list_of_row_indexes, packed=False)
+        Return the result of ``arrow_up`` for each set of rows from ``list_of_row_indexes``
+    arrow_down_batch(self, list_of_column_indexes, packed=False)
+        Return the result of ``arrow_down`` for each set of columns from ``list_of_column_indexes``
+    to_numpy(self, packed=False)
+        Return the data of the table as boolean `numpy.ndarray` (or as rows packed into `numpy.uint64` words)
+    hash_fixed(self)
+        Return the hash value of the BinTable which does not differ between sessions
+    append_rows(self, rows)
+        Append new ``rows`` to the bottom of the table
+    append_columns(self, columns)
+        Append new ``columns`` to the right of the table
+
+    """
+    def __init__(self, data=None):
+        """Initialize the BinTableSparse
+
+        Parameters
+        ----------
+        data: `scipy.sparse` matrix or `numpy.ndarray` of `bool` or `list` of `list` of `bool`
+            Data for the BinTable to store
+
+        """
+        assert LIB_INSTALLED['numpy'], 'BinTableSparse.__init__: Package "numpy" should be installed'
+        super(BinTableSparse, self).__init__(data)
+
+    @property
+    def data(self):
+        """Data for the BinTable to store (a pair of CSR index arrays: ``indptr`` and ``indices`` of the rows)"""
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._reset_digests()
+        if LIB_INSTALLED['scipy'] and scipy.sparse.issparse(value):
+            value = value.tocoo()
+            nonzero = value.data != 0
+            shape = value.shape
+            rows, columns = value.row[nonzero], value.col[nonzero]
+        else:
+            if value is None or len(value) == 0:
+                value = np.zeros((0, 0), dtype=bool)
+            if isinstance(value, list):
+                assert len({len(row) for row in value}) == 1, \
+                    'BinTableSparse.data.setter: All rows of the "value" should have the same length'
+            value = to_bool_array(value, 0)
+            assert value.ndim == 2, 'BinTableSparse.data.setter: "value" should be a two dimensional array'
+            assert value.dtype == bool, 'BinTableSparse.data.setter: "Value" should consist only of boolean number'
+            shape = value.shape
+            rows, columns = np.nonzero(value)
+
+        self._set_coordinates(rows, columns, shape)
+
+    def _set_coordinates(self, rows, columns, shape):
+        """Build CSR and CSC index arrays of the table of ``shape`` with True cells in (``rows``, ``columns``)"""
+        self._height, self._width = shape
+        dtype = np.int32 if max(shape) < 2**31 else np.int64
+        rows, columns = np.asarray(rows, dtype=dtype), np.asarray(columns, dtype=dtype)
+
+        self._indptr_rows, self._indices_rows = self._compress(rows, columns, self._height, dtype)
+        self._indptr_columns, self._indices_columns = self._compress(columns, rows, self._width, dtype)
+        self._data = (self._indptr_rows, self._indices_rows)
+
+    @staticmethod
+    def _compress(major, minor, n_major, dtype):
+        """Return ``indptr`` and sorted ``indices`` arrays of the unique pairs (``major``, ``minor``)"""
+        order = np.lexsort((minor, major))
+        major, minor = major[order], minor[order]
+        if len(major) > 0:
+            unique = np.ones(len(major), dtype=bool)
+            unique[1:] = (major[1:] != major[:-1]) | (minor[1:] != minor[:-1])
+            major, minor = major[unique], minor[unique]
+
+        indptr = np.zeros(n_major + 1, dtype=np.int64)
+        np.cumsum(np.bincount(major, minlength=n_major), out=indptr[1:])
+        return indptr, minor.astype(dtype)
+
+    def _append_rows_data(self, rows):
+        """Add new ``rows`` to the table by recompressing the coordinates of True cells"""
+        rows = to_bool_array(rows, self._width)
+        if self._height == 0 and self._width == 0:
+            self.data = rows
+            return
+
+        assert rows.ndim == 2 and rows.shape[1] == self._width,\
+            'BinTableSparse.append_rows: All rows should have the same length as the table'
+        assert rows.dtype == bool, 'BinTableSparse.append_rows: Rows should consist only of boolean values'
+        new_rows, new_columns = np.nonzero(rows)
+        old_rows, old_columns = self._coordinates()
+        self._set_coordinates(np.concatenate([old_rows, new_rows + self._height]),
+                              np.concatenate([old_columns, new_columns]),
+                              (self._height + len(rows), self._width))
+
+    def _append_columns_data(self, columns):
+        """Add new ``columns`` (given row by row) to the table by recompressing the coordinates of True cells"""
+        columns = to_bool_array(columns, 0)
+        assert columns.ndim == 2 and columns.shape[0] == self._height,\
+            'BinTableSparse.append_columns: The number of rows in "columns" should match the height of the table'
+        assert columns.dtype == bool, 'BinTableSparse.append_columns: "columns" should consist only of boolean values'
+        new_rows, new_columns = np.nonzero(columns)
+        old_rows, old_columns = self._coordinates()
+        self._set_coordinates(np.concatenate([old_rows, new_rows]),
+                              np.concatenate([old_columns, new_columns + self._width]),
+                              (self._height, self._width + columns.shape[1]))
+
+    def _coordinates(self):
+        """Return the arrays of rows and columns indexes of all True cells of the table"""
+        return np.repeat(np.arange(self._height), np.diff(self._indptr_rows)), self._indices_rows
+
+    def _row(self, row_i):
+        """Return the sorted array of indexes of True columns in the row ``row_i``"""
+        return self._indices_rows[self._indptr_rows[row_i]:self._indptr_rows[row_i + 1]]
+
+    def _column(self, column_i):
+        """Return the sorted array of indexes of True rows in the column ``column_i``"""
+        return self._indices_columns[self._indptr_columns[column_i]:self._indptr_columns[column_i + 1]]
+
+    def __len__(self):
+        return self._height
+
+    def __getitem__(self, item):
+        row_slice, column_slice = item if isinstance(item, tuple) else (item, slice(None, None))
+
+        is_row_slice_number = isinstance(row_slice, Integral)
+        is_column_slice_number = isinstance(column_slice, Integral)
+        if is_row_slice_number and is_column_slice_number:
+            row = self._row(row_slice % self._height)
+            column_i = column_slice % self._width
+            pos = np.searchsorted(row, column_i)
+            data = bool(pos < len(row) and row[pos] == column_i)
+
+        elif is_row_slice_number:
+            # therefore column_slice is slice or Iterable
+            flags = np.zeros(self._width, dtype=bool)
+            flags[self._row(row_slice % self._height)] = True
+            data = slice_list(flags.tolist(), column_slice)
+
+        elif is_column_slice_number:
+            # therefore row_slice is slice or Iterable
+            flags = np.zeros(self._height, dtype=bool)
+            flags[self._column(column_slice % self._width)] = True
+            data = slice_list(flags.tolist(), row_slice)
+
+        else:
+            # therefore both row_slice and column_slice are slice or Iterable
+            rows_old = np.arange(self._height)[row_slice if isinstance(row_slice, slice) else to_index_array(row_slice)]
+            columns_old = np.arange(self._width)[
+                column_slice if isinstance(column_slice, slice) else to_index_array(column_slice)]
+
+            columns_map = np.full(self._width, -1, dtype=np.int64)
+            columns_map[columns_old] = np.arange(len(columns_old))
+
+            row_sizes = self._indptr_rows[rows_old + 1] - self._indptr_rows[rows_old]
+            rows = np.repeat(np.arange(len(rows_old)), row_sizes)
+            columns = columns_map[np.concatenate([self._row(row_i) for row_i in rows_old])] \
+                if len(rows_old) > 0 else np.zeros(0, dtype=np.int64)
+            is_kept = columns >= 0
+
+            data = BinTableSparse()
+            data._set_coordinates(rows[is_kept], columns[is_kept], (len(rows_old), len(columns_old)))
+            self._inherit_row_digests(data, row_slice, column_slice)
+
+        return data
+
+    def _unpack(self, row_indexes=slice(None)):
+        """Return the rows ``row_indexes`` of the table as a two dimensional `numpy.ndarray` of `bool`"""
+        rows = np.arange(self._height)[row_indexes]
+        dense = np.zeros((len(rows), self._width), dtype=bool)
+        if len(rows) > 0:
+            row_sizes = self._indptr_rows[rows + 1] - self._indptr_rows[rows]
+            dense[np.repeat(np.arange(len(rows)), row_sizes), np.concatenate([self._row(row_i) for row_i in rows])] = True
+        return dense
+
+    def to_list(self):
+        """Return BinTable data as a `list` of `list`"""
+        return self._unpack().tolist()
+
+    def to_numpy(self, packed=False):
+        """Return BinTable data as a two dimensional `numpy.ndarray` of `bool` (or of packed `numpy.uint64` words)"""
+        flags = self._unpack()
+        return pack_bits(flags) if packed else flags
+
+    def __eq__(self, other):
+        if type(self) != type(other):
+            return super(BinTableSparse, self).__eq__(other)
+        return self.shape == other.shape \
+            and np.array_equal(self._indptr_rows, other._indptr_rows) \
+            and np.array_equal(self._indices_rows, other._indices_rows)
+
+    def __hash__(self):
+        return super(BinTableSparse, self).__hash__()
+
+    def _iter_rows_bytes(self, start=0):
+        """Iterate over the rows of the table (starting from the row ``start``) encoded into bytes as ``str(row)``"""
+        return iter_rows_bytes(self._unpack, self._height, self._width, start)
+
+    def all(self, axis=None):
+        """Return whether all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2) are True"""
+        if axis is None:
+            flag_all = self.sum() == self._height * self._width
+        elif axis in {0, 1}:
+            size = self._height if axis == 0 else self._width
+            flag_all = [s == size for s in self.sum(axis)]
+        else:
+            raise ValueError(f"BinTable.all error. `axis` value can only be None, 0 or 1 (got {axis})")
+        return flag_all
+
+    def any(self, axis=None):
+        """Return whether any element (``axis`` =0), row in columns (``axis`` =1), column in rows (``axis`` =2) is True"""
+        if axis is None:
+            flag_any = self.sum() > 0
+        elif axis in {0, 1}:
+            flag_any = [s > 0 for s in self.sum(axis)]
+        else:
+            raise ValueError(f"BinTable.all error. `axis` value can only be None, 0 or 1 (got {axis})")
+        return flag_any
+
+    def sum(self, axis=None):
+        """Return sum of all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2)"""
+        if axis is None:
+            s = len(self._indices_rows)
+        elif axis == 0:
+            s = np.diff(self._indptr_columns).tolist()
+        elif axis == 1:
+            s = np.diff(self._indptr_rows).tolist()
+        else:
+            raise ValueError(f"BinTable.all error. `axis` value can only be None, 0 or 1 (got {axis})")
+        return s
+
+    def arrow_up(self, row_indexes, base_columns=None):
+        """Return the maximal set of columns in which all rows (``row_indexes``) are True"""
+        return self._arrow([self._row(row_i) for row_i in to_index_array(row_indexes)], self._width, base_columns)
+
+    def arrow_down(self, column_indexes, base_rows=None):
+        """Return the maximal set of rows in which all columns (``column_indexes``) are True"""
+        return self._arrow([self._column(col_i) for col_i in to_index_array(column_indexes)], self._height, base_rows)
+
+    @staticmethod
+    def _arrow(index_arrays, n_elements, base_indexes):
+        """Intersect the sorted ``index_arrays`` (and ``base_indexes``) starting from the shortest ones"""
+        if base_indexes is not None:
+            index_arrays.append(np.unique(to_index_array(base_indexes)))
+        if len(index_arrays) == 0:
+            return list(range(n_elements))
+
+        index_arrays = sorted(index_arrays, key=len)
+        indexes = index_arrays[0]
+        for other_indexes in index_arrays[1:]:
+            if len(indexes) == 0:
+                break
+            indexes = intersect_sorted(indexes, other_indexes)
+        return indexes.tolist()
+
+
+def intersect_sorted(a, b):
+    """Intersect two sorted arrays of unique indexes. Works in O(len(``a``) * log(len(``b``)))"""
+    if len(b) == 0:
+        return b
+    pos = np.searchsorted(b, a)
+    pos[pos == len(b)] = 0
+    return a[b[pos] == a]
+
+
+class BinTableView(BinTable):
+    """
+    A lightweight read-only view on some rows and columns of a ``parent`` BinTable
+
+    The view does not copy the data of the parent table. It keeps only the indexes of the selected rows and columns
+    and computes the arrows operations by the parent table restricted to these rows and columns.
+    Thus a view is created in O(number of selected indexes) time.
+
+    Methods
+    -------
+    all(self, axis=None)
+        Return whether all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2) are True
+    any(self, axis=None)
+        Return whether any element (``axis`` =0), row in columns (``axis`` =1), column in rows (``axis`` =2) is True
+    sum(self, axis=None)
+        Return sum of all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2)
+    arrow_up(self, row_indexes, base_columns=None)
+        Return the maximal set of columns in which all rows (``row_indexes``) are True
+    arrow_down(self, column_indexes, base_rows=None)
+        Return the maximal set of rows in which all columns (``column_indexes``) are True
+    to_numpy(self, packed=False)
+        Return the data of the table as boolean `numpy.ndarray` (or as rows packed into `numpy.uint64` words)
+    materialize(self)
+        Return a copy of the viewed data as a standalone BinTable
+
+    """
+    def __init__(self, parent, row_indexes=None, column_indexes=None):
+        """Initialize the BinTableView
+
+        Parameters
+        ----------
+        parent: `BinTable`
+            The table to look at
+        row_indexes: `list` of `int`
+            Indexes of rows of the ``parent`` to show (default: all the rows)
+        column_indexes: `list` of `int`
+            Indexes of columns of the ``parent`` to show (default: all the columns)
+
+        """
+        if isinstance(parent, BinTableView):
+            row_indexes = self._compose_indexes(parent._rows, row_indexes)
+            column_indexes = self._compose_indexes(parent._columns, column_indexes)
+            parent = parent._parent
+
+        self._parent = parent
+        self._rows = self._compose_indexes(None, row_indexes)
+        self._columns = self._compose_indexes(None, column_indexes)
+        self._rows_map = {row_p: row_i for row_i, row_p in enumerate(self._rows)} if self._rows is not None else None
+        self._columns_map = {col_p: col_i for col_i, col_p in enumerate(self._columns)}\
+            if self._columns is not None else None
+        self._height = len(self._rows) if self._rows is not None else parent.height
+        self._width = len(self._columns) if self._columns is not None else parent.width
+
+    @staticmethod
+    def _compose_indexes(base_indexes, indexes):
+        """Convert the ``indexes`` defined on the ``base_indexes`` into the indexes of the parent table"""
+        if indexes is None:
+            return base_indexes
+        if isinstance(indexes, slice):
+            indexes = range(len(base_indexes))[indexes] if base_indexes is not None else indexes
+        indexes = [int(idx) for idx in indexes]
+        return indexes if base_indexes is None else [base_indexes[idx] for idx in indexes]
+
+    @property
+    def parent(self):
+        """The BinTable which data is viewed"""
+        return self._parent
+
+    @property
+    def data(self):
+        """The viewed data (materialized as `list` of `list`)"""
+        return self.to_list()
+
+    def __len__(self):
+        return self._height
+
+    def _to_parent_slice(self, slc, base_indexes):
+        """Convert a slice ``slc`` of the view into a slice of the parent table"""
+        if base_indexes is None:
+            return slc
+        if isinstance(slc, Integral):
+            return base_indexes[slc]
+        return self._compose_indexes(base_indexes, slc)
+
+    def __getitem__(self, item):
+        row_slice, column_slice = item if isinstance(item, tuple) else (item, slice(None, None))
+        if not isinstance(row_slice, (Integral, slice)):
+            row_slice = list(row_slice)
+        if not isinstance(column_slice, (Integral, slice)):
+            column_slice = list(column_slice)
+        is_row_slice_number = isinstance(row_slice, Integral)
+        is_column_slice_number = isinstance(column_slice, Integral)
+        row_slice = self._to_parent_slice(row_slice, self._rows)
+        column_slice = self._to_parent_slice(column_slice, self._columns)
+
+        if is_row_slice_number and not is_column_slice_number:
+            columns = range(self._parent.width)[column_slice] if isinstance(column_slice, slice) else column_slice
+            return [bool(self._parent[row_slice, column_i]) for column_i in columns]
+        if is_column_slice_number and not is_row_slice_number:
+            rows = range(self._parent.height)[row_slice] if isinstance(row_slice, slice) else row_slice
+            return [bool(self._parent[row_i, column_slice]) for row_i in rows]
+        return self._parent[row_slice, column_slice]
+
+    def materialize(self):
+        """Return a copy of the viewed data as a standalone BinTable"""
+        return self[:, :]
+
+    def __eq__(self, other):
+        if isinstance(other, BinTableView) and other._parent is self._parent \
+                and (other._rows, other._columns) == (self._rows, self._columns):
+            return True
+        return self.shape == other.shape and self.to_list() == other.to_list()
+
+    def __hash__(self):
+        return super(BinTableView, self).__hash__()
+
+    def to_list(self):
+        """Return BinTable data as a `list` of `list`"""
+        return self.materialize().to_list()
+
+    def to_numpy(self, packed=False):
+        """Return BinTable data as a two dimensional `numpy.ndarray` of `bool` (or of packed `numpy.uint64` words)"""
+        return self.materialize().to_numpy(packed)
+
+    def all(self, axis=None):
+        """Return whether all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2) are True"""
+        return self.materialize().all(axis)
+
+    def any(self, axis=None):
+        """Return whether any element (``axis`` =0), row in columns (``axis`` =1), column in rows (``axis`` =2) is True"""
+        return self.materialize().any(axis)
+
+    def sum(self, axis=None):
+        """Return sum of all elements (``axis`` =0), rows in columns (``axis`` =1), columns in rows (``axis`` =2)"""
+        return self.materialize().sum(axis)
+
+    def arrow_up(self, row_indexes, base_columns=None):
+        """Return the maximal set of columns in which all rows (``row_indexes``) are True"""
+        return self._arrow(self._parent.arrow_up, row_indexes, base_columns,
+                           self._rows, self._columns, self._columns_map)
+
+    def arrow_down(self, column_indexes, base_rows=None):
+        """Return the maximal set of rows in which all columns (``column_indexes``) are True"""
+        return self._arrow(self._parent.arrow_down, column_indexes, base_rows,
+                           self._columns, self._rows, self._rows_map)
+
+    @staticmethod
+    def _arrow(parent_arrow, indexes, base_indexes, indexes_to_parent, base_to_parent, parent_to_base):
+        """Compute ``parent_arrow`` in the parent table and map its output back to the indexes of the view"""
+        if indexes_to_parent is not None:
+            indexes = [indexes_to_parent[idx] for idx in indexes]
+        if base_to_parent is not None:
+            base_indexes = base_to_parent if base_indexes is None else [base_to_parent[idx] for idx in base_indexes]
+
+        output = parent_arrow(indexes, base_indexes)
+        if parent_to_base is not None:
+            output = sorted([parent_to_base[idx] for idx in output])
+        return output
+
+    def _get_row_digests(self):
+        """Return the list of pairs (adler32 checksum, length) of the strings ``str(row)[:-1]`` for every row
+
+        If the view keeps all the columns of the parent, the digests are taken from the cached digests of the parent rows
+        """
+        if self._row_digests is None:
+            if self._columns is None or self._columns == list(range(self._parent.width)):
+                parent_digests = self._parent._get_row_digests()
+                self._row_digests = list(parent_digests) if self._rows is None \
+                    else [parent_digests[row_p] for row_p in self._rows]
+            else:
+                self._row_digests = [digest_bytes(row_bytes[:-1]) for row_bytes in self._iter_rows_bytes()]
+        return self._row_digests
+
+    def _iter_rows_bytes(self, start=0):
+        """Iterate over the rows of the table (starting from the row ``start``) encoded into bytes as ``str(row)``
+
+        The rows are read from the parent table restricted to the selected columns. So the view is not materialized
+        """
+        parent = self._parent
+        rows = range(parent.height) if self._rows is None else self._rows
+        columns = self._columns
+
+        if hasattr(parent, '_unpack'):
+            def unpack(row_slice):
+                flags = parent._unpack(np.array(rows[row_slice], dtype=int))
+                return flags if columns is None else flags[:, columns]
+            yield from iter_rows_bytes(unpack, self._height, self._width, start)
+            return
+
+        is_bitset = LIB_INSTALLED['bitsets'] and parent.width > 0
+        for row_p in rows[start:]:
+            row = parent.data[row_p].bools() if is_bitset else parent.data[row_p]
+            row = row if columns is None else [row[column_p] for column_p in columns]
+            yield str(list(row)).encode()
+
+    def append_rows(self, rows):
+        """The view is read-only. Append the rows to the ``parent`` table instead"""
+        raise TypeError('BinTableView.append_rows: The view is read-only. Append the rows to the parent table')
+
+    def append_columns(self, columns):
+        """The view is read-only. Append the columns to the ``parent`` table instead"""
+        raise TypeError('BinTableView.append_columns: The view is read-only. Append the columns to the parent table')
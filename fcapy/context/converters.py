@@ -1,13 +1,143 @@
 """
 This module provides a number of functions to read/write FormalContext object from/to a file
 
+The readers of text formats (.cxt, .csv) parse the files line by line and pack each row into bits
+right away. So the whole text of a file is never kept in memory.
+The rows can also be consumed one by one (without constructing a context) via ``iter_cxt_rows``, ``iter_csv_rows``.
+
 """
+import io
+
 from fcapy.context.formal_context import FormalContext
+from fcapy import LIB_INSTALLED
+if LIB_INSTALLED['numpy']:
+    import numpy as np
+    from fcapy.context.bintable import BinTableNumpy, pack_bits
+
+
+def _open_lines(path=None, data=None):
+    """Return a file object to read the lines from: the file by ``path`` or the in-memory text ``data``"""
+    return io.StringIO(data) if data is not None else open(path, 'r')
+
+
+def _strip_newline(line):
+    return line.rstrip('\r\n')
+
+
+def _read_cxt_header(lines):
+    """Read the header of .cxt file from ``lines`` iterator. Return the number of objects and attributes"""
+    n_numbers = []
+    for line in lines:
+        line = line.strip()
+        if line in {'', 'B'}:
+            continue
+        n_numbers.append(int(line))
+        if len(n_numbers) == 2:
+            break
+    assert len(n_numbers) == 2, 'converters.read_cxt error. The header of .cxt file is broken'
+    return n_numbers
+
+
+def _read_lines(lines, n_lines, skip_empty_first=False):
+    """Read next ``n_lines`` lines from ``lines`` iterator (skipping the empty lines at the start if needed)"""
+    read_lines = []
+    for line in lines:
+        line = _strip_newline(line)
+        if skip_empty_first and len(read_lines) == 0 and line == '':
+            continue
+        read_lines.append(line)
+        if len(read_lines) == n_lines:
+            break
+    return read_lines
+
+
+def _pack_row(row):
+    """Pack the boolean ``row`` into `numpy.uint64` words (or return it as is if numpy is not installed)"""
+    return pack_bits(np.array(row, dtype=bool)) if LIB_INSTALLED['numpy'] else row
+
+
+def _parse_cxt_line(line):
+    if LIB_INSTALLED['numpy']:
+        return np.frombuffer(line.encode('utf-8'), dtype=np.uint8) == ord('X')
+    return [c == 'X' for c in line]
+
+
+class _NumberedLines:
+    """An iterator over the lines of a file which keeps the number of the last read line"""
+    def __init__(self, f):
+        self._lines = iter(f)
+        self.line_number = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = next(self._lines)
+        self.line_number += 1
+        return line
+
+
+def _iter_cxt_data_rows(lines: _NumberedLines, n_objs, n_attrs):
+    """Parse the next ``n_objs`` rows of ``n_attrs`` symbols from ``lines``. Raise ValueError if the data is broken"""
+    n_rows = 0
+    for line in lines:
+        line = _strip_newline(line)
+        if n_rows == n_objs:
+            if line.strip() != '':
+                raise ValueError(f'converters.read_cxt error. Line {lines.line_number}: '
+                                 f'the file has more than {n_objs} rows of data')
+            continue
+
+        if len(line) != n_attrs:
+            raise ValueError(f'converters.read_cxt error. Line {lines.line_number}: '
+                             f'the row has {len(line)} symbols instead of {n_attrs}')
+        n_rows += 1
+        yield _parse_cxt_line(line)
+
+    if n_rows != n_objs:
+        raise ValueError(f'converters.read_cxt error. Line {lines.line_number}: '
+                         f'the file has {n_rows} rows of data instead of {n_objs}')
+
+
+def iter_cxt_rows(path=None, data=None, packed=False):
+    """Iterate over the rows of .cxt file (or of ``data`` attribute) reading them line by line
+
+    Parameters
+    ----------
+    path : `str`
+        A path to requested .cxt file
+    data : `str`
+        CXT formatted data (if it is already loaded into python)
+    packed : `bool`
+        A flag whether to yield the rows packed into `numpy.uint64` words (if True) or as lists of `bool` (if False)
+
+    Yields
+    ------
+    object_name : `str`
+        The name of the object of the row
+    row : `list` of `bool` or `numpy.ndarray` of `numpy.uint64`
+        The values of attributes of the object (packed, if ``packed`` is True)
+
+    """
+    assert path is not None or data is not None, 'converters.read_cxt error. Either path or data should be given'
+    with _open_lines(path, data) as f:
+        lines = _NumberedLines(f)
+        n_objs, n_attrs = _read_cxt_header(lines)
+        obj_names = _read_lines(lines, n_objs, skip_empty_first=True)
+        _read_lines(lines, n_attrs)
+        # the rows go first in zip so that the data is checked up to the end of the file
+        for row, obj_name in zip(_iter_cxt_data_rows(lines, n_objs, n_attrs), obj_names):
+            if packed:
+                yield obj_name, pack_bits(row)
+            else:
+                yield obj_name, row.tolist() if LIB_INSTALLED['numpy'] else row
 
 
 def read_cxt(path=None, data=None):
     """Read FormalContext from .cxt file or from ``data`` attribute
 
+    The file is read line by line. If numpy is installed, each line is packed into the bits of `BinTableNumpy` at once
+
     Parameters
     ----------
     path : `str`
@@ -22,17 +152,20 @@ def read_cxt(path=None, data=None):
     """
     assert path is not None or data is not None, 'converters.read_cxt error. Either path or data should be given'
 
-    if data is None:
-        with open(path, 'r') as f:
-            data = f.read()
-
-    _, ns, data = data.split('\n\n')
-    n_objs, n_attrs = [int(x) for x in ns.split('\n')]
-
-    data = data.strip().split('\n')
-    obj_names, data = data[:n_objs], data[n_objs:]
-    attr_names, data = data[:n_attrs], data[n_attrs:]
-    data = [[c == 'X' for c in line] for line in data]
+    with _open_lines(path, data) as f:
+        lines = _NumberedLines(f)
+        n_objs, n_attrs = _read_cxt_header(lines)
+        obj_names = _read_lines(lines, n_objs, skip_empty_first=True)
+        attr_names = _read_lines(lines, n_attrs)
+
+        rows = _iter_cxt_data_rows(lines, n_objs, n_attrs)
+        if LIB_INSTALLED['numpy']:
+            rows_words = np.zeros((n_objs, -(-n_attrs // BinTableNumpy.WORD_SIZE)), dtype='<u8')
+            for row_i, row in enumerate(rows):
+                rows_words[row_i] = pack_bits(row)
+            data = BinTableNumpy.from_packed_rows(rows_words, n_attrs)
+        else:
+            data = list(rows)
 
     ctx = FormalContext(data=data, object_names=obj_names, attribute_names=attr_names)
     return ctx
@@ -143,9 +276,59 @@ def write_json(context, path=None):
         f.write(file_data)
 
 
+def iter_csv_rows(path, sep=',', word_true='True', word_false='False', packed=False):
+    """Iterate over the rows of .csv file reading them line by line
+
+    Parameters
+    ----------
+    path : `str`
+        A path to requested .csv file
+    sep : `str`
+        A separator in the .csv file
+    word_true : `str`
+        A string placeholder corresponding to True values in the .csv file
+    word_false : `str`
+        A string placeholder corresponding to False values in the .csv file
+    packed : `bool`
+        A flag whether to yield the rows packed into `numpy.uint64` words (if True) or as lists of `bool` (if False)
+
+    Yields
+    ------
+    object_name : `str`
+        The name of the object of the row
+    row : `list` of `bool` or `numpy.ndarray` of `numpy.uint64`
+        The values of attributes of the object (packed, if ``packed`` is True)
+
+    """
+    with open(path, 'r') as f:
+        n_attrs = len(_strip_newline(f.readline()).split(sep)) - 1
+        for line_number, line in enumerate(f, start=2):
+            line = _strip_newline(line)
+            if line == '':
+                continue
+            line = line.split(sep)
+            if len(line) - 1 != n_attrs:
+                raise ValueError(f'converters.read_csv error. Line {line_number}: '
+                                 f'the row has {len(line) - 1} values instead of {n_attrs}')
+
+            data_line = []
+            for val in line[1:]:
+                if val == word_true:
+                    data_line.append(True)
+                elif val == word_false:
+                    data_line.append(False)
+                else:
+                    raise ValueError(
+                        f'Csv file {path} has values that differ from "{word_true}" and "{word_false}". '
+                        'Binarize the file or change values of parameters "word_true", "word_false"')
+            yield line[0], _pack_row(data_line) if packed else data_line
+
+
 def read_csv(path, sep=',', word_true='True', word_false='False'):
     """Read FormalContext from .csv file
 
+    The file is read line by line. If numpy is installed, each line is packed into the bits of `BinTableNumpy` at once
+
     Parameters
     ----------
     path : `str`
@@ -164,23 +347,23 @@ def read_csv(path, sep=',', word_true='True', word_false='False'):
     """
     # TODO: add `data` parameter
     with open(path, 'r') as f:
-        file_data = f.read().strip().split('\n')
-    header, file_data = file_data[0], file_data[1:]
+        attr_names = _strip_newline(f.readline()).split(sep)[1:]
 
-    attr_names = header.split(sep)[1:]
+    rows = iter_csv_rows(path, sep, word_true, word_false, packed=LIB_INSTALLED['numpy'])
     obj_names, data = [], []
-    for line in file_data:
-        line = line.split(sep)
-        obj_names.append(line[0])
-        val_error = ValueError(f'Csv file {path} has values that differ from "{word_true}" and "{word_false}". ' + \
-                               'Binarize the file or change values of parameters "word_true", "word_false"')
-        data_line = []
-        for val in line[1:]:
-            if val in {word_true, word_false}:
-                data_line.append(val == word_true)
-            else:
-                raise val_error
-        data.append(data_line)
+    if LIB_INSTALLED['numpy']:
+        # the number of rows is unknown beforehand. So the buffer of packed rows grows twice when it is full
+        rows_words = np.zeros((1024, -(-len(attr_names) // BinTableNumpy.WORD_SIZE)), dtype='<u8')
+        for row_i, (obj_name, row_words) in enumerate(rows):
+            if row_i == len(rows_words):
+                rows_words = np.concatenate([rows_words, np.zeros_like(rows_words)])
+            rows_words[row_i] = row_words
+            obj_names.append(obj_name)
+        data = BinTableNumpy.from_packed_rows(rows_words[:len(obj_names)].copy(), len(attr_names))
+    else:
+        for obj_name, row in rows:
+            obj_names.append(obj_name)
+            data.append(row)
 
     ctx = FormalContext(data=data, object_names=obj_names, attribute_names=attr_names)
     return ctx
@@ -219,11 +402,139 @@ def write_csv(context, path=None, sep=',', word_true='True', word_false='False')
         f.write(file_data)
 
 
+BIN_MAGIC = b'FCAPYBIN'
+BIN_ALIGNMENT = 64
+
+
+def write_bin(context, path=None):
+    """Write FormalContext object to the binary .bin file
+
+    The file consists of:
+    the magic bytes ``BIN_MAGIC``, the length of the header (little-endian uint64),
+    the json header with object and attribute names, the shape and the offsets of the data,
+    packed rows and packed columns of the context (little-endian `numpy.uint64` words).
+    The data is aligned to ``BIN_ALIGNMENT`` bytes so that it can be memory-mapped by ``read_bin``
+
+    Parameters
+    ----------
+    context : `FormalContext`
+        A context to write to a file
+    path : `str`
+        A path to the file to write a FormalContext object
+    Returns
+    -------
+    file_data : `bytes`
+        The data from the .bin file. Returned if ``path`` is None
+
+    """
+    assert LIB_INSTALLED['numpy'], 'converters.write_bin error. Package "numpy" should be installed'
+    import json
+
+    if isinstance(context.data, BinTableNumpy):
+        rows_words, columns_words = context.data.data, context.data._data_columns
+    else:
+        flags = np.array(context.data.to_list(), dtype=bool).reshape(context.data.shape)
+        rows_words, columns_words = pack_bits(flags), pack_bits(flags.T)
+
+    header = {}
+    if context.description is not None:
+        header['Description'] = context.description
+    header['ObjNames'] = context.object_names
+    header['Params'] = {'AttrNames': context.attribute_names}
+    header['Shape'] = [context.n_objects, context.n_attributes]
+    header['RowsOffset'] = 0
+    header['ColumnsOffset'] = rows_words.nbytes
+    header = json.dumps(header, separators=(',', ':')).encode('utf-8')
+
+    header_size = len(BIN_MAGIC) + 8 + len(header)
+    padding = b'\0' * (-header_size % BIN_ALIGNMENT)
+    file_parts = [BIN_MAGIC, np.uint64(len(header)).astype('<u8').tobytes(), header, padding,
+                  np.ascontiguousarray(rows_words, dtype='<u8'), np.ascontiguousarray(columns_words, dtype='<u8')]
+
+    if path is None:
+        return b''.join([bytes(part) for part in file_parts])
+
+    with open(path, 'wb') as f:
+        for part in file_parts:
+            f.write(memoryview(part))
+
+
+def read_bin(path=None, data=None, mmap=True):
+    """Read FormalContext from .bin file or from ``data`` attribute
+
+    If ``mmap`` is True, the packed data of the context is not loaded into memory
+    but is opened via `numpy.memmap`. Thus the file is shared (through the page cache)
+    by all the processes which read it.
+
+    Parameters
+    ----------
+    path : `str`
+        A path to requested .bin file
+    data : `bytes`
+        Binary data of .bin file (if it is already loaded into python)
+    mmap : `bool`
+        A flag whether to memory-map the file (if True) or to read it into memory (if False)
+    Returns
+    -------
+    ctx : `FormalContext`
+        The loaded FormalContext object
+
+    """
+    assert path is not None or data is not None, 'converters.read_bin error. Either path or data should be given'
+
+    assert LIB_INSTALLED['numpy'], 'converters.read_bin error. Package "numpy" should be installed'
+    import json
+
+    if data is None:
+        with open(path, 'rb') as f:
+            prefix = f.read(len(BIN_MAGIC) + 8)
+            header_length = int(np.frombuffer(prefix[len(BIN_MAGIC):], dtype='<u8')[0])
+            header = f.read(header_length)
+    else:
+        prefix = data[:len(BIN_MAGIC) + 8]
+        header_length = int(np.frombuffer(prefix[len(BIN_MAGIC):], dtype='<u8')[0])
+        header = data[len(prefix):len(prefix) + header_length]
+    if prefix[:len(BIN_MAGIC)] != BIN_MAGIC:
+        raise ValueError(f'converters.read_bin error. The data is not in .bin format (wrong magic bytes)')
+
+    header_size = len(prefix) + header_length
+    data_offset = header_size + (-header_size % BIN_ALIGNMENT)
+    header = json.loads(header.decode('utf-8'))
+    height, width = header['Shape']
+
+    def load_words(offset, n_rows, n_bits):
+        shape = (n_rows, -(-n_bits // BinTableNumpy.WORD_SIZE))
+        count = shape[0] * shape[1]
+        offset += data_offset
+        if count == 0:
+            words = np.zeros(shape, dtype='<u8')
+        elif data is not None:
+            words = np.frombuffer(data, dtype='<u8', count=count, offset=offset).reshape(shape)
+        elif mmap:
+            words = np.memmap(path, dtype='<u8', mode='r', offset=offset, shape=shape)
+        else:
+            words = np.fromfile(path, dtype='<u8', count=count, offset=offset).reshape(shape)
+        return words
+
+    rows_words = load_words(header['RowsOffset'], height, width)
+    columns_words = load_words(header['ColumnsOffset'], width, height)
+    bintable = BinTableNumpy.from_packed(rows_words, columns_words, (height, width))
+
+    object_names = header.get('ObjNames')
+    attribute_names = header['Params'].get('AttrNames') if 'Params' in header else None
+    ctx = FormalContext(data=bintable, object_names=object_names, attribute_names=attribute_names,
+                        description=header.get('Description'))
+    return ctx
+
+
 def from_pandas(dataframe):
     """Create FormalContext object based on pandas.DataFrame
 
     ``context.object_names`` are parsed from ``dataframe.index``.
-    ``context.column_names`` are parsed from ``dataframe.columns``
+    ``context.column_names`` are parsed from ``dataframe.columns``.
+    The values of the dataframe are packed into `BinTableNumpy` in one vectorized pass
+    (or are stored in `BinTableSparse` if all the columns of the dataframe are sparse).
+    The dataframe should contain only boolean values
 
     Parameters
     ----------
@@ -234,8 +545,24 @@ def from_pandas(dataframe):
     ctx : `FormalContext`
 
     """
-    ctx = FormalContext(data=dataframe.values.tolist(),
-                        object_names=dataframe.index.tolist(), attribute_names=dataframe.columns.tolist())
+    if not LIB_INSTALLED['numpy']:
+        return FormalContext(data=dataframe.values.tolist(),
+                             object_names=dataframe.index.tolist(), attribute_names=dataframe.columns.tolist())
+
+    import pandas as pd
+    is_sparse = len(dataframe.columns) > 0 \
+        and all(isinstance(dtype, pd.SparseDtype) and dtype.subtype == bool for dtype in dataframe.dtypes)
+    if LIB_INSTALLED['scipy'] and is_sparse:
+        data = dataframe.sparse.to_coo()
+    else:
+        data = dataframe.to_numpy()
+        if data.dtype != bool:
+            # e.g. the columns of `object` dtype. The values like 0 and 1 are not treated as boolean ones
+            if data.dtype != object or not all(isinstance(v, (bool, np.bool_)) for v in data.flat):
+                raise ValueError('converters.from_pandas: The dataframe should contain only boolean values')
+            data = data.astype(bool)
+
+    ctx = FormalContext(data=data, object_names=dataframe.index.tolist(), attribute_names=dataframe.columns.tolist())
     return ctx
 
 
@@ -256,5 +583,6 @@ def to_pandas(context):
 
     """
     import pandas as pd
-    df = pd.DataFrame(context.data.to_list(), columns=context.attribute_names, index=context.object_names)
+    data = context.data.to_numpy() if LIB_INSTALLED['numpy'] else context.data.to_list()
+    df = pd.DataFrame(data, columns=context.attribute_names, index=context.object_names)
     return df
@@ -9,8 +9,14 @@ from numbers import Integral
 from frozendict import frozendict
 import zlib
 
-from fcapy.context.bintable import BinTable
-from fcapy.utils.utils import slice_list
+from fcapy.context.bintable import BinTable, BinTableNumpy, BinTableSparse, BinTableView
+from fcapy.utils.utils import slice_list, combine_digests, indexes_to_mask
+
+from fcapy import LIB_INSTALLED
+if LIB_INSTALLED['numpy']:
+    import numpy as np
+if LIB_INSTALLED['scipy']:
+    import scipy.sparse
 
 
 class FormalContext:
@@ -27,6 +33,14 @@ class FormalContext:
         Offer the same logic as intention(...) but objects and attributes are defined by their indexes
     extension_i(attribute_indexes)
         Offer the same logic as extension(...) but objects and attributes are defined by their indexes
+    intention_i_batch(list_of_object_indexes, packed=False)
+        Compute intention_i(...) for each set of objects indexes in one vectorized pass
+    extension_i_batch(list_of_attribute_indexes, packed=False)
+        Compute extension_i(...) for each set of attributes indexes in one vectorized pass
+    append_objects(data, object_names=None, target=None)
+        Append new objects to the context keeping the indexes of the existing objects and attributes
+    append_attributes(data, attribute_names=None)
+        Append new attributes to the context keeping the indexes of the existing objects and attributes
 
     to_cxt(path=None)
         Convert the FormalContext into cxt file format (save if ``path`` is given)
@@ -34,8 +48,12 @@ class FormalContext:
         Convert the FormalContext into json file format (save if ``path`` is given)
     to_csv(path=None, **kwargs)
         Convert the FormalContext into csv file format (save if ``path`` is given)
+    to_bin(path=None)
+        Convert the FormalContext into compact binary file format (save if ``path`` is given)
     to_pandas()
         Convert the FormalContext into pandas.DataFrame object
+    to_numpy(packed=False)
+        Convert the data of the FormalContext into boolean numpy.ndarray (or into packed numpy.uint64 words)
 
     Notes
     -----
@@ -49,9 +67,11 @@ class FormalContext:
         """
         Parameters
         ----------
-        data : `list` of `list`
+        data : `list` of `list` or `numpy.ndarray` or `scipy.sparse` matrix or `BinTable`
             Two dimensional list of bool variables.
-            "data[i][j] = True" represents that i-th object shares j-th attribute
+            "data[i][j] = True" represents that i-th object shares j-th attribute.
+            The boolean `numpy.ndarray` is stored in packed `BinTableNumpy`,
+            the `scipy.sparse` matrix is stored in sparse `BinTableSparse`
         object_names : `list` of `str`, optional
             Names of objects (rows) of the FormalContext
         attribute_names : `list` of `str`, optional
@@ -61,7 +81,15 @@ class FormalContext:
                 `str` with human readable description of the FormalContext (stored only in json file format)
 
         """
-        self._data = BinTable(data) if not isinstance(data, BinTable) else data
+        self._names_digest = None
+        if isinstance(data, BinTable):
+            self._data = data
+        elif LIB_INSTALLED['numpy'] and isinstance(data, np.ndarray):
+            self._data = BinTableNumpy(data)
+        elif LIB_INSTALLED['scipy'] and scipy.sparse.issparse(data):
+            self._data = BinTableSparse(data)
+        else:
+            self._data = BinTable(data)
         self.object_names = object_names
         self.attribute_names = attribute_names
         self.description = kwargs.get('description')
@@ -107,6 +135,7 @@ class FormalContext:
 
     @object_names.setter
     def object_names(self, value):
+        self._names_digest = None
         if value is None:
             self._object_names = tuple([str(idx) for idx in range(self.n_objects)]) if self.data else None
             return
@@ -141,6 +170,7 @@ class FormalContext:
 
     @attribute_names.setter
     def attribute_names(self, value):
+        self._names_digest = None
         if value is None:
             self._attribute_names = tuple([str(idx) for idx in range(self.n_attributes)]) if self.data else None
             return
@@ -195,6 +225,44 @@ class FormalContext:
         intention_i = self._data.arrow_up(object_indexes, base_attrs_i)
         return intention_i
 
+    def extension_i_batch(self, list_of_attribute_indexes, packed=False):
+        """Return indexes of maximal sets of objects which share each set of ``list_of_attribute_indexes``
+
+        Parameters
+        ----------
+        list_of_attribute_indexes : `list` of `list` of `int`
+            Sets of indexes of the attributes (from [0, ``n_attributes``-1])
+        packed : `bool`
+            A flag whether to return a bit-matrix packed into `numpy.uint64` words
+            (of shape len(``list_of_attribute_indexes``) x ceil(``n_objects``/64))
+
+        Returns
+        -------
+        extension_indexes_batch : `list` of `list` of `int` or `numpy.ndarray` of `numpy.uint64`
+            Indexes of maximal set of objects for each set of attributes (or the packed bit-matrix)
+
+        """
+        return self._data.arrow_down_batch(list_of_attribute_indexes, packed=packed)
+
+    def intention_i_batch(self, list_of_object_indexes, packed=False):
+        """Return indexes of maximal sets of attributes which are shared by each set of ``list_of_object_indexes``
+
+        Parameters
+        ----------
+        list_of_object_indexes : `list` of `list` of `int`
+            Sets of indexes of the objects (from [0, ``n_objects``-1])
+        packed : `bool`
+            A flag whether to return a bit-matrix packed into `numpy.uint64` words
+            (of shape len(``list_of_object_indexes``) x ceil(``n_attributes``/64))
+
+        Returns
+        -------
+        intention_indexes_batch : `list` of `list` of `int` or `numpy.ndarray` of `numpy.uint64`
+            Indexes of maximal set of attributes for each set of objects (or the packed bit-matrix)
+
+        """
+        return self._data.arrow_up_batch(list_of_object_indexes, packed=packed)
+
     def intention(self, objects):
         """Return maximal set of attributes which are shared by given ``objects``
 
@@ -365,6 +433,45 @@ class FormalContext:
         from fcapy.context.converters import read_csv
         return read_csv(path, sep, word_true, word_false)
 
+    def to_bin(self, path=None):
+        """Convert the FormalContext into compact binary file format (save if ``path`` is given)
+
+        Parameters
+        ----------
+        path : `str` or None
+            Path to save a context
+
+        Returns
+        -------
+        context : `bytes`
+            If ``path`` is None, the bytes with .bin file data is returned. If ``path`` is given - return None
+
+        """
+        from fcapy.context.converters import write_bin
+        return write_bin(self, path)
+
+    @staticmethod
+    def from_bin(path=None, data=None, mmap=True):
+        """Construct a FormalContext from compact binary file format (see `FormalContext.to_bin`)
+
+        Parameters
+        ----------
+        path : `str`
+            Path to load a context from
+        data : `bytes`
+            The data of .bin file (if it is already loaded into python). Used if ``path`` is None
+        mmap : `bool`
+            A flag whether to memory-map the packed data of the file (if True) or to read it into memory (if False)
+
+        Returns
+        -------
+        context : `FormalContext`
+            A FormalContext loaded from ``path`` or ``data``
+
+        """
+        from fcapy.context.converters import read_bin
+        return read_bin(path, data, mmap)
+
     def to_pandas(self):
         """Convert the FormalContext into pandas.DataFrame object
 
@@ -396,6 +503,23 @@ class FormalContext:
         from fcapy.context.converters import from_pandas
         return from_pandas(dataframe)
 
+    def to_numpy(self, packed=False):
+        """Convert the data of the FormalContext into `numpy.ndarray`
+
+        Parameters
+        ----------
+        packed : `bool`
+            A flag whether to return the rows packed into little-endian `numpy.uint64` words
+            (of shape ``n_objects`` x ceil(``n_attributes``/64)) instead of the boolean array
+
+        Returns
+        -------
+        data : `numpy.ndarray`
+            The boolean array of shape ``n_objects`` x ``n_attributes`` (or the packed words if ``packed`` is True)
+
+        """
+        return self._data.to_numpy(packed)
+
     def __repr__(self):
         data_to_print = f'FormalContext ' +\
                         f'({self.n_objects} objects, {self.n_attributes} attributes, ' +\
@@ -553,12 +677,16 @@ class FormalContext:
         return hash((tuple(self._object_names), tuple(self._attribute_names), hash(self._data)))
 
     def hash_fixed(self):
-        """Hash value of FormalContext which do not differ between sessions"""
-        str_ = str(self._object_names)
-        str_ += str(self._attribute_names)
-        str_ += str( self._data.to_list() if isinstance(self._data, BinTable) else self._data )
+        """Hash value of FormalContext which do not differ between sessions
+
+        The value is the adler32 checksum of the names of objects, attributes and the data of the context.
+        The checksums of the names and of the data are cached. So the value is computed only once
+        """
+        if self._names_digest is None:
+            names_bytes = (str(self._object_names) + str(self._attribute_names)).encode()
+            self._names_digest = zlib.adler32(names_bytes), len(names_bytes)
 
-        code = zlib.adler32(str_.encode())
+        code, _ = combine_digests(self._names_digest, self._data._get_digest())
         return code
 
     def __getitem__(self, item):
@@ -578,6 +706,183 @@ class FormalContext:
 
         return data
 
+    def reduce(self, reduce_objects=True, reduce_attributes=True, return_indexes=False):
+        """Return the clarified and reduced version of the context
+
+        The clarification merges identical objects (rows) and identical attributes (columns).
+        The reduction drops reducible objects and attributes: an attribute m is reducible if its extent m'
+        is the intersection of the extents of the attributes with bigger extents (the same for objects).
+        The concept lattice of the reduced context is isomorphic to the concept lattice of the initial one.
+
+        Parameters
+        ----------
+        reduce_objects : `bool`
+            A flag whether to clarify and reduce the set of objects
+        reduce_attributes : `bool`
+            A flag whether to clarify and reduce the set of attributes
+        return_indexes : `bool`
+            A flag whether to return the indexes of kept objects and attributes
+
+        Returns
+        -------
+        context_reduced : `FormalContext`
+            The reduced context (its objects and attributes keep their names)
+        object_indexes : `list` of `int`
+            Indexes of objects of this context kept in ``context_reduced``. Returned if ``return_indexes`` is True
+        attribute_indexes : `list` of `int`
+            Indexes of attributes of this context kept in ``context_reduced``. Returned if ``return_indexes`` is True
+
+        """
+        attribute_indexes = list(range(self.n_attributes))
+        if reduce_attributes:
+            extents_i = self.extension_i_batch([[m_i] for m_i in attribute_indexes])
+            extents_masks = [indexes_to_mask(ext_i) for ext_i in extents_i]
+            attribute_indexes = self._find_irreducible(extents_masks, indexes_to_mask(range(self.n_objects)))
+
+        object_indexes = list(range(self.n_objects))
+        if reduce_objects:
+            attributes_mask = indexes_to_mask(attribute_indexes)
+            intents_masks = [indexes_to_mask(int_i) & attributes_mask
+                             for int_i in self.intention_i_batch([[g_i] for g_i in object_indexes])]
+            object_indexes = self._find_irreducible(intents_masks, attributes_mask)
+
+        context_reduced = self[object_indexes, attribute_indexes]
+        if return_indexes:
+            return context_reduced, object_indexes, attribute_indexes
+        return context_reduced
+
+    @staticmethod
+    def _find_irreducible(masks, full_mask):
+        """Return the indexes of the first occurrences of the irreducible bit ``masks``
+
+        A mask is reducible if it is the intersection of the masks which are its strict supersets
+        (the intersection of no masks is ``full_mask``). The masks are sorted by descending number of bits.
+        So the supersets of a mask are searched only among the preceding masks
+        and the search stops as soon as their intersection shrinks to the mask
+        """
+        # the first occurrences of unique masks (clarification)
+        unique_masks = {}
+        for idx, mask in enumerate(masks):
+            unique_masks.setdefault(mask, idx)
+        masks = sorted(unique_masks, key=lambda mask: bin(mask).count('1'), reverse=True)
+
+        irreducible = []
+        for mask_i, mask in enumerate(masks):
+            supermasks_intersection = full_mask
+            for other_mask in masks[:mask_i]:
+                if other_mask & mask == mask:
+                    supermasks_intersection &= other_mask
+                    if supermasks_intersection == mask:
+                        break
+            if supermasks_intersection != mask:
+                irreducible.append(unique_masks[mask])
+        return sorted(irreducible)
+
+    def view(self, object_indexes=None, attribute_indexes=None):
+        """Return a FormalContext which looks at the objects ``object_indexes`` and attributes ``attribute_indexes``
+
+        Unlike ``self[object_indexes, attribute_indexes]`` the data of the context is not copied.
+        The new context is backed by `BinTableView` over the data of this context
+
+        Parameters
+        ----------
+        object_indexes : `list` of `int`
+            Indexes of objects to keep (default: all the objects)
+        attribute_indexes : `list` of `int`
+            Indexes of attributes to keep (default: all the attributes)
+
+        Returns
+        -------
+        context : `FormalContext`
+            The context with the data viewed from this context
+
+        """
+        data = BinTableView(self._data, object_indexes, attribute_indexes)
+        object_names = slice_list(self._object_names, object_indexes) if object_indexes is not None \
+            else self._object_names
+        attribute_names = slice_list(self._attribute_names, attribute_indexes) if attribute_indexes is not None \
+            else self._attribute_names
+        target = slice_list(self._target, object_indexes) if self._target is not None and object_indexes is not None \
+            else self._target
+        return FormalContext(data, object_names, attribute_names, target=target)
+
+    def append_objects(self, data, object_names=None, target=None):
+        """Append new objects to the context
+
+        The data of the context grows in place (with amortized reallocations for `BinTableNumpy` data).
+        So the indexes of the existing objects and attributes stay valid
+        and the cached digest of ``hash_fixed`` is updated with the new objects only
+
+        Parameters
+        ----------
+        data : `list` of `list` of `bool` or `numpy.ndarray` of `bool`
+            data[i][j] represents whether i-th new object shares j-th attribute
+        object_names : `list` of `str`, optional
+            Names of the new objects (default are '`n_objects`', '`n_objects`+1', ...)
+        target : `list`, optional
+            Target values of the new objects. Should be given iff the context has the ``target``
+
+        """
+        if (target is None) != (self._target is None):
+            raise ValueError('FormalContext.append_objects: '
+                             '"target" should be given if and only if the context has the target values')
+
+        # the parameters are validated before the context is changed
+        data = data if hasattr(data, '__len__') else list(data)
+        n_objects_old, n_new = self.n_objects, len(data)
+        if object_names is None:
+            object_names = [str(idx) for idx in range(n_objects_old, n_objects_old + n_new)]
+        assert len(object_names) == n_new,\
+            'FormalContext.append_objects: Length of "object_names" should match the number of new objects'
+        if target is not None:
+            assert len(target) == n_new,\
+                'FormalContext.append_objects: Length of "target" should match the number of new objects'
+
+        self._data.append_rows(data)
+        self.object_names = tuple(self._object_names or ()) + tuple(object_names)
+        if self.attribute_names is None:
+            self.attribute_names = None
+
+        if target is not None:
+            if LIB_INSTALLED['numpy'] and isinstance(self._target, np.ndarray):
+                self._target = np.concatenate([self._target, target])
+            else:
+                self._target = list(self._target) + list(target)
+
+    def append_attributes(self, data, attribute_names=None):
+        """Append new attributes to the context
+
+        The indexes of the existing objects and attributes stay valid
+
+        Parameters
+        ----------
+        data : `list` of `list` of `bool` or `numpy.ndarray` of `bool`
+            The values of the new attributes given object by object:
+            data[i][j] represents whether i-th object shares j-th new attribute
+        attribute_names : `list` of `str`, optional
+            Names of the new attributes (default are '`n_attributes`', '`n_attributes`+1', ...)
+
+        """
+        # the parameters are validated before the context is changed
+        data = data if hasattr(data, '__len__') else list(data)
+        assert len(data) == self.n_objects,\
+            'FormalContext.append_attributes: The number of rows in "data" should match the number of objects'
+        if hasattr(data, 'shape'):
+            assert len(data.shape) == 2, 'FormalContext.append_attributes: "data" should be a two dimensional array'
+            n_new = data.shape[1]
+        else:
+            n_new = len(data[0]) if len(data) > 0 else 0
+            assert all([len(row) == n_new for row in data]),\
+                'FormalContext.append_attributes: All rows of "data" should have the same length'
+        n_attributes_old = self.n_attributes
+        if attribute_names is None:
+            attribute_names = [str(idx) for idx in range(n_attributes_old, n_attributes_old + n_new)]
+        assert len(attribute_names) == n_new,\
+            'FormalContext.append_attributes: Length of "attribute_names" should match the number of new attributes'
+
+        self._data.append_columns(data)
+        self.attribute_names = tuple(self._attribute_names or ()) + tuple(attribute_names)
+
     def to_numeric(self):
         """A method to extract the data of the context in a numerical form (and the names of numerical attributes)
 
@@ -586,7 +891,7 @@ class FormalContext:
         Returns
         -------
         data : `list` of `list` of `bool`
-            Binary data of connections between objects and attributes
+            Binary data of connections between objects and attributes (see `FormalContext.to_numpy` for numpy array)
         attribute_names : `list` of `str`
             Name of attributes from the context
 
@@ -26,15 +26,17 @@ class ConceptLattice(Lattice):
     Methods
     -------
     from_context(context, algo, ...):
-       Construct a ConceptLattice from the given ``context`` by specified ``algo`` ('CbO','Sofia', 'RandomForest')
+       Construct a ConceptLattice from the given ``context`` by specified ``algo`` ('CbO', 'FCbO', 'InClose', ...)
     calc_concepts_measures(measure, ...):
        Calculate interestingness ``measure`` of concepts in the ConceptLattice (like 'stability' or 'stability_bounds')
     trace_context(context, ...):
        Get the set of concepts from the ConceptLattice which describe objects from the given ``context``
     add_concept(new_concept):
        Add ``new_concept`` to the ConceptLattice
+    add_object(intent_i, ...):
+       Add a new object described by ``intent_i`` to the ConceptLattice (by AddIntent algorithm)
     remove_concept(concept_i):
-       Remove a concept with ``concept_i`` index from the ConceptLattice
+       Remove a concept with ``concept_i`` index (or a collection of concepts) from the ConceptLattice
 
     Notes
     -----
@@ -56,6 +58,8 @@ class ConceptLattice(Lattice):
 
     """
     CLASS_NAME = 'ConceptLattice'
+    # algorithms which compute all the concepts. So they can be run on the reduced context
+    REDUCIBLE_CONTEXT_ALGOS = ('CbO', 'FCbO', 'InClose', 'NextClosure')
 
     def __init__(self, concepts, **kwargs):
         """Construct a ConceptLattice based on a set of ``concepts`` and ``**kwargs`` values
@@ -70,19 +74,14 @@ class ConceptLattice(Lattice):
                 A dictionary with superconcept (inverse order) relation on the ``concepts``
         """
 
-        super(ConceptLattice, self).__init__(concepts, self.concepts_leq_func, use_cache=True)
-
         subconcepts_dict = kwargs.get('subconcepts_dict')
         superconcepts_dict = kwargs.get('superconcepts_dict')
-        if subconcepts_dict is not None or superconcepts_dict is not None:
-            if superconcepts_dict is None:
-                superconcepts_dict = self._transpose_hierarchy(subconcepts_dict)
-            if subconcepts_dict is None:
-                subconcepts_dict = self._transpose_hierarchy(superconcepts_dict)
-            self._cache_direct_subelements = subconcepts_dict
-            self._cache_direct_superelements = superconcepts_dict
-            self._cache_subelements = self._closed_relation_cache_by_direct_cache(subconcepts_dict)
-            self._cache_superelements = self._closed_relation_cache_by_direct_cache(superconcepts_dict)
+        if subconcepts_dict is None and superconcepts_dict is not None:
+            subconcepts_dict = self._transpose_hierarchy(superconcepts_dict)
+
+        # the caches of the order are filled up before looking for the top and the bottom concepts
+        super(ConceptLattice, self).__init__(concepts, self.concepts_leq_func, use_cache=True,
+                                             direct_subelements_dict=subconcepts_dict)
 
         self._generators_dict = {}
 
@@ -186,9 +185,16 @@ class ConceptLattice(Lattice):
         Parameters
         ----------
         context: 'FormalContext` or 'MVContext`
-        algo: `str` in {'CbO', 'Sofia', 'RandomForest'}
+        algo: `str` in {'CbO', 'FCbO', 'InClose', 'NextClosure', 'Iceberg', 'Sofia', 'RandomForest'}
         kwargs:
-            Parameters used in CbO, Sofia and RandomForest algorithms from `fcapy.algorithms.concept_construction` module
+            Parameters used in CbO, FCbO, InClose, NextClosure, Iceberg, Sofia and RandomForest algorithms
+            from `fcapy.algorithms.concept_construction` module.
+            E.g. ``min_support`` for 'Iceberg' algorithm computing only the frequent concepts
+            reduce_context: `bool`
+                A flag whether to construct the lattice on the reduced ``context`` (see `FormalContext.reduce`)
+                and to expand its concepts back to the ``context`` (default False).
+                Can only be used for `FormalContext` and the algorithms computing all the concepts
+                ('CbO', 'FCbO', 'InClose', 'NextClosure')
 
         Returns
         -------
@@ -199,12 +205,40 @@ class ConceptLattice(Lattice):
         if algo is None:
             algo = 'Sofia' if type(context) == MVContext else 'CbO'
 
-        if algo in {'CbO', 'RandomForest'}:
-            algo_func = {'CbO': cca.close_by_one, 'RandomForest': cca.random_forest_concepts}[algo]
+        if kwargs.get('reduce_context', False):
+            assert type(context) == FormalContext, \
+                'ConceptLattice.from_context error. Only FormalContext can be reduced'
+            assert algo in cls.REDUCIBLE_CONTEXT_ALGOS, \
+                f'ConceptLattice.from_context error. The context can not be reduced for algorithm {algo}. ' \
+                f'Possible algorithms are: {cls.REDUCIBLE_CONTEXT_ALGOS}'
+            context_reduced, _, attribute_indexes = context.reduce(return_indexes=True)
+            if context_reduced.n_objects == 0 or context_reduced.n_attributes == 0:
+                # the lattice of the context consists of a single concept (e.g. all the cells of the context are True)
+                top_concept = FormalConcept((), (), range(context_reduced.n_attributes), context_reduced.attribute_names,
+                                            context_hash=context_reduced.hash_fixed())
+                ltc_reduced = ConceptLattice([top_concept], subconcepts_dict={0: set()})
+                return cls._expand_reduced_lattice(ltc_reduced, context, attribute_indexes)
+
+            kwargs = dict(kwargs, reduce_context=False)
+            ltc_reduced = cls.from_context(context_reduced, algo=algo, **kwargs)
+            return cls._expand_reduced_lattice(ltc_reduced, context, attribute_indexes)
+
+        if algo in {'CbO', 'FCbO', 'InClose', 'NextClosure', 'Iceberg', 'RandomForest'}:
+            algo_func = {'CbO': cca.close_by_one, 'FCbO': cca.fast_close_by_one, 'InClose': cca.in_close,
+                         'NextClosure': cca.next_closure, 'Iceberg': cca.iceberg_concepts,
+                         'RandomForest': cca.random_forest_concepts}[algo]
             kwargs_used = utils.get_kwargs_used(kwargs, algo_func)
             concepts = algo_func(context, **kwargs_used)
             concepts = cls.sort_concepts(concepts)
-            subconcepts_dict = lca.construct_lattice_by_spanning_tree(concepts, is_concepts_sorted=True)
+            subconcepts_dict = None
+            if algo in cls.REDUCIBLE_CONTEXT_ALGOS:
+                try:
+                    subconcepts_dict = lca.construct_lattice_by_ipred(concepts, is_concepts_sorted=True)
+                except ValueError:
+                    # the concepts are not the whole lattice (e.g. CbO was run from ``initial_combinations``)
+                    pass
+            if subconcepts_dict is None:
+                subconcepts_dict = lca.construct_lattice_by_spanning_tree(concepts, is_concepts_sorted=True)
 
             ltc = ConceptLattice(
                 concepts=concepts, subconcepts_dict=subconcepts_dict
@@ -244,9 +278,44 @@ class ConceptLattice(Lattice):
 
         else:
             raise ValueError(f'ConceptLattice.from_context error. Algorithm {algo} is not supported.\n'
-                             f'Possible values are: "CbO" (stands for CloseByOne), "Sofia", "RandomForest')
+                             f'Possible values are: "CbO" (stands for CloseByOne), '
+                             f'"FCbO" (stands for Fast CloseByOne), "InClose", "NextClosure", "Iceberg", '
+                             f'"Sofia", "RandomForest"')
         return ltc
 
+    @classmethod
+    def _expand_reduced_lattice(cls, lattice_reduced, context: FormalContext, attribute_indexes):
+        """Return the lattice on ``context`` isomorphic to the ``lattice_reduced`` constructed on the reduced context
+
+        Parameters
+        ----------
+        lattice_reduced: `ConceptLattice`
+            A lattice constructed on the reduced version of ``context``
+        context: `FormalContext`
+            The initial (not reduced) context
+        attribute_indexes: `list` of `int`
+            Indexes of attributes of ``context`` kept in the reduced context
+
+        """
+        intents_i = [[attribute_indexes[m_i] for m_i in c.intent_i] for c in lattice_reduced.concepts]
+        extents_i = context.extension_i_batch(intents_i)
+        intents_i = context.intention_i_batch(extents_i)
+
+        object_names, attribute_names = context.object_names, context.attribute_names
+        context_hash = context.hash_fixed()
+        concepts = [
+            FormalConcept(extent_i, [object_names[g_i] for g_i in extent_i],
+                          intent_i, [attribute_names[m_i] for m_i in intent_i], context_hash=context_hash)
+            for extent_i, intent_i in zip(extents_i, intents_i)
+        ]
+
+        concepts_sorted = cls.sort_concepts(concepts)
+        map_concept_i_sort = {c: c_sort_i for c_sort_i, c in enumerate(concepts_sorted)}
+        map_i_isort = [map_concept_i_sort[c] for c in concepts]
+        subconcepts_dict = {map_i_isort[c_i]: {map_i_isort[subc_i] for subc_i in subconcepts_i}
+                            for c_i, subconcepts_i in lattice_reduced.subconcepts_dict.items()}
+        return ConceptLattice(concepts_sorted, subconcepts_dict=subconcepts_dict)
+
     @staticmethod
     def sort_concepts(concepts):
         """Return the topologically sorted set of concepts
@@ -302,20 +371,157 @@ class ConceptLattice(Lattice):
         self.add(new_concept)
 
     def remove_concept(self, concept_i):
-        """Remove concept ``concept_i`` into the lattice"""
+        """Remove concept ``concept_i`` (or a collection of concepts indexes) from the lattice"""
         del self[concept_i]
 
-    def calc_concepts_measures(self, measure: str, context: FormalContext or MVContext = None):
+    def add_object(self, intent_i, object_name=None, context_hash=None):
+        """Add a new object described by attributes ``intent_i`` into the lattice by AddIntent algorithm
+
+        AddIntent creates the concepts which intents are the intersections of ``intent_i`` with the existing intents
+        and updates the cover relation locally. So only the part of the lattice above the new object is visited
+        (see "van der Merwe D., Obiedkov S., Kourie D. AddIntent: A new incremental algorithm
+        for constructing concept lattices", 2004)
+
+        Parameters
+        ----------
+        intent_i: `list` of `int`
+            A list of indexes of attributes describing the new object
+        object_name: `str`
+            The name of the new object. Defaults to the index of the new object
+        context_hash: `int`
+            Hash value of the context with the new object (e.g. after `FormalContext.append_objects`)
+            to set to all the concepts of the lattice. Defaults to None (keep the current context hash)
+
+        Returns
+        -------
+        object_concept_i: `int`
+            An index of the object concept of the new object (i.e. the smallest concept containing it)
+
+        """
+        assert all([isinstance(c, FormalConcept) for c in self._elements]), \
+            'ConceptLattice.add_object error. Only the lattices of FormalConcepts are supported'
+
+        caches = [self._cache_subelements, self._cache_superelements,
+                  self._cache_direct_subelements, self._cache_direct_superelements]
+        if any([len(cache) < len(self._elements) for cache in caches]):
+            self.fill_up_subelements_cache()
+            self.fill_up_superelements_cache()
+            self.fill_up_direct_subelements_cache()
+            self.fill_up_direct_superelements_cache()
+
+        if context_hash is not None:
+            for c in self._elements:
+                c._context_hash = context_hash
+        context_hash = self._elements[0].context_hash
+
+        object_i = len(self.top_concept.extent_i)
+        object_name = str(object_i) if object_name is None else object_name
+        attribute_names = dict(zip(self.bottom_concept.intent_i, self.bottom_concept.intent))
+
+        intents = {}
+
+        def get_intent(c_i):
+            if c_i not in intents:
+                intents[c_i] = frozenset(self._elements[c_i].intent_i)
+            return intents[c_i]
+
+        def get_maximal_concept(intent, generator_i):
+            """Go up from ``generator_i`` to the biggest concept which intent contains the ``intent``"""
+            is_parent_maximal = True
+            while is_parent_maximal:
+                is_parent_maximal = False
+                for parent_i in self._cache_direct_superelements[generator_i]:
+                    if intent <= get_intent(parent_i):
+                        generator_i, is_parent_maximal = parent_i, True
+                        break
+            return generator_i
+
+        def add_intent(intent, generator_i):
+            """Return the index of the concept with ``intent`` creating it (and its superconcepts) if needed"""
+            generator_i = get_maximal_concept(intent, generator_i)
+            if get_intent(generator_i) == intent:
+                return generator_i
+
+            new_parents = []
+            for candidate_i in list(self._cache_direct_superelements[generator_i]):
+                if not get_intent(candidate_i) <= intent:
+                    candidate_i = add_intent(get_intent(candidate_i) & intent, candidate_i)
+
+                add_parent = True
+                for parent_i in list(new_parents):
+                    if get_intent(candidate_i) <= get_intent(parent_i):
+                        add_parent = False
+                        break
+                    if get_intent(parent_i) <= get_intent(candidate_i):
+                        new_parents.remove(parent_i)
+                if add_parent:
+                    new_parents.append(candidate_i)
+
+            generator = self._elements[generator_i]
+            intent_i_sorted = sorted(intent)
+            new_concept = FormalConcept(generator.extent_i, generator.extent,
+                                        intent_i_sorted, [attribute_names[m_i] for m_i in intent_i_sorted],
+                                        context_hash=context_hash)
+            new_concept_i = self._add_cover(new_concept, generator_i, new_parents)
+            intents[new_concept_i] = intent
+            return new_concept_i
+
+        object_concept_i = add_intent(frozenset(intent_i), self.bottom_concept_i)
+
+        # the new object belongs to the extents of the object concept and all of its superconcepts
+        for c_i in self._cache_superelements[object_concept_i] | {object_concept_i}:
+            c = self._elements[c_i]
+            c_new = FormalConcept(c.extent_i + (object_i,), c.extent + (object_name,), c.intent_i, c.intent,
+                                  context_hash=context_hash)
+            self._update_element(c, c_new)
+        return object_concept_i
+
+    def _add_cover(self, new_concept, generator_i, parents_i):
+        """Add ``new_concept`` covering the concept ``generator_i`` and covered by the concepts ``parents_i``
+
+        Update the caches of (direct) subconcepts and superconcepts locally
+        """
+        new_concept_i = len(self._elements)
+        parents_i = frozenset(parents_i)
+        self._elements.append(new_concept)
+        self._elements_to_index_map[new_concept] = new_concept_i
+
+        self._cache_direct_subelements[new_concept_i] = frozenset({generator_i})
+        self._cache_direct_superelements[new_concept_i] = parents_i
+        for parent_i in parents_i:
+            self._cache_direct_subelements[parent_i] = \
+                (self._cache_direct_subelements[parent_i] - {generator_i}) | {new_concept_i}
+        self._cache_direct_superelements[generator_i] = \
+            (self._cache_direct_superelements[generator_i] - parents_i) | {new_concept_i}
+
+        subconcepts_i = self._cache_subelements[generator_i] | {generator_i}
+        superconcepts_i = frozenset().union(*[self._cache_superelements[p_i] | {p_i} for p_i in parents_i])
+        self._cache_subelements[new_concept_i] = subconcepts_i
+        self._cache_superelements[new_concept_i] = superconcepts_i
+        for c_i in subconcepts_i:
+            self._cache_superelements[c_i] = self._cache_superelements[c_i] | {new_concept_i}
+        for c_i in superconcepts_i:
+            self._cache_subelements[c_i] = self._cache_subelements[c_i] | {new_concept_i}
+
+        if len(parents_i) == 0:
+            self._cache_top_element = new_concept_i
+        return new_concept_i
+
+    def calc_concepts_measures(self, measure: str, context: FormalContext or MVContext = None, **kwargs):
         """Calculate the values of ``measure`` for each concept in a lattice
 
         The calculated measure values are stored in ``measures`` property of each ``concept`` from ``ConceptLattice.concepts``
 
         Parameters
         ----------
-        measure: `str` in ('LStab', 'UStab', 'stability_bounds', 'stability')
+        measure: `str` in ('LStab', 'UStab', 'stability_bounds', 'stability', 'stability_exact_lattice',
+                'stability_monte_carlo', 'target_entropy', 'mean_information_gain')
             The name of the measure to compute
         context: `FormalContext` or `MVContext`
-            The context is used when calculating 'stability' measure
+            The context is used when calculating 'stability', 'stability_monte_carlo' and 'target_entropy' measures
+        kwargs:
+            Parameters of the measure. E.g. ``epsilon``, ``delta`` and ``random_state`` of 'stability_monte_carlo'
+            (see `concept_measures.stability_monte_carlo`). The estimates are stored as 'StabMC' measure
         Returns
         -------
         None
@@ -323,7 +529,15 @@ class ConceptLattice(Lattice):
         """
         from fcapy.lattice import concept_measures as cms
 
-        if measure in ('stability_bounds', 'LStab', 'UStab'):
+        # the measures are computed for all the concepts at once by numpy kernels (if numpy is installed)
+        use_batch = LIB_INSTALLED['numpy'] and len(self.concepts) > 0
+
+        if measure in ('stability_bounds', 'LStab', 'UStab') and use_batch:
+            lbs, ubs = cms.stability_bounds_batch(cms.pack_extents(self), self.subconcepts_dict)
+            for c, lb, ub in zip(self.concepts, lbs.tolist(), ubs.tolist()):
+                c.measures['LStab'] = lb
+                c.measures['UStab'] = ub
+        elif measure in ('stability_bounds', 'LStab', 'UStab'):
             for c_i, c in enumerate(self.concepts):
                 lb, ub = cms.stability_bounds(c_i, self)
                 c.measures['LStab'] = lb
@@ -336,9 +550,30 @@ class ConceptLattice(Lattice):
             for c_i, c in enumerate(self.concepts):
                 s = cms.stability(c_i, self, context)
                 c.measures['Stab'] = s
+        elif measure == 'stability_exact_lattice':
+            for c, s in zip(self.concepts, cms.stability_exact_lattice(self)):
+                c.measures['Stab'] = s
+        elif measure == 'stability_monte_carlo':
+            assert context is not None, 'ConceptLattice.calc_concepts_measures failed. ' \
+                                        'Please specify `context` parameter to estimate the stability'
+            assert LIB_INSTALLED['numpy'], \
+                'ConceptLattice.calc_concepts_measures failed. Package "numpy" should be installed to estimate the stability'
+            kwargs = dict(kwargs, random_state=np.random.default_rng(kwargs.get('random_state')),
+                          context_columns=cms.unpack_context_columns(context))
+            for c_i, c in enumerate(self.concepts):
+                c.measures['StabMC'] = cms.stability_monte_carlo(c_i, self, context, **kwargs)
+        elif measure == 'target_entropy' and use_batch:
+            extents_packed = cms.pack_extents(self, n_objects=len(context.target))
+            for c, v in zip(self.concepts, cms.target_entropy_batch(extents_packed, context.target).tolist()):
+                c.measures[measure] = v
         elif measure == 'target_entropy':
             for c_i, c in enumerate(self.concepts):
                 c.measures[measure] = cms.target_entropy(c_i, self, context)
+        elif measure == 'mean_information_gain' and use_batch:
+            target_entropies = [c.measures['target_entropy'] for c in self.concepts]
+            gains = cms.mean_information_gain_batch(target_entropies, self.all_superconcepts_dict)
+            for c, v in zip(self.concepts, gains.tolist()):
+                c.measures[measure] = v
         elif measure == 'mean_information_gain':
             for c_i, c in enumerate(self.concepts):
                 c.measures[measure] = cms.mean_information_gain(c_i, self)
@@ -348,8 +583,8 @@ class ConceptLattice(Lattice):
             for c_i, c in enumerate(self.concepts):
                 c.measures[name] = func(c_i, self, context)
         else:
-            possible_measures = ['stability_bounds', 'LStab', 'UStab', 'stability',
-                                 'target_entropy', 'mean_information_gain']
+            possible_measures = ['stability_bounds', 'LStab', 'UStab', 'stability', 'stability_exact_lattice',
+                                 'stability_monte_carlo', 'target_entropy', 'mean_information_gain']
             raise ValueError(f'ConceptLattice.calc_concepts_measures. The given measure {measure} is unknown. ' +
                              f'Possible measure values are either strings: {",".join(possible_measures)}, ' 
                              f'or a pair (measure_name: str, measure_func: c_i, lattice, context -> float)')
@@ -436,6 +671,9 @@ class ConceptLattice(Lattice):
 
         """
         concept_extents = {}
+        if not use_generators:
+            extents_i = context.extension_i_batch([c.intent_i for c in self.concepts])
+            concept_extents = {c_i: set(extent_i) for c_i, extent_i in enumerate(extents_i)}
         if return_generators_extents:
             generators_extents = []
 
@@ -557,10 +795,11 @@ class ConceptLattice(Lattice):
         map_isort_i = [map_concept_i[concepts_sorted[c_i_sort]] for c_i_sort in range(len(self.concepts))]
         concepts_to_visit = map_isort_i
 
+        supc_exts_i = context.extension_i_batch([c.intent_i for c in self.concepts])
         if not LIB_INSTALLED['numpy'] or type(context) is not MVContext:
-            supc_exts_i = [frozenset(context.extension_i(c.intent_i)) for c in self.concepts]
+            supc_exts_i = [frozenset(ext_i) for ext_i in supc_exts_i]
         else:
-            supc_exts_i = [np.array(context.extension_i(c.intent_i)) for c in self.concepts]
+            supc_exts_i = [np.array(ext_i) for ext_i in supc_exts_i]
 
         for c_i in utils.safe_tqdm(concepts_to_visit[1:], disable=not use_tqdm, desc='Calc conditional generators'):
             intent_i = self.concepts[c_i].intent_i
@@ -16,7 +16,10 @@ Buzmakov, Aleksey & Kuznetsov, Sergei & Napoli, Amedeo. (2014). Scalable Estimat
 
 from fcapy.lattice.concept_lattice import ConceptLattice
 from fcapy.context.formal_context import FormalContext
+from fcapy.context.bintable import BinTableNumpy, pack_bits, pack_indexes_batch, unpack_bits, popcount
 from fcapy.utils.utils import powerset
+from itertools import chain
+import math
 
 from fcapy import LIB_INSTALLED
 if LIB_INSTALLED['numpy']:
@@ -42,16 +45,129 @@ def stability(c_i, lattice: ConceptLattice, context: FormalContext):
     return x
 
 
+def stability_exact_lattice(lattice: ConceptLattice):
+    """Compute the exact stability of all the concepts of a ``lattice`` in one bottom-up pass
+
+    Every subset of the extent of a concept is closed into the extent of the concept itself or of its subconcept.
+    So the number of subsets closed into the extent of a concept is 2^(extent size) minus the numbers
+    of subsets closed into the extents of all its subconcepts (see "Roth C., Obiedkov S., Kourie D.
+    On succinct representation of knowledge community taxonomies with formal concept analysis", 2008).
+    The ``lattice`` should contain all the concepts of the context
+
+    Returns
+    -------
+    stabilities: `list` of `float`
+        The stability of each concept of the ``lattice``
+
+    """
+    concepts = lattice.concepts
+    all_subconcepts_dict = lattice.all_subconcepts_dict
+    n_closed_subsets = [None] * len(concepts)  # exact python integers
+    for c_i in sorted(range(len(concepts)), key=lambda c_i: len(concepts[c_i].extent_i)):
+        n_closed_subsets[c_i] = 2 ** len(concepts[c_i].extent_i) \
+            - sum([n_closed_subsets[d_i] for d_i in all_subconcepts_dict[c_i]])
+    return [n / 2 ** len(c.extent_i) for n, c in zip(n_closed_subsets, concepts)]
+
+
+def stability_monte_carlo(c_i, lattice: ConceptLattice, context: FormalContext,
+                          epsilon=0.01, delta=0.05, random_state=None, context_columns=None):
+    """Estimate the stability of the concept number ``c_i`` of a ``lattice`` by sampling subsets of its extent
+
+    The stability is the share of subsets of the extent which closures give the intent of the concept.
+    The subsets are drawn uniformly in batches as random words of bits. A subset gives the intent of the concept
+    iff for every other attribute it contains an object without this attribute. So the check is done
+    by bit operations with the objects of the extent not sharing each of the other attributes.
+
+    By Hoeffding inequality, ceil(ln(2/``delta``) / (2 * ``epsilon`` ** 2)) samples are enough for the estimate
+    to be ``epsilon``-close to the exact stability with probability at least 1 - ``delta``.
+    If there are fewer subsets of the extent than samples, the exact stability is computed
+
+    Parameters
+    ----------
+    c_i: `int`
+        An index of the concept in the ``lattice``
+    lattice: `ConceptLattice`
+        A lattice constructed over ``context``
+    context: `FormalContext`
+        A context to compute the closures of the subsets in
+    epsilon: `float`
+        The maximal absolute error of the estimate
+    delta: `float`
+        The probability that the estimate is more than ``epsilon`` far from the exact stability
+    random_state: `int` or `numpy.random.Generator`
+        A seed (or a random generator) to draw the subsets
+    context_columns: `numpy.ndarray` of `bool`
+        The columns of the ``context`` given by `unpack_context_columns`.
+        Should be passed when the stability is estimated for many concepts of the same context
+
+    Returns
+    -------
+    stability: `float`
+        The estimate of the concept stability
+
+    """
+    assert LIB_INSTALLED['numpy'], 'stability_monte_carlo: Package "numpy" should be installed'
+    assert isinstance(context, FormalContext), 'stability_monte_carlo: Only FormalContext is supported'
+    if not (epsilon > 0 and 0 < delta < 1):
+        raise ValueError(f'stability_monte_carlo error. '
+                         f'"epsilon" should be positive and "delta" should be in (0, 1) ({epsilon}, {delta} given)')
+
+    c = lattice.concepts[c_i]
+    extent_i = list(c.extent_i)
+    intent_i = set(c.intent_i)
+    other_attributes = [m_i for m_i in range(context.n_attributes) if m_i not in intent_i]
+    if len(extent_i) == 0 or len(other_attributes) == 0:
+        return 1
+
+    # objects of the extent which do not share each of the other attributes
+    if context_columns is None:
+        context_columns = unpack_context_columns(context)
+    lacks = pack_bits(~context_columns[np.ix_(other_attributes, extent_i)])
+    n_words = lacks.shape[1]
+
+    n_samples = math.ceil(math.log(2 / delta) / (2 * epsilon ** 2))
+    is_exact = len(extent_i) < BinTableNumpy.WORD_SIZE and 2 ** len(extent_i) <= n_samples
+    if is_exact:
+        n_samples = 2 ** len(extent_i)
+    else:
+        rng = np.random.default_rng(random_state)
+        last_word_mask = np.uint64((1 << (len(extent_i) % BinTableNumpy.WORD_SIZE or BinTableNumpy.WORD_SIZE)) - 1)
+
+    batch_size = max(1, BinTableNumpy.BATCH_SIZE // (n_words * len(other_attributes)))
+    n_stable = 0
+    for start in range(0, n_samples, batch_size):
+        size = min(batch_size, n_samples - start)
+        if is_exact:
+            subsets = np.arange(start, start + size, dtype=np.uint64)[:, None]
+        else:
+            subsets = rng.integers(0, np.iinfo(np.uint64).max, size=(size, n_words), dtype=np.uint64, endpoint=True)
+            subsets[:, -1] &= last_word_mask
+        is_stable = ((subsets[:, None, :] & lacks[None, :, :]) != 0).any(axis=2).all(axis=1)
+        n_stable += int(is_stable.sum())
+    return n_stable / n_samples
+
+
+def unpack_context_columns(context: FormalContext):
+    """Return the columns of the ``context`` as a boolean `numpy.ndarray` of shape ``n_attributes`` x ``n_objects``
+
+    The columns are computed by one batch of packed extensions of the attributes
+    """
+    assert LIB_INSTALLED['numpy'], 'unpack_context_columns: Package "numpy" should be installed'
+    columns_packed = context.extension_i_batch([[m_i] for m_i in range(context.n_attributes)], packed=True)
+    return unpack_bits(columns_packed, context.n_objects)
+
+
 def stability_bounds(c_i, lattice: ConceptLattice):
     """Compute the lower and upper stability of the concept number ``c_i`` of a ``lattice`` constructed over ``context``
 
     Approximate but polynomial time to compute measure of concept stability
     """
     c = lattice.concepts[c_i]
-    dd_i = lattice.subconcepts_dict[c_i]
+    dd_i = lattice.direct_sub_elements(c_i)
     inv_diff = [0]
     if len(dd_i) > 0:
-        inv_diff = [2**(-len(set(c.extent_i)-set(lattice.concepts[d_i].extent_i))) for d_i in dd_i]
+        # the extent of a subconcept is a subset of the extent of the concept
+        inv_diff = [2**(-(len(c.extent_i)-len(lattice.concepts[d_i].extent_i))) for d_i in dd_i]
 
     lb = 1 - sum(inv_diff)
     ub = 1 - max(inv_diff)
@@ -68,3 +184,117 @@ def mean_information_gain(c_i, lattice: ConceptLattice):
     h = lattice[c_i].measures['target_entropy']
     mean_parent_h = np.mean([lattice[parent_i].measures['target_entropy'] for parent_i in lattice.super_elements(c_i)])
     return mean_parent_h - h
+
+
+def pack_extents(lattice: ConceptLattice, n_objects=None):
+    """Pack the extents of the concepts of ``lattice`` into the rows of a matrix of `numpy.uint64` words
+
+    Parameters
+    ----------
+    lattice: `ConceptLattice`
+        A lattice to pack the extents of
+    n_objects: `int`
+        The number of objects in the context (defaults to the size of the extent of the top concept)
+
+    Returns
+    -------
+    extents_packed: `numpy.ndarray` of `numpy.uint64`
+        The bit-matrix of shape len(``lattice.concepts``) x ceil(``n_objects``/64)
+
+    """
+    assert LIB_INSTALLED['numpy'], 'pack_extents: Package "numpy" should be installed'
+    if n_objects is None:
+        n_objects = max(lattice.top_concept.extent_i, default=-1) + 1
+
+    # the extents are packed in blocks so the unpacked boolean matrix never takes much memory
+    block_size = max(1, BinTableNumpy.BATCH_SIZE // max(1, n_objects))
+    extents = [c.extent_i for c in lattice.concepts]
+    blocks = [pack_indexes_batch(extents[start:start + block_size], n_objects)
+              for start in range(0, len(extents), block_size)]
+    if len(blocks) == 0:
+        return np.zeros((0, -(-n_objects // BinTableNumpy.WORD_SIZE)), dtype='<u8')
+    return np.concatenate(blocks)
+
+
+def stability_bounds_batch(extents_packed, subconcepts_dict):
+    """Compute the lower and upper stability bounds of all the concepts at once
+
+    Parameters
+    ----------
+    extents_packed: `numpy.ndarray` of `numpy.uint64`
+        The extents of the concepts packed into words (see `pack_extents`)
+    subconcepts_dict: `dict` of type {`int`: `set` of `int`}
+        The cover relation: the indexes of direct subconcepts of each concept
+
+    Returns
+    -------
+    lower_bounds: `numpy.ndarray` of `float`
+        The lower stability bounds of the concepts
+    upper_bounds: `numpy.ndarray` of `float`
+        The upper stability bounds of the concepts
+
+    """
+    n_concepts = len(extents_packed)
+    supports = popcount(extents_packed).sum(axis=1).astype(np.int64)
+    parents, children = _relation_to_arrays(subconcepts_dict, n_concepts)
+
+    inv_diff = np.exp2(-(supports[parents] - supports[children]).astype(float))
+    lower_bounds = 1 - np.bincount(parents, weights=inv_diff, minlength=n_concepts)
+    max_inv_diff = np.zeros(n_concepts)
+    np.maximum.at(max_inv_diff, parents, inv_diff)
+    upper_bounds = 1 - max_inv_diff
+    return lower_bounds, upper_bounds
+
+
+def target_entropy_batch(extents_packed, target):
+    """Compute the variance of ``target`` values of objects from the extent of each concept at once
+
+    The extents are unpacked by blocks of concepts. So the boolean matrix of all extents is never put into memory
+    """
+    y = np.asarray(target, dtype=float)
+    y = y - y.mean() if len(y) > 0 else y  # centered target loses less precision in the variance formula
+    n_concepts = len(extents_packed)
+    block_size = max(1, BinTableNumpy.BATCH_SIZE // max(1, len(y)))
+
+    variances = np.zeros(n_concepts)
+    for start in range(0, n_concepts, block_size):
+        flags = unpack_bits(extents_packed[start:start + block_size], len(y)).astype(float)
+        supports, sums, sums_squared = flags.sum(axis=1), flags @ y, flags @ (y * y)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            variances[start:start + len(flags)] = np.maximum(sums_squared / supports - (sums / supports) ** 2, 0)
+    return variances
+
+
+def mean_information_gain_batch(target_entropies, all_superconcepts_dict):
+    """Compute the mean information gain of all the concepts at once
+
+    Parameters
+    ----------
+    target_entropies: `numpy.ndarray` of `float`
+        The values of target entropy of each concept (see `target_entropy_batch`)
+    all_superconcepts_dict: `dict` of type {`int`: `set` of `int`}
+        The indexes of all superconcepts of each concept
+
+    Returns
+    -------
+    information_gains: `numpy.ndarray` of `float`
+        The difference between the mean target entropy of the superconcepts of a concept and its target entropy
+
+    """
+    target_entropies = np.asarray(target_entropies, dtype=float)
+    n_concepts = len(target_entropies)
+    concepts, superconcepts = _relation_to_arrays(all_superconcepts_dict, n_concepts)
+
+    sums = np.bincount(concepts, weights=target_entropies[superconcepts], minlength=n_concepts)
+    counts = np.bincount(concepts, minlength=n_concepts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / counts - target_entropies
+
+
+def _relation_to_arrays(relation_dict, n_elements):
+    """Convert ``relation_dict`` of type {`int`: `set` of `int`} into two aligned arrays of related indexes"""
+    sizes = [len(relation_dict.get(el_i, ())) for el_i in range(n_elements)]
+    sources = np.repeat(np.arange(n_elements, dtype=np.int64), sizes)
+    targets = np.fromiter(chain.from_iterable(relation_dict.get(el_i, ()) for el_i in range(n_elements)),
+                          dtype=np.int64, count=sum(sizes))
+    return sources, targets
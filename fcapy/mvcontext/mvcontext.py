@@ -11,6 +11,7 @@ from fcapy import LIB_INSTALLED
 
 if LIB_INSTALLED['numpy']:
     import numpy as np
+    from fcapy.context.bintable import pack_bits
 
 
 class MVContext:
@@ -38,6 +39,7 @@ class MVContext:
                 A target values to use in Supervised ML scenario
 
         """
+        self._hash_fixed = None
         self._n_objects = len(data) if data is not None else None
         self._n_attributes = len(data[0]) if data is not None else None
 
@@ -62,6 +64,7 @@ class MVContext:
 
     @object_names.setter
     def object_names(self, value):
+        self._hash_fixed = None
         if value is None:
             self._object_names = [str(idx) for idx in range(self._n_objects)] if self._n_objects is not None else None
             return
@@ -79,6 +82,7 @@ class MVContext:
 
     @attribute_names.setter
     def attribute_names(self, value):
+        self._hash_fixed = None
         if value is None:
             self._attribute_names = [str(idx) for idx in range(self._n_attributes)]\
                 if self._n_attributes is not None else None
@@ -97,6 +101,7 @@ class MVContext:
 
     @pattern_structures.setter
     def pattern_structures(self, value):
+        self._hash_fixed = None
         self._pattern_structures = value
 
     @property
@@ -180,6 +185,46 @@ class MVContext:
         description_i = {ps_i: ps.intention_i(object_indexes) for ps_i, ps in enumerate(self._pattern_structures)}
         return description_i
 
+    def extension_i_batch(self, list_of_descriptions_i, packed=False):
+        """Return the subsets of objects which fall into each of ``list_of_descriptions_i``
+
+        Each pattern structure processes all the descriptions defined on it in one vectorized pass
+
+        Parameters
+        ----------
+        list_of_descriptions_i: `list` of `dict` of type {pattern_structure_index: description}
+            Descriptions to filter objects
+        packed: `bool`
+            A flag whether to return a bit-matrix packed into `numpy.uint64` words
+            (of shape len(``list_of_descriptions_i``) x ceil(``n_objects``/64))
+
+        Returns
+        -------
+        extents_i: `list` of `list` of `int` or `numpy.ndarray` of `numpy.uint64`
+            A list of indexes of objects described by each of ``list_of_descriptions_i`` (or the packed bit-matrix)
+
+        """
+        if not LIB_INSTALLED['numpy']:
+            assert not packed, 'MVContext.extension_i_batch: Package "numpy" should be installed to pack the extents'
+            return [list(self.extension_i(descriptions_i)) for descriptions_i in list_of_descriptions_i]
+
+        flags = np.ones((len(list_of_descriptions_i), self._n_objects), dtype=bool)
+        for ps_i, ps in enumerate(self._pattern_structures):
+            query_is = [q_i for q_i, descriptions_i in enumerate(list_of_descriptions_i) if ps_i in descriptions_i]
+            if len(query_is) > 0:
+                flags[query_is] &= ps.extension_i_batch([list_of_descriptions_i[q_i][ps_i] for q_i in query_is])
+
+        if packed:
+            return pack_bits(flags)
+        return [np.flatnonzero(flags_row).tolist() for flags_row in flags]
+
+    def intention_i_batch(self, list_of_object_indexes):
+        """Return a common description of objects for each set of ``list_of_object_indexes``"""
+        ps_descriptions = [ps.intention_i_batch(list_of_object_indexes) for ps in self._pattern_structures]
+        descriptions_i = [dict(enumerate(descriptions)) for descriptions in zip(*ps_descriptions)]\
+            if len(ps_descriptions) > 0 else [{} for _ in list_of_object_indexes]
+        return descriptions_i
+
     def extension(self, descriptions, base_objects=None):
         """Return a subset of objects of ``base_objects_i`` which falls into ``descriptions``
 
@@ -457,13 +502,17 @@ class MVContext:
         return hash((tuple(self._object_names), tuple(self._attribute_names), tuple(self._pattern_structures)))
 
     def hash_fixed(self):
-        """Hash value of FormalContext which do not differ between sessions"""
-        str_ = str(self._object_names)
-        str_ += str(self._attribute_names)
-        str_ += str(self.data)
+        """Hash value of FormalContext which do not differ between sessions
+
+        The value is cached until the names or the pattern structures of the context are changed
+        """
+        if self._hash_fixed is None:
+            str_ = str(self._object_names)
+            str_ += str(self._attribute_names)
+            str_ += str(self.data)
 
-        code = zlib.adler32(str_.encode())
-        return code
+            self._hash_fixed = zlib.adler32(str_.encode())
+        return self._hash_fixed
 
     def __getitem__(self, item):
         if type(item) != tuple:
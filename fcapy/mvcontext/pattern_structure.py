@@ -37,6 +37,24 @@ class AbstractPS:
         """Select a subset of objects of ``base_objects_i`` which share ``description``"""
         raise NotImplementedError
 
+    def intention_i_batch(self, list_of_object_indexes):
+        """Select a common description for each set of objects from ``list_of_object_indexes``"""
+        return [self.intention_i(object_indexes) for object_indexes in list_of_object_indexes]
+
+    def extension_i_batch(self, descriptions):
+        """Select the objects which share each of ``descriptions``
+
+        Returns
+        -------
+        flags: `numpy.ndarray` of `bool`
+            A matrix of shape len(``descriptions``) x n_objects where flags[i, g] is True iff g shares descriptions[i]
+
+        """
+        flags = np.zeros((len(descriptions), len(self._data)), dtype=bool)
+        for i, description in enumerate(descriptions):
+            flags[i, list(self.extension_i(description))] = True
+        return flags
+
     @property
     def data(self):
         """The data for PatternStructure to work with"""
@@ -207,6 +225,39 @@ class IntervalPS(AbstractPS):
             g_is = base_objects_i[(min_ <= self._data[base_objects_i, 0]) & (self._data[base_objects_i, 1] <= max_)]
         return g_is
 
+    def intention_i_batch(self, list_of_object_indexes):
+        """Select a common interval description for each set of objects from ``list_of_object_indexes``"""
+        if not LIB_INSTALLED['numpy']:
+            return super(IntervalPS, self).intention_i_batch(list_of_object_indexes)
+
+        list_of_object_indexes = [np.fromiter(object_indexes, dtype=np.int64) for object_indexes in list_of_object_indexes]
+        sizes = np.array([len(object_indexes) for object_indexes in list_of_object_indexes], dtype=np.int64)
+        if sizes.sum() == 0:
+            return [None] * len(sizes)
+
+        g_is = np.concatenate(list_of_object_indexes)
+        starts = (np.cumsum(sizes) - sizes)[sizes > 0]
+        mins = iter(np.minimum.reduceat(self._data[g_is, 0], starts))
+        maxs = iter(np.maximum.reduceat(self._data[g_is, 1], starts))
+        return [(next(mins), next(maxs)) if size > 0 else None for size in sizes]
+
+    def extension_i_batch(self, descriptions):
+        """Select the objects which fall into each interval of ``descriptions`` (as a boolean matrix)"""
+        if len(descriptions) == 0:
+            return np.zeros((0, len(self._data)), dtype=bool)
+
+        is_none = np.array([description is None for description in descriptions])
+        bounds = np.array([
+            (math.inf, -math.inf) if description is None
+            else (description[0], description[1]) if isinstance(description, Iterable)
+            else (description, description)
+            for description in descriptions
+        ], dtype=float)
+
+        flags = (bounds[:, [0]] <= self._data[:, 0]) & (self._data[:, 1] <= bounds[:, [1]])
+        flags[is_none] = False
+        return flags
+
     def description_to_generators(self, description, projection_num):
         """Convert the closed interval of ``description`` into a set of more broader intervals that generate it
 
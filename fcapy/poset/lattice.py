@@ -1,4 +1,5 @@
 from fcapy.poset.poset import POSet
+from collections.abc import Collection
 
 
 class UpperSemiLattice(POSet):
@@ -66,13 +67,14 @@ class UpperSemiLattice(POSet):
             raise ValueError(f"Cannot remove top element {element}")
         super(UpperSemiLattice, self).remove(element)
         
-    def __delitem__(self, key):
-        if self.top_element == key:
-            raise KeyError(f"Cannot remove top element {key}")
+    def __delitem__(self, key: int or Collection):
+        keys = key if isinstance(key, Collection) else [key]
+        if self.top_element in keys:
+            raise KeyError(f"Cannot remove top element {self.top_element}")
         super(UpperSemiLattice, self).__delitem__(key)
 
         if self._use_cache:
-            self._cache_top_element -= int(self._cache_top_element > key)
+            self._cache_top_element -= sum([self._cache_top_element > k for k in set(keys)])
 
 
 class LowerSemiLattice(POSet):
@@ -140,13 +142,14 @@ class LowerSemiLattice(POSet):
             raise ValueError(f"Cannot remove bottom element {element}")
         super(LowerSemiLattice, self).remove(element)
 
-    def __delitem__(self, key):
-        if self.bottom_element == key:
-            raise KeyError(f"Cannot delete bottom element {key}")
+    def __delitem__(self, key: int or Collection):
+        keys = key if isinstance(key, Collection) else [key]
+        if self.bottom_element in keys:
+            raise KeyError(f"Cannot delete bottom element {self.bottom_element}")
         super(LowerSemiLattice, self).__delitem__(key)
 
         if self._use_cache:
-            self._cache_bottom_element -= int(self._cache_bottom_element > key)
+            self._cache_bottom_element -= sum([self._cache_bottom_element > k for k in set(keys)])
 
 
 class Lattice(UpperSemiLattice, LowerSemiLattice):
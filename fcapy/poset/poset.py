@@ -419,70 +419,80 @@ class POSet:
     def __contains__(self, item):
         return item in self._elements_to_index_map
 
-    def __delitem__(self, key):
-        del self._elements_to_index_map[self._elements[key]]
-        del self._elements[key]
+    def __delitem__(self, key: int or Collection):
+        """Delete the element ``key`` (or the elements from ``key`` if it is a collection of indexes)
 
-        def decr_idx(idx, threshold):
-            return idx - 1 if idx > threshold else idx
+        The caches are reindexed only once per call. So it is better to delete a batch of elements at once
+        """
+        keys = sorted(set(key)) if isinstance(key, Collection) else [key]
+        keys_set = set(keys)
+        n_elements = len(self._elements)
+
+        for key in keys:
+            del self._elements_to_index_map[self._elements[key]]
+        self._elements = [el for el_i, el in enumerate(self._elements) if el_i not in keys_set]
+
+        # new index of each element (-1 for the deleted elements)
+        new_idxs = [-1] * n_elements
+        new_idx = 0
+        for idx in range(n_elements):
+            if idx not in keys_set:
+                new_idxs[idx] = new_idx
+                new_idx += 1
 
-        self._elements_to_index_map = {el: decr_idx(idx, key) for el, idx in self._elements_to_index_map.items()}
+        self._elements_to_index_map = {el: new_idxs[idx] for el, idx in self._elements_to_index_map.items()}
 
         if self._use_cache:
-            dsups = self._cache_direct_superelements.get(key)
-            dsubs = self._cache_direct_subelements.get(key)
-
-            if dsubs is not None and dsups is not None:
-                for el_i_dsup in dsups:
-                    new_subs = (self._cache_direct_subelements[el_i_dsup] - {key}) | dsubs
-                    for el_i_new_sub in copy(new_subs):
-                        new_subs -= self._cache_subelements[el_i_new_sub]
-                    self._cache_direct_subelements[el_i_dsup] = frozenset(new_subs)
-
-                for el_i_dsub in dsubs:
-                    new_sups = (self._cache_direct_superelements[el_i_dsub] - {key} ) | dsups
-                    for el_i_new_sup in copy(new_sups):
-                        new_sups -= self._cache_superelements[el_i_new_sup]
-                    self._cache_direct_superelements[el_i_dsub] = frozenset(new_sups)
-
-            def decrement_dict(dct, threshold):
+            for key in keys:
+                dsups = self._cache_direct_superelements.get(key)
+                dsubs = self._cache_direct_subelements.get(key)
+
+                if dsubs is not None and dsups is not None:
+                    for el_i_dsup in dsups:
+                        new_subs = (self._cache_direct_subelements[el_i_dsup] - {key}) | dsubs
+                        for el_i_new_sub in copy(new_subs):
+                            new_subs -= self._cache_subelements[el_i_new_sub]
+                        self._cache_direct_subelements[el_i_dsup] = frozenset(new_subs)
+
+                    for el_i_dsub in dsubs:
+                        new_sups = (self._cache_direct_superelements[el_i_dsub] - {key} ) | dsups
+                        for el_i_new_sup in copy(new_sups):
+                            new_sups -= self._cache_superelements[el_i_new_sup]
+                        self._cache_direct_superelements[el_i_dsub] = frozenset(new_sups)
+
+            def reindex_dict(dct):
                 if len(dct) == 0:
                     return {}
 
-                dct_decr = {}
+                dct_reindexed = {}
 
-                k, v = dct.popitem()
+                k, v = next(iter(dct.items()))
                 k_tuple_flag, k_int_flag = isinstance(k, tuple), isinstance(k, int)
                 v_set_flag, v_bool_flag = isinstance(v, (set, frozenset)), isinstance(v, bool)
-                dct[k] = v
+                if not (k_tuple_flag or k_int_flag) or not (v_set_flag or v_bool_flag):
+                    raise ValueError
 
                 for k, v in dct.items():
-                    if (k_tuple_flag and threshold in k) \
-                            or (k_int_flag and threshold == k):
-                        continue
-
                     if k_tuple_flag:
-                        k_decr = tuple([decr_idx(idx, threshold) for idx in k])
-                    elif k_int_flag:
-                        k_decr = decr_idx(k, threshold)
+                        k_new = tuple([new_idxs[idx] for idx in k])
+                        if -1 in k_new:
+                            continue
                     else:
-                        raise ValueError
+                        k_new = new_idxs[k]
+                        if k_new == -1:
+                            continue
 
                     if v_set_flag:
-                        v_decr = frozenset({decr_idx(idx, threshold) for idx in v if idx != threshold})
-                    elif v_bool_flag:
-                        v_decr = v
-                    else:
-                        raise ValueError
+                        v = frozenset({new_idxs[idx] for idx in v if idx not in keys_set})
 
-                    dct_decr[k_decr] = v_decr
-                return dct_decr
+                    dct_reindexed[k_new] = v
+                return dct_reindexed
 
-            self._cache_leq = decrement_dict(self._cache_leq, key)
-            self._cache_subelements = decrement_dict(self._cache_subelements, key)
-            self._cache_superelements = decrement_dict(self._cache_superelements, key)
-            self._cache_direct_subelements = decrement_dict(self._cache_direct_subelements, key)
-            self._cache_direct_superelements = decrement_dict(self._cache_direct_superelements, key)
+            self._cache_leq = reindex_dict(self._cache_leq)
+            self._cache_subelements = reindex_dict(self._cache_subelements)
+            self._cache_superelements = reindex_dict(self._cache_superelements)
+            self._cache_direct_subelements = reindex_dict(self._cache_direct_subelements)
+            self._cache_direct_superelements = reindex_dict(self._cache_direct_superelements)
 
     def add(self, element, fill_up_cache=True):
         """Add an ``element`` to POSet. Automatically fill up the comparison caches if needed"""
@@ -666,24 +676,22 @@ class POSet:
 
         (ex. _cache_direct_superelements -> _cache_superelements)"""
         direct_cache_trans = cls._transpose_hierarchy(direct_relation_cache)
-        elements_to_visit = [el_i for el_i, subelems in direct_relation_cache.items() if len(subelems) == 0]
-        elements_visited = set()
+        # the number of directly related elements which closed relation is not computed yet
+        n_rels_to_visit = {el_i: len(direct_relation_cache.get(el_i, ())) for el_i in direct_cache_trans}
+        elements_to_visit = [el_i for el_i, n_rels in n_rels_to_visit.items() if n_rels == 0]
         closed_cache = {}
         while len(elements_to_visit) > 0:
-            for i, el_i in enumerate(elements_to_visit):
-                if direct_relation_cache[el_i] & elements_visited == direct_relation_cache[el_i]:
-                    idx = i
-                    break
-            el_i = elements_to_visit.pop(idx)
-
-            direct_rels = direct_relation_cache[el_i]
+            el_i = elements_to_visit.pop()
 
-            closed_cache[el_i] = direct_rels.copy()
+            direct_rels = direct_relation_cache.get(el_i, set())
+            closed_cache[el_i] = set(direct_rels)
             for el_i_rel in direct_rels:
                 closed_cache[el_i] |= closed_cache[el_i_rel]
 
-            elements_to_visit += list(direct_cache_trans[el_i])
-            elements_visited.add(el_i)
+            for el_i_next in direct_cache_trans[el_i]:
+                n_rels_to_visit[el_i_next] -= 1
+                if n_rels_to_visit[el_i_next] == 0:
+                    elements_to_visit.append(el_i_next)
         closed_cache = {k: frozenset(vs) for k, vs in closed_cache.items()}
         return closed_cache
 
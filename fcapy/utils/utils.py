@@ -81,6 +81,62 @@ def slice_list(lst: list, slicer):
     return lst
 
 
+ADLER32_BASE = 65521
+
+
+def adler32_combine(adler1, adler2, len2):
+    """Compute adler32 checksum of concatenation A+B given checksums ``adler1`` of A, ``adler2`` of B and length of B
+
+    The port of ``adler32_combine`` function from zlib library
+    """
+    rem = len2 % ADLER32_BASE
+    sum1 = adler1 & 0xffff
+    sum2 = (rem * sum1) % ADLER32_BASE
+    sum1 += (adler2 & 0xffff) + ADLER32_BASE - 1
+    sum2 += ((adler1 >> 16) & 0xffff) + ((adler2 >> 16) & 0xffff) + ADLER32_BASE - rem
+    sum1 = sum1 % ADLER32_BASE
+    sum2 = sum2 % ADLER32_BASE
+    return sum1 | (sum2 << 16)
+
+
+def combine_digests(*digests):
+    """Combine the pairs (adler32 checksum, length) of several byte strings into the pair of their concatenation"""
+    checksum, length = 1, 0
+    for other_checksum, other_length in digests:
+        checksum = adler32_combine(checksum, other_checksum, other_length)
+        length += other_length
+    return checksum, length
+
+
+def indexes_to_mask(indexes):
+    """Convert the set of ``indexes`` into a bit mask (python `int` where i-th bit is set iff i is in ``indexes``)
+
+    The bits are set in a bytearray which is converted into `int` at once. So the time is linear in the mask length
+    """
+    indexes = list(indexes)
+    if len(indexes) == 0:
+        return 0
+
+    flags = bytearray((max(indexes) >> 3) + 1)
+    for idx in indexes:
+        flags[idx >> 3] |= 1 << (idx & 7)
+    return int.from_bytes(flags, 'little')
+
+
+def mask_to_indexes(mask):
+    """Convert the bit ``mask`` into the sorted list of indexes of its set bits
+
+    The set bits are searched in the binary string of the mask. So the time is linear in the mask length
+    """
+    bits = bin(mask)[:1:-1]  # the bits from the lowest one (without '0b' prefix)
+    indexes = []
+    idx = bits.find('1')
+    while idx != -1:
+        indexes.append(idx)
+        idx = bits.find('1', idx + 1)
+    return indexes
+
+
 def get_kwargs_used(kwargs, func):
     """Return `kwargs` which are parameters of `func`"""
     possible_kwargs = inspect.signature(func).parameters
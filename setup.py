@@ -10,6 +10,8 @@ def run_install(**kwargs):
             'pandas',
             'frozendict',
             'bitsets',
+            'numpy',
+            'scipy',
         ],
         'mvcontext': [
             'frozendict'
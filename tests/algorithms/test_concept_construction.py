@@ -1,4 +1,5 @@
 import json
+import math
 import pytest
 from fcapy.context import read_json, read_csv, read_cxt, from_pandas
 from fcapy.algorithms import concept_construction as cca
@@ -7,6 +8,7 @@ from fcapy.lattice.formal_concept import FormalConcept
 from fcapy.context.formal_context import FormalContext
 from fcapy.lattice.pattern_concept import PatternConcept
 from fcapy.lattice import ConceptLattice
+from fcapy.lattice import concept_measures as cms
 from fcapy.mvcontext import pattern_structure as PS, mvcontext
 from fcapy.ml import decision_lattice as DL
 
@@ -64,6 +66,131 @@ def test_close_by_one():
     assert set(concepts) == {c0, c1, c2, c3}, 'Close_by_one failed.'
 
 
+def test_close_by_one_parallel():
+    for context in [read_csv("data/mango_bin.csv"), read_json("data/animal_movement.json")]:
+        for iterate_extents in [True, False]:
+            data = cca.close_by_one(context, output_as_concepts=False, iterate_extents=iterate_extents)
+            data_parallel = cca.close_by_one(context, output_as_concepts=False, iterate_extents=iterate_extents,
+                                             n_jobs=2)
+            assert data_parallel == data, 'Close_by_one failed. Parallel run should give the same output'
+
+    mvctx = mvcontext.MVContext([[1], [2], [4], [3]], {'M1': PS.IntervalPS}, attribute_names=['M1'])
+    assert set(cca.close_by_one(mvctx, n_jobs=2)) == set(cca.close_by_one(mvctx)),\
+        'Close_by_one failed. Parallel run should give the same concepts on MVContext'
+
+    with pytest.raises(ValueError):
+        cca.close_by_one(context, n_jobs=0)
+
+
+def test_iter_concepts():
+    import types
+    context = read_csv("data/mango_bin.csv")
+    concepts = cca.close_by_one(context)
+
+    concepts_iter = cca.iter_concepts(context)
+    assert isinstance(concepts_iter, types.GeneratorType), 'iter_concepts failed. The function should be a generator'
+    for iterate_extents in [None, True, False]:
+        assert set(cca.iter_concepts(context, iterate_extents=iterate_extents)) == set(concepts),\
+            'iter_concepts failed. Iterated concepts do not match the ones of close_by_one'
+
+    assert len(list(cca.iter_concepts(context, max_concepts=5))) == 5,\
+        'iter_concepts failed. The number of concepts should be limited by max_concepts'
+    for iterate_extents in [True, False]:
+        assert set(cca.iter_concepts(context, iterate_extents=iterate_extents, min_support=3)) == \
+            {c for c in concepts if c.support >= 3}, 'iter_concepts failed. Wrong concepts with min_support'
+    assert list(cca.iter_concepts(context, time_budget=0)) == [],\
+        'iter_concepts failed. No concepts should be yielded with zero time budget'
+
+    mvctx = mvcontext.MVContext([[1], [2], [4], [3]], {'M1': PS.IntervalPS}, attribute_names=['M1'])
+    assert set(cca.iter_concepts(mvctx)) == set(cca.close_by_one(mvctx)),\
+        'iter_concepts failed. Iterated concepts do not match the ones of close_by_one on MVContext'
+
+
+def test_fast_close_by_one():
+    for path in ['data/animal_movement.json', 'data/mango_bin.csv', 'data/digits.cxt']:
+        context = {'json': read_json, 'csv': read_csv, 'cxt': read_cxt}[path.split('.')[-1]](path)
+        concepts_cbo = cca.close_by_one(context)
+        for iterate_extents in [False, True]:
+            concepts_fcbo = cca.fast_close_by_one(context, iterate_extents=iterate_extents)
+            assert len(concepts_fcbo) == len(set(concepts_fcbo)),\
+                'Fast_close_by_one failed. Some concepts are constructed twice'
+            assert set(concepts_fcbo) == set(concepts_cbo),\
+                'Fast_close_by_one failed. Constructed concepts do not match the ones constructed by CbO'
+
+    context = FormalContext([[False, False], [False, False]])
+    data = cca.fast_close_by_one(context, output_as_concepts=False)
+    assert data == {'extents_i': [[0, 1], []], 'intents_i': [[], [0, 1]]},\
+        'Fast_close_by_one failed. Wrong output for the empty relation'
+
+
+def test_iceberg_concepts():
+    context = read_cxt("data/digits.cxt")
+    concepts = cca.close_by_one(context)
+    bottom = min(concepts, key=lambda c: (c.support, -len(c.intent_i)))
+    top = max(concepts, key=lambda c: c.support)
+
+    for min_support in [0, 2, 4, 0.5, 1.0]:
+        n_min = min_support if isinstance(min_support, int) else math.ceil(min_support * context.n_objects)
+        concepts_iceberg = cca.iceberg_concepts(context, min_support=min_support)
+        assert len(concepts_iceberg) == len(set(concepts_iceberg)), 'iceberg_concepts failed. Duplicated concepts'
+        assert set(concepts_iceberg) == {c for c in concepts if c.support >= n_min} | {top, bottom},\
+            f'iceberg_concepts failed. Wrong frequent concepts for min_support={min_support}'
+
+    data = cca.iceberg_concepts(context, min_support=4, output_as_concepts=False)
+    assert [set(ext) for ext in data['extents_i']] == [set(c.extent_i) for c in cca.iceberg_concepts(context, 4)],\
+        'iceberg_concepts failed. Output concepts as dict do not match output concepts as concepts'
+
+    for min_support in [-1, 1.5]:
+        with pytest.raises(ValueError):
+            cca.iceberg_concepts(context, min_support=min_support)
+
+
+def test_next_closure(tmp_path):
+    context = read_cxt("data/digits.cxt")
+    concepts_cbo = cca.close_by_one(context)
+    concepts = cca.next_closure(context)
+    assert len(concepts) == len(set(concepts)) and set(concepts) == set(concepts_cbo),\
+        'next_closure failed. Constructed concepts do not match the ones constructed by CbO'
+
+    def lectic_key(c):
+        return sum(2 ** (context.n_attributes - 1 - m_i) for m_i in c.intent_i)
+    assert [lectic_key(c) for c in concepts] == sorted(lectic_key(c) for c in concepts),\
+        'next_closure failed. Concepts should be constructed in the lectic order'
+
+    path = str(tmp_path / 'next_closure.json')
+    concepts_iter = cca.iter_next_closure(context, checkpoint_path=path, checkpoint_every=5)
+    concepts_first = [next(concepts_iter) for _ in range(12)]
+    del concepts_iter
+    with open(path, 'r') as f:
+        assert json.load(f)['n_concepts'] == 10, 'iter_next_closure failed. Wrong checkpoint'
+
+    concepts_resumed = cca.next_closure(context, checkpoint_path=path, checkpoint_every=5, resume=True)
+    assert concepts_first[:10] + concepts_resumed == concepts,\
+        'iter_next_closure failed. Resumed iteration does not continue the checkpoint'
+    assert cca.next_closure(context, checkpoint_path=path, resume=True) == [],\
+        'iter_next_closure failed. Finished iteration should not be resumed'
+
+    with pytest.raises(ValueError):
+        list(cca.iter_next_closure(read_csv("data/mango_bin.csv"), checkpoint_path=path, resume=True))
+
+
+def test_in_close():
+    np.random.seed(11)
+    contexts = [read_json('data/animal_movement.json'), read_csv('data/mango_bin.csv'), read_cxt('data/digits.cxt')]
+    contexts += [FormalContext((np.random.rand(25, 12) > threshold).tolist()) for threshold in [0.2, 0.5, 0.8]]
+    for context in contexts:
+        concepts_fcbo = cca.fast_close_by_one(context)
+        for iterate_extents in [False, True]:
+            concepts_inclose = cca.in_close(context, iterate_extents=iterate_extents)
+            assert len(concepts_inclose) == len(set(concepts_inclose)),\
+                'In_close failed. Some concepts are constructed twice'
+            assert set(concepts_inclose) == set(concepts_fcbo),\
+                'In_close failed. Constructed concepts do not match the ones constructed by FCbO'
+
+    data = cca.in_close(FormalContext([[True, False], [True, False]]), output_as_concepts=False)
+    assert data == {'extents_i': [[0, 1], []], 'intents_i': [[0], [0, 1]]}, 'In_close failed. Wrong output'
+
+
 def test_sofia_binary():
     ctx = read_cxt('data/digits.cxt')
     concepts_all = cca.close_by_one(ctx)
@@ -86,6 +213,12 @@ def test_sofia_binary():
     ltc_sofia_precalc = ConceptLattice.from_json('data/digits_sofia_lattice_22.json')
     assert ltc_sofia == ltc_sofia_precalc
 
+    # stability bounds are maintained incrementally unless a custom measure function is given
+    lstab_func = lambda c_i, lattice, context: cms.stability_bounds(c_i, lattice)[0]
+    ltc_sofia_recalc = cca.sofia_binary(ctx, len(concepts_all)//2, measure=('LStab', lstab_func))
+    assert ltc_sofia == ltc_sofia_recalc,\
+        'sofia_binary failed. The incremental stability bounds lead to a different lattice'
+
     with pytest.warns(UserWarning):
         ltc_sofia.calc_concepts_measures('stability', ctx)
     stabilities_sofia = [c.measures['Stab'] for c in ltc_sofia.concepts]
@@ -200,9 +333,11 @@ def test_lindig_algorithm():
             cbo = sorted([x for x in L_cbo._cache_direct_superelements.get(foo[i], [])])
             assert lin == cbo, 'lindig_algorithm lattice mismatch'
             
-    context = FormalContext.from_csv('data/mango_bin.csv')
-    L_lin = cca.lindig_algorithm(context)
-    L_cbo = ConceptLattice.from_context(context, algo='CbO')
-    check(L_lin, L_cbo)
-    L_lin = cca.lindig_algorithm(context, False)
-    check(L_lin, L_cbo)
\ No newline at end of file
+    for context in [FormalContext.from_csv('data/mango_bin.csv'), read_cxt('data/digits.cxt')]:
+        L_cbo = ConceptLattice.from_context(context, algo='CbO')
+        for iterate_extents in [None, True, False]:
+            L_lin = cca.lindig_algorithm(context, iterate_extents)
+            check(L_lin, L_cbo)
+            assert L_lin == L_cbo, 'lindig_algorithm lattice mismatch'
+            assert L_lin.top_concept == L_cbo.top_concept and L_lin.bottom_concept == L_cbo.bottom_concept,\
+                'lindig_algorithm top or bottom concept mismatch'
@@ -119,6 +119,40 @@ def test_lattice_construction_by_spanning_tree():
         'Parallel computing give wrong result when concepts are not sorted'
 
 
+def test_lattice_construction_by_ipred():
+    for ctx in [read_cxt('data/animal_movement.cxt'), read_cxt('data/digits.cxt')]:
+        concepts = cca.close_by_one(ctx)
+        np.random.seed(42)
+        np.random.shuffle(concepts)
+        sub_true = lca.complete_comparison(concepts)
+        sub_ipred = lca.construct_lattice_by_ipred(concepts)
+        assert sub_true == sub_ipred,\
+            'lattice_construction.construct_lattice_by_ipred failed. ' \
+            'The result is different then the one of complete comparison'
+
+        concepts_sorted = ConceptLattice.sort_concepts(concepts)
+        assert lca.construct_lattice_by_ipred(concepts_sorted, is_concepts_sorted=True) == \
+            lca.construct_lattice_by_ipred(concepts_sorted, is_concepts_sorted=False),\
+            'lattice_construction.construct_lattice_by_ipred failed. The result changes with is_concepts_sorted parameter'
+
+    with pytest.raises(ValueError):
+        lca.construct_lattice_by_ipred([c for c in concepts_sorted if c.support != 2])
+
+
+def test_lattice_construction_parallel():
+    ctx = read_cxt('data/digits.cxt')
+    concepts = cca.close_by_one(ctx)
+    sub_true = lca.construct_lattice_by_ipred(concepts)
+    for n_jobs in [1, 2, -1]:
+        assert lca.construct_lattice_parallel(concepts, n_jobs=n_jobs) == sub_true,\
+            f'lattice_construction.construct_lattice_parallel failed with n_jobs={n_jobs}'
+    assert lca.construct_lattice_parallel(concepts, n_jobs=2, n_chunks=1000) == sub_true,\
+        'lattice_construction.construct_lattice_parallel failed with more chunks than concepts'
+
+    with pytest.raises(ValueError):
+        lca.construct_lattice_parallel(concepts, n_jobs=0)
+
+
 def test_add_concept():
     ctx = read_csv('data/mango_bin.csv')
     np.random.seed(13)
@@ -1,5 +1,5 @@
 import pytest
-from fcapy.context.bintable import BinTable
+from fcapy.context.bintable import BinTable, BinTableNumpy, BinTableSparse
 from .data_to_test import animal_movement_data
 from fcapy import LIB_INSTALLED
 
@@ -81,6 +81,34 @@ def test_hash():
         assert set_big == set_small, 'BinTable.__hash__ failed'
 
 
+def test_hash_fixed():
+    import zlib
+    import numpy as np
+    from fcapy.context.bintable import BinTableNumpy, BinTableSparse
+
+    np.random.seed(7)
+    data = (np.random.rand(40, 70) > 0.5).tolist()
+    hash_true = zlib.adler32(str(data).encode())
+    for is_bitsets in [False, True]:
+        LIB_INSTALLED['bitsets'] = is_bitsets
+        for bt_class in [BinTable, BinTableNumpy, BinTableSparse]:
+            bt = bt_class(data)
+            assert bt.hash_fixed() == hash_true, f'{bt_class.__name__}.hash_fixed failed'
+            assert bt_class().hash_fixed() == zlib.adler32(b'[]'), f'{bt_class.__name__}.hash_fixed failed'
+
+            bt_sliced = bt[[5, 1, 30]]
+            assert bt_sliced._row_digests is not None, f'{bt_class.__name__}.__getitem__ failed. Lost digests of rows'
+            assert bt_sliced.hash_fixed() == zlib.adler32(str([data[5], data[1], data[30]]).encode()),\
+                f'{bt_class.__name__}.hash_fixed failed on sliced table'
+            assert bt[:, 2:5].hash_fixed() == zlib.adler32(str([row[2:5] for row in data]).encode()),\
+                f'{bt_class.__name__}.hash_fixed failed on sliced table'
+
+            bt.data = data[:-1]
+            assert bt.hash_fixed() == zlib.adler32(str(data[:-1]).encode()),\
+                f'{bt_class.__name__}.hash_fixed failed. Digests are not updated when the data is changed'
+        assert hash(BinTable(data)) == hash(BinTableNumpy(data)), 'BinTable.__hash__ failed. Depends on the backend'
+
+
 def test_all_any():
     data = [[False, False], [False, True], [True, True]]
     for is_bitsets in [False, True]:
@@ -166,3 +194,210 @@ def test_arrows(animal_movement_data):
         columns = bt.arrow_up([])
         assert set(columns) == set(range(len(data[0]))),\
             'BinTable.arrow_up failed. Arrow_up of emptyset is the set of all attributes'
+
+
+@pytest.mark.parametrize('bt_class', [BinTableNumpy, BinTableSparse])
+def test_bintable_backends(bt_class, animal_movement_data):
+    import numpy as np
+    import scipy.sparse
+    bt_name = bt_class.__name__
+    # the formats of input matrices accepted by the backend besides the list of lists
+    matrix_formats = [np.array] if bt_class == BinTableNumpy else [scipy.sparse.csr_matrix, scipy.sparse.csc_matrix]
+
+    bt_class()
+    data = animal_movement_data['data']
+    bt_b = bt_class(data)
+    bt = BinTable(data)
+
+    assert bt_b.to_list() == data, f'{bt_name}.data failed. Data values were changed while initialization'
+    assert bt_b.shape == bt.shape, f'{bt_name}.shape failed'
+    for matrix_format in matrix_formats:
+        bt_b_from_matrix = bt_class(matrix_format(np.array(data)))
+        assert bt_b == bt_b_from_matrix, f'{bt_name}.__eq__ failed'
+        assert len({bt_b, bt_b_from_matrix}) == 1, f'{bt_name}.__hash__ failed'
+    assert bt_b == bt, f'{bt_name}.__eq__ failed. Tables with different backends should be comparable'
+    assert bt_b != bt_class(data[:-1]), f'{bt_name}.__eq__ failed'
+
+    assert bt_b[4, 1] is True and bt_b[4, 2] is False, f'{bt_name}.__getitem__ failed'
+    assert bt_b[-1, -1] is data[-1][-1] and bt_b[-3, -2] is data[-3][-2],\
+        f'{bt_name}.__getitem__ failed on negative indexes'
+    assert bt_class([[False, True]])[0, -1] is True, f'{bt_name}.__getitem__ failed on negative indexes'
+    assert bt_b[4] == data[4], f'{bt_name}.__getitem__ failed'
+    assert bt_b[:, 1] == [row[1] for row in data], f'{bt_name}.__getitem__ failed'
+    assert bt_b[:3, [0, 3]] == BinTable([[row[0], row[3]] for row in data[:3]]), f'{bt_name}.__getitem__ failed'
+    assert bt_b[:3, [3, 0]] == BinTable([[row[3], row[0]] for row in data[:3]]), f'{bt_name}.__getitem__ failed'
+
+    columns = list(zip(*data))
+    assert bt_b.sum() == 24 and bt_b.sum(0) == [sum(col) for col in columns] \
+        and bt_b.sum(1) == [sum(row) for row in data], f'{bt_name}.sum failed'
+    assert not bt_b.all() and bt_b.all(0) == [all(col) for col in columns] \
+        and bt_b.all(1) == [all(row) for row in data], f'{bt_name}.all failed'
+    assert bt_b.any() and bt_b.any(0) == [any(col) for col in columns] \
+        and bt_b.any(1) == [any(row) for row in data], f'{bt_name}.any failed'
+    with pytest.raises(ValueError):
+        bt_b.sum(2)
+
+    assert bt_b.arrow_down([0, 1]) == [4, 5, 6], f'{bt_name}.arrow_down failed'
+    assert bt_b.arrow_up([4, 5, 6]) == [0, 1], f'{bt_name}.arrow_up failed'
+    assert bt_b.arrow_down([1], base_rows=[0, 5, 6, 7]) == [5, 6, 7], f'{bt_name}.arrow_down failed'
+    assert bt_b.arrow_up([], base_columns={1, 3}) == [1, 3], f'{bt_name}.arrow_up failed'
+    assert bt_b.arrow_down([]) == list(range(len(data))), f'{bt_name}.arrow_down failed'
+
+    np.random.seed(42)
+    for density in [0.7, 0.1]:
+        data_big = np.random.rand(150, 130) < density
+        bt_b, bt = bt_class(matrix_formats[-1](data_big)), BinTable(data_big.tolist())
+        assert bt_b.to_list() == data_big.tolist(), f'{bt_name}.data failed'
+        for row_indexes in [[0], [1, 2], [5, 64, 65, 149], range(0, 150, 40)]:
+            assert bt_b.arrow_up(row_indexes) == sorted(bt.arrow_up(row_indexes)), f'{bt_name}.arrow_up failed'
+        for column_indexes in [[0], [63, 64], [3, 100, 129]]:
+            assert bt_b.arrow_down(column_indexes) == sorted(bt.arrow_down(column_indexes)),\
+                f'{bt_name}.arrow_down failed'
+        assert bt_b.sum(0) == data_big.sum(0).tolist() and bt_b.sum(1) == data_big.sum(1).tolist(),\
+            f'{bt_name}.sum failed'
+
+    with pytest.raises(AssertionError):
+        bt_class([[0], [1, 2]])
+
+
+def test_arrows_batch():
+    import numpy as np
+    from fcapy.context.bintable import BinTableNumpy, BinTableSparse
+
+    np.random.seed(13)
+    data = np.random.rand(140, 70) > 0.4
+    row_sets = [[], [0], [1, 2], [5, 64, 65, 139], list(range(0, 140, 3))]
+    column_sets = [[], [0], [63, 64], [3, 10, 69]]
+
+    for bt_class in [BinTable, BinTableNumpy, BinTableSparse]:
+        bt = bt_class(data.tolist())
+        ups, downs = bt.arrow_up_batch(row_sets), bt.arrow_down_batch(column_sets)
+        assert ups == [sorted(bt.arrow_up(rows)) for rows in row_sets], f'{bt_class.__name__}.arrow_up_batch failed'
+        assert downs == [sorted(bt.arrow_down(cols)) for cols in column_sets],\
+            f'{bt_class.__name__}.arrow_down_batch failed'
+
+        ups_packed = bt.arrow_up_batch(row_sets, packed=True)
+        assert ups_packed.shape == (len(row_sets), 2) and ups_packed.dtype == np.uint64,\
+            f'{bt_class.__name__}.arrow_up_batch failed. Wrong packed shape'
+        flags = np.unpackbits(ups_packed.view(np.uint8), axis=1, count=70, bitorder='little').astype(bool)
+        assert [np.flatnonzero(row).tolist() for row in flags] == ups,\
+            f'{bt_class.__name__}.arrow_up_batch failed. Wrong packed values'
+
+
+def test_to_numpy():
+    import numpy as np
+    from fcapy.context.bintable import BinTableNumpy, BinTableSparse, BinTableView, pack_bits
+
+    np.random.seed(5)
+    data = np.random.rand(30, 70) > 0.5
+    for is_bitsets in [False, True]:
+        LIB_INSTALLED['bitsets'] = is_bitsets
+        for bt in [BinTable(data.tolist()), BinTableNumpy(data), BinTableSparse(data),
+                   BinTableView(BinTable(data.tolist()))]:
+            bt_name = bt.__class__.__name__
+            assert bt.to_numpy().dtype == bool and np.array_equal(bt.to_numpy(), data), f'{bt_name}.to_numpy failed'
+            assert np.array_equal(bt.to_numpy(packed=True), pack_bits(data)),\
+                f'{bt_name}.to_numpy failed on packed data'
+        assert BinTable().to_numpy().shape == (0, 0), 'BinTable.to_numpy failed on empty table'
+
+
+def test_bintable_view():
+    import numpy as np
+    from fcapy.context.bintable import BinTableNumpy, BinTableView
+
+    np.random.seed(3)
+    data = np.random.rand(30, 20) > 0.5
+    rows, columns = [3, 0, 29, 7, 8], [19, 2, 5, 11]
+    data_viewed = data[rows][:, columns]
+    for is_bitsets in [False, True]:
+        LIB_INSTALLED['bitsets'] = is_bitsets
+        for bt_class in [BinTable, BinTableNumpy]:
+            bt = bt_class(data.tolist())
+            view = BinTableView(bt, rows, columns)
+            assert view.parent is bt, 'BinTableView.parent failed'
+            assert view.shape == data_viewed.shape and len(view) == len(rows), 'BinTableView.shape failed'
+            assert view.to_list() == data_viewed.tolist(), 'BinTableView.to_list failed'
+            assert view == BinTable(data_viewed.tolist()), 'BinTableView.__eq__ failed'
+            assert view.hash_fixed() == BinTable(data_viewed.tolist()).hash_fixed(), 'BinTableView.hash_fixed failed'
+            bt.hash_fixed()
+            view_rows = BinTableView(bt, rows)
+            view_rows.materialize = None  # the hash should be computed without materializing the view
+            assert view_rows.hash_fixed() == BinTable(data[rows].tolist()).hash_fixed(),\
+                'BinTableView.hash_fixed failed on the view of all columns'
+            assert view.sum(0) == data_viewed.sum(0).tolist(), 'BinTableView.sum failed'
+            assert view[1, 2] == data_viewed[1, 2] and view[1] == data_viewed[1].tolist(),\
+                'BinTableView.__getitem__ failed'
+            assert view[[4, 0], 1:].to_list() == data_viewed[[4, 0], 1:].tolist(), 'BinTableView.__getitem__ failed'
+
+            bt_viewed = BinTable(data_viewed.tolist())
+            for row_indexes in [[], [0], [1, 3], [0, 1, 2, 3, 4]]:
+                assert view.arrow_up(row_indexes) == sorted(bt_viewed.arrow_up(row_indexes)),\
+                    'BinTableView.arrow_up failed'
+            for column_indexes in [[], [0], [3, 1]]:
+                assert view.arrow_down(column_indexes) == sorted(bt_viewed.arrow_down(column_indexes)),\
+                    'BinTableView.arrow_down failed'
+            assert view.arrow_down([1], base_rows=[0, 2]) == sorted(bt_viewed.arrow_down([1], base_rows=[0, 2])),\
+                'BinTableView.arrow_down failed'
+
+            assert view == BinTableView(bt, rows, columns) and view == view[:, :],\
+                'BinTableView.__eq__ failed'
+            assert view != BinTableView(bt, rows[:-1], columns) and view != BinTableView(bt, rows, columns[::-1]),\
+                'BinTableView.__eq__ failed'
+
+            view_of_view = BinTableView(view, column_indexes=[2, 0])
+            assert view_of_view.parent is bt and view_of_view.to_list() == data_viewed[:, [2, 0]].tolist(),\
+                'BinTableView failed to view another view'
+            assert list(BinTableView(bt, column_indexes=[2]).arrow_down([0])) == np.flatnonzero(data[:, 2]).tolist(),\
+                'BinTableView.arrow_down failed'
+
+
+def test_append_rows_columns():
+    import zlib
+    import numpy as np
+    from fcapy.context.bintable import BinTableNumpy, BinTableSparse, BinTableView
+
+    np.random.seed(3)
+    data = np.random.rand(70, 60) > 0.5
+    new_rows, new_columns = np.random.rand(100, 60) > 0.5, np.random.rand(170, 10) > 0.5
+    data_full = np.hstack([np.vstack([data, new_rows]), new_columns])
+    for is_bitsets in [False, True]:
+        LIB_INSTALLED['bitsets'] = is_bitsets
+        for bt_class in [BinTable, BinTableNumpy, BinTableSparse]:
+            bt_name = bt_class.__name__
+            bt = bt_class(data.tolist())
+            bt.hash_fixed()
+            support_0, support_30 = bt.sum(1)[0], bt.sum(0)[30]
+
+            for rows in [new_rows[:1], new_rows[1:40], new_rows[40:]]:
+                bt.append_rows(rows.tolist())
+            bt.append_columns(new_columns.tolist())
+            assert bt.to_list() == data_full.tolist(), f'{bt_name}.append_rows/append_columns failed'
+            assert bt.shape == data_full.shape, f'{bt_name}.append_rows/append_columns failed. Wrong shape'
+            assert bt.hash_fixed() == zlib.adler32(str(data_full.tolist()).encode()),\
+                f'{bt_name}.append_rows/append_columns failed. The digest is not updated'
+            assert bt.sum(1)[0] == support_0 + new_columns[0].sum() and bt.sum(0)[30] == data_full[:, 30].sum(),\
+                f'{bt_name}.append_rows/append_columns failed. The supports are not updated'
+            assert bt.sum(0) == data_full.sum(0).tolist() and bt.sum(1) == data_full.sum(1).tolist(),\
+                f'{bt_name}.append_rows/append_columns failed. The supports are not updated'
+            for column_indexes in [[0], [5, 65], [69]]:
+                rows_true = np.flatnonzero(data_full[:, column_indexes].all(1)).tolist()
+                assert sorted(bt.arrow_down(column_indexes)) == rows_true,\
+                    f'{bt_name}.arrow_down failed after appending the data'
+
+            bt_empty = bt_class()
+            bt_empty.append_rows(data[:2].tolist())
+            assert bt_empty.to_list() == data[:2].tolist(), f'{bt_name}.append_rows failed on the empty table'
+            with pytest.raises(AssertionError):
+                bt_empty.append_rows([[True]])
+            with pytest.raises(AssertionError):
+                bt_empty.append_columns([[True]])
+
+    bt_np = BinTableNumpy(data)
+    rows_words = bt_np.data.copy()
+    bt_np_packed = BinTableNumpy.from_packed(rows_words, bt_np._data_columns.copy(), bt_np.shape)
+    bt_np_packed.append_rows(new_rows)
+    assert np.array_equal(rows_words, bt_np.data), 'BinTableNumpy.append_rows failed. The given packed words are changed'
+    assert bt_np_packed == BinTableNumpy(np.vstack([data, new_rows])), 'BinTableNumpy.append_rows failed'
+
+    with pytest.raises(TypeError):
+        BinTableView(bt_np, [0, 1]).append_rows(data[:1])
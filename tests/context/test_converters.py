@@ -66,6 +66,19 @@ def test_csv_true_false_words(animal_movement_data):
         converters.read_csv(path, word_true='test_word')
 
 
+def test_read_csv_ragged(tmp_path):
+    header = ',m1,m2,m3\n'
+    for csv_data in [header + 'g1,True,False,True,True,True\n',  # long row
+                     header + 'g1,True,False,True\ng2,True\n']:  # short row
+        path = str(tmp_path / 'ragged.csv')
+        with open(path, 'w') as f:
+            f.write(csv_data)
+        with pytest.raises(ValueError):
+            converters.read_csv(path)
+        with pytest.raises(ValueError):
+            list(converters.iter_csv_rows(path))
+
+
 def test_pandas_converted(animal_movement_data):
     data, obj_names, attr_names = itemgetter('data', 'obj_names', 'attr_names')(animal_movement_data)
 
@@ -78,3 +91,98 @@ def test_pandas_converted(animal_movement_data):
 
     assert ctx == ctx_post,\
         'Converters.{to_pandas, from_pandas} failed. Double converted context does not match the initial one'
+
+
+def test_pandas_converters_vectorized(animal_movement_data):
+    import numpy as np
+    from fcapy.context.bintable import BinTableNumpy, BinTableSparse
+    data, obj_names, attr_names = itemgetter('data', 'obj_names', 'attr_names')(animal_movement_data)
+    ctx = FormalContext(data=data, object_names=obj_names, attribute_names=attr_names)
+    df = pandas.DataFrame(data, columns=attr_names, index=obj_names)
+
+    ctx_np = converters.from_pandas(df)
+    assert isinstance(ctx_np.data, BinTableNumpy), 'Converters.from_pandas failed. The data should be packed'
+    assert ctx_np == ctx, 'Converters.from_pandas failed'
+    assert converters.from_pandas(df.astype(object)) == ctx, 'Converters.from_pandas failed on object dataframe'
+
+    ctx_sp = converters.from_pandas(df.astype(pandas.SparseDtype(bool, False)))
+    assert isinstance(ctx_sp.data, BinTableSparse), 'Converters.from_pandas failed. The data should be sparse'
+    assert ctx_sp == ctx, 'Converters.from_pandas failed on sparse dataframe'
+
+    assert np.array_equal(converters.to_pandas(ctx_sp).values, np.array(data)),\
+        'Converters.to_pandas failed. Converted frame does not match the input data'
+    for df_wrong in [df.astype(int), df.astype(int) * 2, df.astype(int).astype(object),
+                     df.astype(pandas.SparseDtype(int, 0))]:
+        with pytest.raises(ValueError):
+            converters.from_pandas(df_wrong)
+
+
+def test_bin_converter(animal_movement_data, tmp_path):
+    import numpy as np
+    from fcapy.context.bintable import BinTableNumpy
+    data, obj_names, attr_names = itemgetter('data', 'obj_names', 'attr_names')(animal_movement_data)
+
+    ctx = FormalContext(data=data, object_names=obj_names, attribute_names=attr_names, description='Animals')
+    path = str(tmp_path / 'animal_movement.bin')
+    file_data = converters.write_bin(ctx, path)
+    assert file_data is None, 'Converters.write_bin failed. The function should return None if given path'
+    with open(path, 'rb') as f:
+        assert f.read() == converters.write_bin(ctx), 'Converters.write_bin failed. Output file does not match the data'
+
+    for ctx_read in [converters.read_bin(path), converters.read_bin(path, mmap=False),
+                     converters.read_bin(data=converters.write_bin(ctx)), FormalContext.from_bin(path)]:
+        assert isinstance(ctx_read.data, BinTableNumpy), 'Converters.read_bin failed. Data should be packed'
+        assert ctx_read == ctx, 'Converters.read_bin failed. Read context does not match the written one'
+        assert ctx_read.description == 'Animals', 'Converters.read_bin failed. Description is lost'
+        assert ctx_read.extension_i([0, 1]) == [4, 5, 6], 'Converters.read_bin failed. Wrong extension'
+    assert isinstance(converters.read_bin(path).data.data, np.memmap), 'Converters.read_bin failed. Data is not mmaped'
+
+    ctx_np = FormalContext(data=np.array(data), object_names=obj_names, attribute_names=attr_names,
+                           description='Animals')
+    assert ctx_np.to_bin() == converters.write_bin(ctx), 'Converters.write_bin failed. Depends on BinTable type'
+    assert converters.read_bin(data=FormalContext().to_bin()).n_objects == 0, 'Converters.read_bin failed on empty context'
+
+    with pytest.raises(ValueError):
+        converters.read_bin(data=b'FCAPYTXT' + converters.write_bin(ctx)[8:])
+
+
+def test_iter_rows_converters(animal_movement_data):
+    from fcapy import LIB_INSTALLED
+    data, obj_names, path = itemgetter('data', 'obj_names', 'path')(animal_movement_data)
+
+    for fnc, file_extension in [(converters.iter_cxt_rows, '.cxt'), (converters.iter_csv_rows, '.csv')]:
+        fnc_name = fnc.__name__
+        rows = fnc(path + file_extension)
+        assert next(rows) == (obj_names[0], data[0]), f'Converters.{fnc_name} failed. Wrong first row'
+        assert list(rows) == list(zip(obj_names[1:], data[1:])), f'Converters.{fnc_name} failed. Wrong rows'
+
+        rows_packed = list(fnc(path + file_extension, packed=True))
+        assert [int(row[0]) for _, row in rows_packed] == [sum(2**i for i, v in enumerate(row) if v) for row in data],\
+            f'Converters.{fnc_name} failed. Wrong packed rows'
+
+    with open(path + '.cxt', 'r') as f:
+        cxt_data = f.read()
+    assert list(converters.iter_cxt_rows(data=cxt_data)) == list(zip(obj_names, data)),\
+        'Converters.iter_cxt_rows failed. Wrong rows read from data'
+
+    LIB_INSTALLED['numpy'] = False
+    for fnc, file_extension in [(converters.read_cxt, '.cxt'), (converters.read_csv, '.csv')]:
+        ctx = fnc(path + file_extension)
+        assert ctx.data.to_list() == data, f'Converters.{fnc.__name__} failed. Data should be {data}'
+    LIB_INSTALLED['numpy'] = True
+
+
+def test_read_cxt_malformed():
+    header = 'B\n\n2\n3\n\ng1\ng2\nm1\nm2\nm3\n'
+    for cxt_data in [header + 'X.X\n.X\n',  # short row
+                     header + 'X.X\n.XX.\n',  # long row
+                     header + 'X.X\n',  # missing row
+                     header + 'X.X\n.XX\nXXX\n']:  # extra row
+        with pytest.raises(ValueError):
+            converters.read_cxt(data=cxt_data)
+        with pytest.raises(ValueError):
+            list(converters.iter_cxt_rows(data=cxt_data))
+
+    ctx = converters.read_cxt(data=header + 'X.X\n.XX\n\n')
+    assert ctx.data.to_list() == [[True, False, True], [False, True, True]],\
+        'Converters.read_cxt failed. Trailing empty lines should be skipped'
@@ -17,6 +17,18 @@ def test_data_property(animal_movement_data):
     with pytest.raises(AssertionError):
         FormalContext(data=[[0], [1, 2]])
 
+    import numpy as np
+    from fcapy.context.bintable import BinTableNumpy
+    ctx = FormalContext(data=np.array(data))
+    assert isinstance(ctx.data, BinTableNumpy), 'FormalContext.data failed. Numpy array should be stored packed'
+    assert ctx.data == BinTable(data), 'FormalContext.data has changed the initial data'
+
+    import scipy.sparse
+    from fcapy.context.bintable import BinTableSparse
+    ctx = FormalContext(data=scipy.sparse.csr_matrix(np.array(data)))
+    assert isinstance(ctx.data, BinTableSparse), 'FormalContext.data failed. Sparse matrix should be stored sparse'
+    assert ctx.data == BinTable(data), 'FormalContext.data has changed the initial data'
+
 
 def test_object_attribute_names(animal_movement_data):
     data, obj_names, attr_names = itemgetter('data', 'obj_names', 'attr_names')(animal_movement_data)
@@ -52,6 +64,23 @@ def test_intent_extent_i(animal_movement_data):
         'Basic FCA theorem failed. Check FormalContext.extension_i, intention_i'
 
 
+def test_intent_extent_i_batch(animal_movement_data):
+    import numpy as np
+    data = animal_movement_data['data']
+    attr_sets, obj_sets = [[0, 1], [], [2], [0, 1, 2, 3]], [[4, 5, 6], [], [0], list(range(len(data)))]
+    for ctx in [FormalContext(data=data), FormalContext(data=np.array(data))]:
+        exts_ = ctx.extension_i_batch(attr_sets)
+        assert exts_ == [list(ctx.extension_i(attrs)) for attrs in attr_sets], 'FormalContext.extension_i_batch failed'
+        ints_ = ctx.intention_i_batch(obj_sets)
+        assert ints_ == [sorted(ctx.intention_i(objs)) for objs in obj_sets], 'FormalContext.intention_i_batch failed'
+
+        exts_packed = ctx.extension_i_batch(attr_sets, packed=True)
+        assert exts_packed.shape == (len(attr_sets), 1) and exts_packed[0, 0] == 2**4 + 2**5 + 2**6,\
+            'FormalContext.extension_i_batch failed. Wrong packed extents'
+        assert ctx.extension_i_batch([]) == [] and ctx.intention_i_batch([], packed=True).shape == (0, 1),\
+            'FormalContext.extension_i_batch failed on empty batch'
+
+
 def test_intent_extent(animal_movement_data):
     data, obj_names, attr_names = itemgetter('data', 'obj_names', 'attr_names')(animal_movement_data)
 
@@ -144,6 +173,19 @@ def test_to_from_pandas(animal_movement_data):
         'FormalContext.from_pandas failed. Double converted FormalContext does not match initial one'
 
 
+def test_to_numpy(animal_movement_data):
+    import numpy as np
+    data, attr_names = animal_movement_data['data'], animal_movement_data['attr_names']
+    for data_type in [list, np.array]:
+        ctx = FormalContext(data_type(data), attribute_names=attr_names)
+        assert np.array_equal(ctx.to_numpy(), np.array(data)), 'FormalContext.to_numpy failed'
+        assert ctx.to_numpy(packed=True).shape == (len(data), 1), 'FormalContext.to_numpy failed on packed data'
+
+        data_numeric, attr_names_numeric = ctx.to_numeric()
+        assert data_numeric == data and attr_names_numeric == tuple(attr_names),\
+            'FormalContext.to_numeric failed'
+
+
 def test_print_data(animal_movement_data):
     data, obj_names, attr_names, printed_data_short = \
         itemgetter('data', 'obj_names', 'attr_names', 'printed_data_short')(animal_movement_data)
@@ -199,6 +241,109 @@ def test_eq_neq(animal_movement_data):
         'FormalContext.__ne__ failed. The same FormalContext objects are classified as different'
 
 
+def test_hash_fixed(animal_movement_data):
+    import zlib
+    data, obj_names, attr_names = animal_movement_data['data'], animal_movement_data['obj_names'],\
+        animal_movement_data['attr_names']
+    ctx = FormalContext(data, obj_names, attr_names)
+    hash_true = zlib.adler32((str(tuple(obj_names)) + str(tuple(attr_names)) + str(data)).encode())
+    assert ctx.hash_fixed() == hash_true, 'FormalContext.hash_fixed failed'
+
+    ctx.object_names = obj_names[::-1]
+    hash_true = zlib.adler32((str(tuple(obj_names[::-1])) + str(tuple(attr_names)) + str(data)).encode())
+    assert ctx.hash_fixed() == hash_true, 'FormalContext.hash_fixed failed. The cache is not updated with the names'
+
+
+def test_append_objects_attributes(animal_movement_data):
+    import numpy as np
+    data, obj_names, attr_names = animal_movement_data['data'], animal_movement_data['obj_names'],\
+        animal_movement_data['attr_names']
+    ctx_full = FormalContext(data, obj_names, attr_names)
+
+    for data_type in [list, np.array]:
+        ctx = FormalContext(data_type([row[:2] for row in data[:10]]), obj_names[:10], attr_names[:2])
+        ctx.hash_fixed()
+        ctx.append_objects(data_type([row[:2] for row in data[10:]]), obj_names[10:])
+        assert ctx.n_objects == len(obj_names) and ctx.object_names == tuple(obj_names),\
+            'FormalContext.append_objects failed'
+        ctx.append_attributes(data_type([row[2:] for row in data]), attr_names[2:])
+        assert ctx.n_attributes == len(attr_names) and ctx.attribute_names == tuple(attr_names),\
+            'FormalContext.append_attributes failed'
+
+        assert ctx == ctx_full, 'FormalContext.append_objects/append_attributes failed'
+        assert ctx.hash_fixed() == ctx_full.hash_fixed(),\
+            'FormalContext.append_objects/append_attributes failed. The digest is not updated'
+        assert ctx.extension(['fly']) == ctx_full.extension(['fly']) and ctx.intention(['eagle']) == ['fly', 'hunt'],\
+            'FormalContext.append_objects/append_attributes failed'
+
+    ctx = FormalContext(data[:2], target=[0, 1])
+    ctx.append_objects(data[2:4], target=[1, 0])
+    assert ctx.object_names == ('0', '1', '2', '3') and ctx.target == [0, 1, 1, 0],\
+        'FormalContext.append_objects failed'
+    with pytest.raises(ValueError):
+        ctx.append_objects(data[4:5])
+    for kwargs in [dict(object_names=['a', 'b'], target=[0]), dict(target=[0, 1])]:
+        with pytest.raises(AssertionError):
+            ctx.append_objects(data[4:5], **kwargs)
+        assert ctx.n_objects == 4 and ctx.hash_fixed() == FormalContext(data[:4], target=[0, 1, 1, 0]).hash_fixed(),\
+            'FormalContext.append_objects failed. The context should not change when the parameters are wrong'
+
+    ctx = FormalContext(data[:2])
+    for columns, kwargs in [([[True, False], [False, True]], dict(attribute_names=['a'])),
+                            ([[True, False], [False]], {}), ([[True]], {})]:
+        with pytest.raises(AssertionError):
+            ctx.append_attributes(columns, **kwargs)
+        assert ctx.n_attributes == 4 and ctx.attribute_names == ('0', '1', '2', '3'),\
+            'FormalContext.append_attributes failed. The context should not change when the parameters are wrong'
+    ctx.view()
+
+    ctx = FormalContext()
+    ctx.append_objects(data[:1])
+    assert ctx.object_names == ('0',) and ctx.attribute_names == ('0', '1', '2', '3'),\
+        'FormalContext.append_objects failed on the empty context'
+
+
+def test_reduce():
+    data = [
+        [True, True, False, True, True],
+        [True, False, True, True, True],
+        [True, True, False, True, True],
+        [False, False, True, False, False],
+        [True, True, True, True, True],
+    ]
+    ctx = FormalContext(data, attribute_names=['a', 'b', 'c', 'a_copy', 'a_and_b'])
+    ctx_reduced, object_indexes, attribute_indexes = ctx.reduce(return_indexes=True)
+    assert attribute_indexes == [0, 1, 2], 'FormalContext.reduce failed. Wrong reduction of attributes'
+    assert object_indexes == [0, 1, 3], 'FormalContext.reduce failed. Wrong reduction of objects'
+    assert ctx_reduced == ctx[[0, 1, 3], [0, 1, 2]], 'FormalContext.reduce failed'
+
+    assert ctx.reduce(reduce_objects=False).n_objects == 5, 'FormalContext.reduce failed'
+    assert ctx.reduce(reduce_attributes=False).n_attributes == 5, 'FormalContext.reduce failed'
+
+    ctx_reduced, object_indexes, attribute_indexes = FormalContext([[True, True]] * 2).reduce(return_indexes=True)
+    assert object_indexes == [] and attribute_indexes == [], \
+        'FormalContext.reduce failed. The context with all True cells should be reduced to the empty one'
+
+
+def test_view(animal_movement_data):
+    from fcapy.context.bintable import BinTableView
+    data, obj_names, attr_names = animal_movement_data['data'], animal_movement_data['obj_names'],\
+        animal_movement_data['attr_names']
+    ctx = FormalContext(data, obj_names, attr_names, target=list(range(len(data))))
+
+    ctx_view = ctx.view(attribute_indexes=[3, 1])
+    assert isinstance(ctx_view.data, BinTableView), 'FormalContext.view failed. The data should not be copied'
+    assert ctx_view == ctx[:, [3, 1]], 'FormalContext.view failed'
+    assert list(ctx_view.extension_i([1])) == [4, 5, 6, 7, 9, 10, 11, 12], 'FormalContext.view failed'
+    assert ctx_view.hash_fixed() == ctx[:, [3, 1]].hash_fixed(), 'FormalContext.view failed'
+    assert ctx_view == ctx.view(attribute_indexes=[3, 1]) and ctx_view.data == ctx.view(attribute_indexes=[3, 1]).data,\
+        'FormalContext.view failed. The views of the same data should be equal'
+
+    ctx_view = ctx.view(object_indexes=[5, 0, 1])
+    assert ctx_view == ctx[[5, 0, 1]] and ctx_view.target == [5, 0, 1], 'FormalContext.view failed'
+    assert list(ctx_view.intention_i([0])) == [0, 1], 'FormalContext.view failed'
+
+
 def test_getitem():
     data = [[False, True, True], [False, False, True], [False, False, True]]
     ctx = FormalContext(data)
@@ -4,6 +4,7 @@ from fcapy.context import converters, FormalContext
 from fcapy.lattice.concept_lattice import ConceptLattice
 from fcapy.lattice.formal_concept import FormalConcept
 from fcapy.mvcontext import pattern_structure as ps, mvcontext
+from fcapy.algorithms import lattice_construction as lca
 
 
 def test_concept_lattice_init():
@@ -63,6 +64,16 @@ def test_from_context():
 
     assert ltc_cbo == ltc_sofia,\
         "ConceptLattice.from_context failed. Concept lattices differ when created by different algorithms"
+    for algo in ['FCbO', 'InClose', 'NextClosure']:
+        ltc_algo = ConceptLattice.from_context(ctx, algo=algo)
+        assert ltc_algo == ltc_cbo and ltc_algo.concepts == ltc_cbo.concepts,\
+            f"ConceptLattice.from_context failed. Concept lattices differ when created by CbO and {algo}"
+
+    ltc_iceberg = ConceptLattice.from_context(ctx, algo='Iceberg', min_support=3)
+    assert set(ltc_iceberg.concepts) == {c for c in ltc_cbo.concepts if c.support >= 3} | {ltc_cbo.bottom_concept},\
+        "ConceptLattice.from_context failed. Iceberg lattice should contain only the frequent concepts and the bottom"
+    assert ltc_iceberg.subconcepts_dict == lca.complete_comparison(ltc_iceberg.concepts, is_concepts_sorted=True),\
+        "ConceptLattice.from_context failed. Wrong cover relation of the Iceberg lattice"
 
     data = [[1, 10],
             [2, 22],
@@ -81,6 +92,32 @@ def test_from_context():
         ConceptLattice.from_context(mvctx, algo='OtHeR MeThOd')
 
 
+def test_from_reduced_context():
+    ctx = converters.read_cxt('data/digits.cxt')
+    ctx = FormalContext([row + [row[0]] for row in ctx.data.to_list() * 2],
+                        attribute_names=list(ctx.attribute_names) + ['dup'])
+    ltc = ConceptLattice.from_context(ctx)
+    ltc_reduced = ConceptLattice.from_context(ctx, reduce_context=True)
+    assert ltc_reduced == ltc and ltc_reduced.concepts == ltc.concepts,\
+        'ConceptLattice.from_context failed. The lattice constructed on the reduced context differs'
+    assert ltc_reduced.subconcepts_dict == ltc.subconcepts_dict,\
+        'ConceptLattice.from_context failed. The order of lattice constructed on the reduced context differs'
+
+    for algo in ['FCbO', 'InClose', 'NextClosure']:
+        assert ConceptLattice.from_context(ctx, algo=algo, reduce_context=True) == ltc,\
+            f'ConceptLattice.from_context failed. The lattice constructed by {algo} on the reduced context differs'
+
+    with pytest.raises(AssertionError):
+        ConceptLattice.from_context(ctx, algo='Sofia', reduce_context=True)
+
+    # the reduced context is empty
+    for data in [[[True]], [[True, True], [True, True]]]:
+        ctx = FormalContext(data)
+        ltc_reduced = ConceptLattice.from_context(ctx, reduce_context=True)
+        assert len(ltc_reduced.concepts) == 1 and ltc_reduced == ConceptLattice.from_context(ctx),\
+            'ConceptLattice.from_context failed on the context reduced to the empty one'
+
+
 def test_get_top_bottom_concepts_i():
     c1 = FormalConcept((0,), ('a',), (0,), ('a',))
     c2 = FormalConcept((), (), (0, 1), ('a', 'b'))
@@ -216,6 +253,31 @@ def test_add_concept():
     assert ltc == ltc_true, 'ConceptLattice.add_concept failed'
 
 
+def test_add_object():
+    for ctx in [converters.read_csv('data/mango_bin.csv'), converters.read_cxt('data/digits.cxt')]:
+        data = ctx.data.to_list()
+        ltc = ConceptLattice.from_context(FormalContext(data[:1], ctx.object_names[:1], ctx.attribute_names))
+        for g_i in range(1, len(data)):
+            ctx_g = FormalContext(data[:g_i+1], ctx.object_names[:g_i+1], ctx.attribute_names)
+            object_concept_i = ltc.add_object([m_i for m_i, v in enumerate(data[g_i]) if v],
+                                              ctx.object_names[g_i], ctx_g.hash_fixed())
+            assert set(ltc.concepts[object_concept_i].intent_i) == set(ctx_g.intention_i([g_i])),\
+                'ConceptLattice.add_object failed. Wrong object concept'
+
+        ltc_true = ConceptLattice.from_context(ctx)
+        assert ltc == ltc_true, 'ConceptLattice.add_object failed. Wrong concepts or order'
+        map_i = [ltc_true.index(c) for c in ltc.concepts]
+        assert all([{map_i[c_i_sub] for c_i_sub in subconcepts_i} == set(ltc_true.subconcepts_dict[map_i[c_i]])
+                    for c_i, subconcepts_i in ltc.subconcepts_dict.items()]),\
+            'ConceptLattice.add_object failed. Wrong cover relation'
+        assert map_i[ltc.top_concept_i] == ltc_true.top_concept_i, 'ConceptLattice.add_object failed. Wrong top'
+
+    mvctx = mvcontext.MVContext(np.array([[1, 2], [3, 4], [5, 6]]), pattern_types={'0': ps.IntervalPS, '1': ps.IntervalPS})
+    ltc = ConceptLattice.from_context(mvctx)
+    with pytest.raises(AssertionError):
+        ltc.add_object([0])
+
+
 def test_trace_context():
     ctx = converters.read_csv('data/mango_bin.csv')
     ctx_train = converters.from_pandas(ctx.to_pandas().drop('mango'))
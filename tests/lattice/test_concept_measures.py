@@ -1,7 +1,9 @@
 import pytest
+import warnings
+import numpy as np
 
 from fcapy.lattice import concept_measures as cm
-from fcapy.context import read_json
+from fcapy.context import read_json, FormalContext
 from fcapy.lattice.concept_lattice import ConceptLattice
 
 
@@ -18,6 +20,19 @@ def test_stability():
         "concept_measure.stability failed. Stability of concepts does not match the ones computed by latviz.loria.ft"
 
 
+def test_stability_exact_lattice():
+    ltc = ConceptLattice.from_json('data/animal_movement_lattice.json')
+    stabs_true = [c.measures.get('Stab') for c in ltc.concepts]
+    ltc.calc_concepts_measures('stability_exact_lattice')
+    stabs_lattice = [c.measures['Stab'] for c in ltc.concepts]
+    assert stabs_lattice == stabs_true, "concept_measure.stability_exact_lattice failed"
+
+    ctx = FormalContext(np.random.default_rng(42).random((12, 6)) < 0.6)
+    ltc = ConceptLattice.from_context(ctx)
+    stabs_true = [cm.stability(c_i, ltc, ctx) for c_i in range(len(ltc.concepts))]
+    assert cm.stability_exact_lattice(ltc) == stabs_true, "concept_measure.stability_exact_lattice failed"
+
+
 def test_stability_bounds():
     ltc = ConceptLattice.from_json('data/animal_movement_lattice.json')
 
@@ -33,3 +48,66 @@ def test_stability_bounds():
     assert mae < 0.05, "concept_measure.stability_bounds failed. " \
                        "Lower stability bounds of concepts does not match the ones computed by latviz.loria.ft"
 
+
+
+def test_measures_batch():
+    ctx = read_json('data/animal_movement.json')
+    ctx = FormalContext(ctx.data, ctx.object_names, ctx.attribute_names, target=np.arange(ctx.n_objects) % 3)
+    ltc = ConceptLattice.from_context(ctx)
+
+    extents_packed = cm.pack_extents(ltc)
+    assert extents_packed.shape == (len(ltc.concepts), 1)
+
+    lbs, ubs = cm.stability_bounds_batch(extents_packed, ltc.subconcepts_dict)
+    bounds_true = [cm.stability_bounds(c_i, ltc) for c_i in range(len(ltc.concepts))]
+    assert lbs.tolist() == [lb for lb, ub in bounds_true], "concept_measures.stability_bounds_batch failed"
+    assert ubs.tolist() == [ub for lb, ub in bounds_true], "concept_measures.stability_bounds_batch failed"
+
+    entropies = cm.target_entropy_batch(extents_packed, ctx.target)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # the variance of empty extent is nan
+        entropies_true = [cm.target_entropy(c_i, ltc, ctx) for c_i in range(len(ltc.concepts))]
+    assert np.allclose(entropies, entropies_true, equal_nan=True), "concept_measures.target_entropy_batch failed"
+
+    ltc.calc_concepts_measures('target_entropy', ctx)
+    gains = cm.mean_information_gain_batch(entropies, ltc.all_superconcepts_dict)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # the top concept has no superconcepts
+        gains_true = [cm.mean_information_gain(c_i, ltc) for c_i in range(len(ltc.concepts))]
+    assert np.allclose(gains, gains_true, equal_nan=True), "concept_measures.mean_information_gain_batch failed"
+
+    ltc.calc_concepts_measures('mean_information_gain')
+    assert np.allclose([c.measures['mean_information_gain'] for c in ltc.concepts], gains_true, equal_nan=True)
+
+
+def test_stability_monte_carlo():
+    ctx = read_json('data/animal_movement.json')
+    ltc = ConceptLattice.from_json('data/animal_movement_lattice.json')
+
+    stabs_true = [c.measures.get('Stab') for c in ltc.concepts]
+    ltc.calc_concepts_measures('stability_monte_carlo', ctx, random_state=42)
+    stabs_est = [c.measures['StabMC'] for c in ltc.concepts]
+    assert all([abs(stab_est - stab_true) <= 0.01 for stab_est, stab_true in zip(stabs_est, stabs_true)]),\
+        "concept_measure.stability_monte_carlo failed"
+    # all the subsets of small extents are checked. So their stability is exact
+    assert all([stab_est == stab_true for c, stab_est, stab_true in zip(ltc.concepts, stabs_est, stabs_true)
+                if len(c.extent_i) <= 14]), "concept_measure.stability_monte_carlo failed"
+
+    rnd = np.random.default_rng(42)
+    ctx = FormalContext(rnd.random((40, 6)) < 0.7)
+    ltc = ConceptLattice.from_context(ctx)
+    epsilon = 0.05
+    for c_i, c in enumerate(ltc.concepts):
+        if not (10 <= len(c.extent_i) <= 12):
+            continue
+        stab_true = cm.stability(c_i, ltc, ctx)
+        stab_est = cm.stability_monte_carlo(c_i, ltc, ctx, epsilon=epsilon, random_state=c_i)
+        assert abs(stab_est - stab_true) <= epsilon, "concept_measure.stability_monte_carlo failed"
+        assert stab_est == cm.stability_monte_carlo(c_i, ltc, ctx, epsilon=epsilon, random_state=c_i),\
+            "concept_measure.stability_monte_carlo failed. The estimate is not reproducible with the same seed"
+        assert stab_est == cm.stability_monte_carlo(c_i, ltc, ctx, epsilon=epsilon, random_state=c_i,
+                                                    context_columns=cm.unpack_context_columns(ctx)),\
+            "concept_measure.stability_monte_carlo failed with precomputed columns of the context"
+
+    with pytest.raises(ValueError):
+        cm.stability_monte_carlo(0, ltc, ctx, epsilon=0)
@@ -82,6 +82,14 @@ def test_extension_intention():
         assert mvctx.intention(['b', 'c']) == intent_true, 'MVContext.intention failed'
         assert mvctx.extension({'M1': (2, 3), 'M2': (22, 100)}) == extent_true, 'MVContext.extension failed'
 
+        descriptions_i = [{0: (2, 3), 1: (22, 100)}, {}, {1: None}, {1: (50, 100)}]
+        assert mvctx.extension_i_batch(descriptions_i) == [[1, 2], [0, 1, 2, 3], [], [2, 3]],\
+            'MVContext.extension_i_batch failed'
+        assert mvctx.intention_i_batch([[1, 2], []]) == [intent_i_true, {0: None, 1: None}],\
+            'MVContext.intention_i_batch failed'
+    assert mvctx.extension_i_batch(descriptions_i, packed=True).tolist() == [[6], [15], [0], [12]],\
+        'MVContext.extension_i_batch failed. Wrong packed extents'
+
 
 def test_to_json():
     mvctx = mvcontext.MVContext()
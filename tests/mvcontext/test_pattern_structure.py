@@ -72,6 +72,15 @@ def test_interval_ps_extension_intention():
     assert ips.intention_i([2, 4]) == (2, 2), "IntervalPS.intention_i failed"
     assert (ips.extension_i(ips.intention_i([1, 2, 4])) == [1, 2, 4]).all(), "IntervalPS.extension_i/intention_i failed"
 
+    descriptions = [None, (2, 3), 2, (-math.inf, 1)]
+    assert ips.extension_i_batch(descriptions).tolist() == [
+        [False, False, False, False, False], [False, False, True, True, True],
+        [False, False, True, False, True], [True, True, False, False, False]], "IntervalPS.extension_i_batch failed"
+    assert ips.intention_i_batch([[], [0, 1, 3], [2, 4]]) == [None, (0, 3), (2, 2)], "IntervalPS.intention_i_batch failed"
+
+    ips = pattern_structure.IntervalPS([(0, 1), (2, 5), 3])
+    assert ips.intention_i_batch([[0, 1], [1, 2]]) == [(0, 5), (2, 5)], "IntervalPS.intention_i_batch failed"
+
 
 def test_interval_ps_descriptions_tofrom_generators():
     ips = pattern_structure.IntervalPS([])
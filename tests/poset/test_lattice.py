@@ -259,3 +259,11 @@ def test_delitem_lattice():
         del l[0]
     with pytest.raises(KeyError):
         del l[3]
+    with pytest.raises(KeyError):
+        del l[[1, 3]]
+
+    l = Lattice(['', 'a', 'b', 'c', 'ab', 'abc'], leq_func)
+    del l[[1, 4]]
+    assert l == Lattice(['', 'b', 'c', 'abc'], leq_func)
+    assert l.top_element == 3
+    assert l.bottom_element == 0
@@ -340,6 +340,23 @@ def test_delitem():
     assert s._cache_direct_subelements == s_del_true._cache_direct_subelements
     assert s._cache_direct_superelements == s_del_true._cache_direct_superelements
 
+    # Test if a batch of elements can be deleted at once
+    elements = ['', 'a', 'b', 'c', 'ab', 'bc', 'abc']
+    del_idxs = [4, 1, 5]
+    elements_del = [el for i, el in enumerate(elements) if i not in del_idxs]
+    s = POSet(elements, leq_func, use_cache=True)
+    s_del_true = POSet(elements_del, leq_func, use_cache=True)
+    s.fill_up_caches()
+    s_del_true.fill_up_caches()
+
+    del s[del_idxs]
+    assert s == s_del_true
+    assert s._cache_leq == s_del_true._cache_leq
+    assert s._cache_subelements == s_del_true._cache_subelements
+    assert s._cache_superelements == s_del_true._cache_superelements
+    assert s._cache_direct_subelements == s_del_true._cache_direct_subelements
+    assert s._cache_direct_superelements == s_del_true._cache_direct_superelements
+
 
 def test_add():
     elements = ['', 'b', 'ab']
@@ -32,6 +32,24 @@ def test_sparse_unique_columns():
     assert (counts == counts_true).mean() == 1, 'utils.sparse_unique_columns failed'
 
 
+def test_adler32_combine():
+    import zlib
+    a, b = b'[[True, False], ', b'[False, False]]' * 100
+    assert utils.adler32_combine(zlib.adler32(a), zlib.adler32(b), len(b)) == zlib.adler32(a + b),\
+        'utils.adler32_combine failed'
+    assert utils.combine_digests((zlib.adler32(a), len(a)), (zlib.adler32(b), len(b)), (1, 0)) == \
+        (zlib.adler32(a + b), len(a + b)), 'utils.combine_digests failed'
+
+
+def test_masks():
+    assert utils.indexes_to_mask([0, 3, 64]) == 1 + 8 + 2**64, 'utils.indexes_to_mask failed'
+    assert utils.mask_to_indexes(1 + 8 + 2**64) == [0, 3, 64], 'utils.mask_to_indexes failed'
+    assert utils.mask_to_indexes(0) == [] and utils.indexes_to_mask([]) == 0, 'utils.mask_to_indexes failed'
+    indexes = list(range(3, 10000, 7))
+    assert utils.mask_to_indexes(utils.indexes_to_mask(reversed(indexes + indexes[:10]))) == indexes,\
+        'utils.indexes_to_mask failed'
+
+
 def test_safe_tqdm():
     flg_true = LIB_INSTALLED['tqdm']
     for flg in [False, True]: